@@ -7,6 +7,8 @@ This module provides consistent normalization across all processors.
 """
 
 import re
+import functools
+import numpy as np
 import pandas as pd
 import logging
 
@@ -50,6 +52,56 @@ ASSN_PATTERN = re.compile(r'\b(ASSN)\b')
 VIRGINIA_PATTERN = re.compile(r'\bVIRGINIA\b')
 HIGHWAY_PATTERN = re.compile(r'\bHIGHWAY\b')
 
+# Substitutions applied to every name, in order
+GENERAL_SUBSTITUTIONS = [
+    (PAC_PATTERN, 'PAC'),
+    (ASSOCIATION_PATTERN, 'ASSOC'),
+    (ASSN_PATTERN, 'ASSOC'),
+    (VIRGINIA_PATTERN, 'VA'),
+    (HIGHWAY_PATTERN, 'HWY'),
+
+    # Address abbreviations
+    (re.compile(r'\bSTREET\b'), 'ST'),
+    (re.compile(r'\bROAD\b'), 'RD'),
+    (re.compile(r'\bBOULEVARD\b'), 'BLVD'),
+    (re.compile(r'\bAVENUE\b'), 'AVE'),
+    (re.compile(r'\bDRIVE\b'), 'DR'),
+    (re.compile(r'\bLANE\b'), 'LN'),
+    (re.compile(r'\bCOURT\b'), 'CT'),
+    (re.compile(r'\bPLACE\b'), 'PL'),
+
+    # Other common abbreviations
+    (re.compile(r'\bACCOUNT\b'), 'ACCT'),
+
+    # Ordinal number normalization (10TH -> 10, 21ST -> 21, etc.)
+    (re.compile(r'\b(\d+)(?:ST|ND|RD|TH)\b'), r'\1'),
+
+    # Political party committee normalizations
+    (re.compile(r'\bREPUBLICAN PARTY COMMITTEE\b'), 'REPUBLICAN'),
+    (re.compile(r'\bDEMOCRATIC PARTY COMMITTEE\b'), 'DEMOCRATIC'),
+    (re.compile(r'\bGOP COMMITTEE\b'), 'GOP'),
+    (re.compile(r'\bPOLITICAL ACTION FUND\b'), ''),
+]
+
+# Substitutions applied to non-individuals only, in order
+NON_INDIVIDUAL_SUBSTITUTIONS = [
+    (re.compile(r'\s*&\s*'), ' AND '),
+    (re.compile(r'\.com\b', re.IGNORECASE), ''),  # Makes it obvious it's a website
+    (re.compile(r'[^\w\s]'), ''),
+]
+
+# Ending business designators removed from non-individuals, in order
+BUSINESS_SUFFIX_PATTERNS = [
+    re.compile(r'\bPAC$'),
+    re.compile(r'\bINC$'),
+    re.compile(r'\bCO$'),
+    re.compile(r'\bCORP$'),
+    re.compile(r'\bCORPORATION$'),
+    re.compile(r'\bINCORPORATED$'),
+    re.compile(r'\bCOMPANY$'),
+    re.compile(r'\bLLC$'),
+]
+
 # Pre-define exact Dominion matches as a set for O(1) lookup
 EXACT_DOMINION_MATCHES = {
     'DOMINION',
@@ -97,6 +149,50 @@ EXACT_CLEAN_VA_MATCHES = {
     'CLEAN VA FUND (PAC)',
 }
 
+# Normalized offices that are state level
+STATE_OFFICES = frozenset({
+    'delegate', 'senator', 'governor', 'lieutenant governor',
+    'attorney general', 'treasurer', 'secretary of the commonwealth'
+})
+
+# Office sought cleanup: drop everything after a dash and known place names
+OFFICE_DASH_SUFFIX_PATTERN = re.compile(r'\s*-\s*.*$')
+OFFICE_PLACE_NAMES_PATTERN = re.compile(r'\b(prince william county|blue ridge district|arlington county|at large)\b')
+
+# Office sought rules in precedence order: (group name, condition on the cleaned office, normalized office).
+# Conditions are lookaheads anchored at the start, so the first rule that holds is the one that matches.
+OFFICE_SOUGHT_RULES = [
+    ('hod_abbrev', r'(?:hod|h\.o\.d\.)\Z', 'delegate'),
+    ('ag_abbrev', r'(?:ag|a\.g\.)\Z', 'attorney general'),
+    ('gov_abbrev', r'(?:gov|governor)\Z', 'governor'),
+    ('lt_gov_abbrev', r'(?=.*(?:lt gov|lt\. gov|lieutenant gov|lieut gov|lieu gov))', 'lieutenant governor'),
+    ('delegate', r'(?=.*(?:delegate|hod))', 'delegate'),
+    ('senator', r'(?=.*(?:senator|senate))', 'senator'),
+    ('governor', r'(?=.*governor)(?!.*lieutenant)(?!.*lt)', 'governor'),
+    ('lt_governor', r'(?=.*(?:lieutenant|lt))(?=.*governor)', 'lieutenant governor'),
+    ('attorney_general', r'(?=.*attorney)(?=.*general)', 'attorney general'),
+    ('treasurer', r'(?=.*treasurer)', 'treasurer'),
+    ('secretary', r'(?=.*secretary)(?=.*commonwealth)', 'secretary of the commonwealth'),
+    ('supervisors_chair', r'(?:(?=.*member)(?=.*county board)|(?=.*(?:supervisor|county board))(?=.*chair))', 'chair board of supervisors'),
+    ('supervisors', r'(?:(?=.*member)(?=.*board)|(?=.*(?:supervisor|county board)))', 'member board of supervisors'),
+    ('school_board_chair', r'(?=.*school)(?=.*board)(?=.*chair)', 'chair school board'),
+    ('school_board', r'(?=.*school)(?=.*board)', 'school board'),
+    ('city_council', r'(?=.*(?:city|town) council)', 'city council'),
+    ('mayor', r'(?=.*mayor)', 'mayor'),
+    ('sheriff', r'(?=.*sheriff)', 'sheriff'),
+    ('clerk_of_court', r'(?=.*clerk)(?=.*court)', 'clerk of court'),
+    ('commonwealth_attorney', r'(?=.*commonwealth)(?=.*attorney)', 'commonwealth attorney'),
+]
+OFFICE_SOUGHT_PATTERN = re.compile(
+    r'\A(?:' + '|'.join(f'(?P<{name}>{condition})' for name, condition, _ in OFFICE_SOUGHT_RULES) + ')', re.DOTALL
+)
+OFFICE_SOUGHT_LABELS = {name: label for name, _, label in OFFICE_SOUGHT_RULES}
+
+# District cleanup: at-large variations (matched on lowercased text), first number, any letter or digit
+AT_LARGE_PATTERN = re.compile(r'at[ -]?large| al[ ,.]')
+DISTRICT_NUMBER_PATTERN = re.compile(r'(\d+)')
+ALPHANUMERIC_PATTERN = re.compile(r'[a-zA-Z0-9]')
+
 
 def normalize_name(name: str, is_individual: bool = None) -> str:
     """Enhanced name normalization with title/honorific removal and middle name standardization."""
@@ -122,54 +218,18 @@ def normalize_name(name: str, is_individual: bool = None) -> str:
         normalized = extract_first_last_name(normalized)
     
     # For all entities (individuals and companies): Apply general normalizations using pre-compiled patterns
-    normalized = PAC_PATTERN.sub('PAC', normalized)
-    normalized = ASSOCIATION_PATTERN.sub('ASSOC', normalized)
-    normalized = ASSN_PATTERN.sub('ASSOC', normalized)
-    normalized = VIRGINIA_PATTERN.sub('VA', normalized)
-    normalized = HIGHWAY_PATTERN.sub('HWY', normalized)
-
-    # Address abbreviations
-    normalized = re.sub(r'\bSTREET\b', 'ST', normalized)
-    normalized = re.sub(r'\bROAD\b', 'RD', normalized)
-    normalized = re.sub(r'\bBOULEVARD\b', 'BLVD', normalized)
-    normalized = re.sub(r'\bAVENUE\b', 'AVE', normalized)
-    normalized = re.sub(r'\bDRIVE\b', 'DR', normalized)
-    normalized = re.sub(r'\bLANE\b', 'LN', normalized)
-    normalized = re.sub(r'\bCOURT\b', 'CT', normalized)
-    normalized = re.sub(r'\bPLACE\b', 'PL', normalized)
-
-    # Other common abbreviations
-    normalized = re.sub(r'\bACCOUNT\b', 'ACCT', normalized)
-
-    # Ordinal number normalization (10TH -> 10, 21ST -> 21, etc.)
-    normalized = re.sub(r'\b(\d+)(?:ST|ND|RD|TH)\b', r'\1', normalized)
-
-    # Political party committee normalizations
-    normalized = re.sub(r'\bREPUBLICAN PARTY COMMITTEE\b', 'REPUBLICAN', normalized)
-    normalized = re.sub(r'\bDEMOCRATIC PARTY COMMITTEE\b', 'DEMOCRATIC', normalized)
-    normalized = re.sub(r'\bGOP COMMITTEE\b', 'GOP', normalized)
-    normalized = re.sub(r'\bPOLITICAL ACTION FUND\b', '', normalized)
+    for pattern, replacement in GENERAL_SUBSTITUTIONS:
+        normalized = pattern.sub(replacement, normalized)
     
     # For non-individuals: strip all punctuation and remove ending words PAC/INC/CO/CORP/LLC
     if is_individual is False:
-        # Convert & to AND before removing punctuation
-        normalized = re.sub(r'\s*&\s*', ' AND ', normalized)
-
-        # Remove .com before stripping punctuation (makes it obvious it's a website)
-        normalized = re.sub(r'\.com\b', '', normalized, flags=re.IGNORECASE)
-
-        # Strip all punctuation
-        normalized = re.sub(r'[^\w\s]', '', normalized)
+        # Convert & to AND, drop .com, strip punctuation
+        for pattern, replacement in NON_INDIVIDUAL_SUBSTITUTIONS:
+            normalized = pattern.sub(replacement, normalized)
 
         # Remove ending business designators
-        normalized = re.sub(r'\bPAC$', '', normalized).strip()
-        normalized = re.sub(r'\bINC$', '', normalized).strip()
-        normalized = re.sub(r'\bCO$', '', normalized).strip()
-        normalized = re.sub(r'\bCORP$', '', normalized).strip()
-        normalized = re.sub(r'\bCORPORATION$', '', normalized).strip()
-        normalized = re.sub(r'\bINCORPORATED$', '', normalized).strip()
-        normalized = re.sub(r'\bCOMPANY$', '', normalized).strip()
-        normalized = re.sub(r'\bLLC$', '', normalized).strip()
+        for pattern in BUSINESS_SUFFIX_PATTERNS:
+            normalized = pattern.sub('', normalized).strip()
     
     # Check for exact Dominion matches using pre-defined set (O(1) lookup)
     if normalized.strip() in EXACT_DOMINION_MATCHES:
@@ -192,6 +252,77 @@ def normalize_name(name: str, is_individual: bool = None) -> str:
     return normalized
 
 
+def _map_unique(values: pd.Series, func) -> pd.Series:
+    """Apply a column function to the distinct values only and broadcast the results back."""
+    codes, uniques = pd.factorize(values, use_na_sentinel=False)
+    results = func(pd.Series(uniques, dtype=object))
+    return pd.Series(results.to_numpy(dtype=object)[codes], index=values.index, dtype=object)
+
+
+def normalize_name_series(names: pd.Series, is_individual=None) -> pd.Series:
+    """
+    Vectorized normalize_name over a whole column.
+
+    is_individual may be a single flag for every row or a Series aligned with
+    names holding True/False/None per row. Missing names normalize to ''.
+    Each distinct (name, flag) pair is normalized once.
+    """
+    if not isinstance(is_individual, pd.Series):
+        return _map_unique(names, lambda uniques: _normalize_name_values(uniques, is_individual))
+
+    individual = is_individual.eq(True).fillna(False).to_numpy(dtype=bool)
+    company = is_individual.eq(False).fillna(False).to_numpy(dtype=bool)
+    normalized = pd.Series('', index=names.index, dtype=object)
+    for flag, mask in ((True, individual), (False, company), (None, ~(individual | company))):
+        if mask.any():
+            normalized[mask] = _map_unique(names[mask], lambda uniques: _normalize_name_values(uniques, flag))
+    return normalized
+
+
+def _normalize_name_values(names: pd.Series, is_individual=None) -> pd.Series:
+    """
+    Apply normalize_name to every value of a column sharing one is_individual flag.
+
+    Strings are kept as object dtype so case folding matches str.upper.
+    """
+    normalized = names.fillna('').astype(str).astype(object).str.upper().str.strip()
+    normalized = normalized.str.replace(SPACES_PATTERN, ' ', regex=True)
+
+    individual = np.full(len(normalized), bool(is_individual))
+    company = np.full(len(normalized), is_individual is False)
+
+    # For individuals only: Remove titles and normalize to first/last name
+    if individual.any():
+        people = normalized[individual]
+        for pattern in TITLE_PATTERNS:
+            people = people.str.replace(pattern, '', regex=True)
+        people = people.str.replace(LEADING_NONWORD_PATTERN, '', regex=True)
+        people = people.str.replace(TRAILING_NONWORD_PATTERN, '', regex=True)
+        people = people.str.replace(SPACES_PATTERN, ' ', regex=True).str.strip()
+        normalized[individual] = people.map(extract_first_last_name)
+
+    for pattern, replacement in GENERAL_SUBSTITUTIONS:
+        normalized = normalized.str.replace(pattern, replacement, regex=True)
+
+    # For non-individuals: strip all punctuation and remove ending business designators
+    if company.any():
+        companies = normalized[company]
+        for pattern, replacement in NON_INDIVIDUAL_SUBSTITUTIONS:
+            companies = companies.str.replace(pattern, replacement, regex=True)
+        for pattern in BUSINESS_SUFFIX_PATTERNS:
+            companies = companies.str.replace(pattern, '', regex=True).str.strip()
+        normalized[company] = companies
+
+    stripped = normalized.str.strip()
+    dominion = stripped.isin(EXACT_DOMINION_MATCHES) | normalized.str.startswith('DOMINION ENERGY ')
+    clean_va = ~dominion & stripped.isin(EXACT_CLEAN_VA_MATCHES)
+    normalized[dominion] = 'DOMINION ENERGY'
+    normalized[clean_va] = 'CLEAN VA FUND'
+    normalized[normalized == 'CAT PORTERFIELD'] = 'CATHY PORTERFIELD'
+
+    return normalized.str.replace(SPACES_PATTERN, ' ', regex=True).str.strip()
+
+
 def extract_first_last_name(name: str) -> str:
     """Extract first and last name, removing middle names/initials for consistent matching."""
     if not name:
@@ -268,6 +399,7 @@ def log_potential_nickname_matches(first_name: str, last_name: str):
         logger.info(f"POTENTIAL_SURNAME_VARIATION: '{first_name} {last_name}' - could match: {[f'{first_name} {alt}' for alt in potential_surname_variations[last_name]]}")
 
 
+@functools.lru_cache(maxsize=16384)
 def normalize_office_sought(office_sought: str) -> str:
     """Normalize office_sought to standard categories."""
     if pd.isna(office_sought):
@@ -277,55 +409,38 @@ def normalize_office_sought(office_sought: str) -> str:
     
     # Remove district names from office_sought_normal
     # Extract base office by removing district-specific parts
-    office_clean = re.sub(r'\s*-\s*.*$', '', office)  # Remove everything after dash
-    office_clean = re.sub(r'\b(prince william county|blue ridge district|arlington county|at large)\b', '', office_clean).strip()
-    office_clean = re.sub(r'\s+', ' ', office_clean)  # Clean up multiple spaces
-    
-    # Handle abbreviations and specific mappings first
-    if office_clean in ['hod', 'h.o.d.']:
-        return 'delegate'
-    elif office_clean in ['ag', 'a.g.']:
-        return 'attorney general'
-    elif office_clean in ['gov', 'governor']:
-        return 'governor'
-    elif any(abbrev in office_clean for abbrev in ['lt gov', 'lt. gov', 'lieutenant gov', 'lieut gov', 'lieu gov']):
-        return 'lieutenant governor'
-    elif 'delegate' in office_clean or 'hod' in office_clean:
-        return 'delegate'
-    elif 'senator' in office_clean or 'senate' in office_clean:
-        return 'senator'
-    elif 'governor' in office_clean and 'lieutenant' not in office_clean and 'lt' not in office_clean:
-        return 'governor'
-    elif any(term in office_clean for term in ['lieutenant', 'lt']) and 'governor' in office_clean:
-        return 'lieutenant governor'
-    elif ('attorney' in office_clean and 'general' in office_clean) or office_clean in ['ag', 'a.g.']:
-        return 'attorney general'
-    elif 'treasurer' in office_clean:
-        return 'treasurer'
-    elif 'secretary' in office_clean and 'commonwealth' in office_clean:
-        return 'secretary of the commonwealth'
-    elif ('member' in office_clean and 'county board' in office_clean) or ('supervisor' in office_clean or 'county board' in office_clean) and ('chair' in office_clean or 'chairman' in office_clean):
-        return 'chair board of supervisors'
-    elif ('member' in office_clean and 'board' in office_clean) or 'supervisor' in office_clean or 'county board' in office_clean:
-        return 'member board of supervisors'
-    elif 'school' in office_clean and 'board' in office_clean and ('chair' in office_clean or 'chairman' in office_clean):
-        return 'chair school board'
-    elif 'school' in office_clean and 'board' in office_clean:
-        return 'school board'
-    elif 'city council' in office_clean or 'town council' in office_clean:
-        return 'city council'
-    elif 'mayor' in office_clean:
-        return 'mayor'
-    elif 'sheriff' in office_clean:
-        return 'sheriff'
-    elif 'clerk' in office_clean and 'court' in office_clean:
-        return 'clerk of court'
-    elif 'commonwealth' in office_clean and 'attorney' in office_clean:
-        return 'commonwealth attorney'
-    else:
-        return office_clean
+    office_clean = OFFICE_DASH_SUFFIX_PATTERN.sub('', office)  # Remove everything after dash
+    office_clean = OFFICE_PLACE_NAMES_PATTERN.sub('', office_clean).strip()
+    office_clean = SPACES_PATTERN.sub(' ', office_clean)  # Clean up multiple spaces
+    
+    # First matching rule wins, in the same precedence as OFFICE_SOUGHT_RULES
+    match = OFFICE_SOUGHT_PATTERN.match(office_clean)
+    return OFFICE_SOUGHT_LABELS[match.lastgroup] if match else office_clean
+
 
+def normalize_office_sought_series(office_sought: pd.Series) -> pd.Series:
+    """Vectorized normalize_office_sought over a whole column, normalizing each distinct value once."""
+    return _map_unique(office_sought, _normalize_office_sought_values)
 
+
+def _normalize_office_sought_values(office_sought: pd.Series) -> pd.Series:
+    """Apply normalize_office_sought to every value of a column."""
+    missing = office_sought.isna().to_numpy()
+    office = office_sought.fillna('').astype(str).astype(object).str.lower().str.strip()
+
+    office_clean = office.str.replace(OFFICE_DASH_SUFFIX_PATTERN, '', regex=True)
+    office_clean = office_clean.str.replace(OFFICE_PLACE_NAMES_PATTERN, '', regex=True).str.strip()
+    office_clean = office_clean.str.replace(SPACES_PATTERN, ' ', regex=True)
+
+    # Each rule is a named group; the one that participated in the match names the label
+    matched = office_clean.str.extract(OFFICE_SOUGHT_PATTERN).notna()
+    labels = matched.idxmax(axis=1).map(OFFICE_SOUGHT_LABELS)
+    normalized = np.where(matched.any(axis=1), labels, office_clean).astype(object)
+    normalized = np.where(missing, None, normalized)
+    return pd.Series(normalized, index=office_sought.index, dtype=object)
+
+
+@functools.lru_cache(maxsize=16384)
 def determine_government_level(office_sought_normal: str, district: str) -> str:
     """Determine the level of government based on office and district."""
     district_str = str(district).lower().strip() if district and pd.notna(district) else ''
@@ -335,36 +450,35 @@ def determine_government_level(office_sought_normal: str, district: str) -> str:
         return 'federal'
     
     # State level offices
-    if office_sought_normal:
-        state_offices = {
-            'delegate', 'senator', 'governor', 'lieutenant governor', 
-            'attorney general', 'treasurer', 'secretary of the commonwealth'
-        }
-        
-        if office_sought_normal in state_offices:
-            return 'state'
+    if office_sought_normal and office_sought_normal in STATE_OFFICES:
+        return 'state'
     
     # Everything else is local
     return 'local'
 
 
-def normalize_district(district: str, candidate_city: str = None, level: str = None, office_sought: str = None) -> str:
+def determine_government_level_series(office_sought_normal: pd.Series, district: pd.Series) -> pd.Series:
+    """Vectorized determine_government_level, returned as a 'federal'/'state'/'local' categorical."""
+    district_str = district.astype(object).where(district.notna(), '').astype(str).str.lower()
+    is_federal = district_str.str.contains('congressional', regex=False).to_numpy(dtype=bool)
+    is_state = office_sought_normal.isin(STATE_OFFICES).to_numpy(dtype=bool)
+    levels = np.select([is_federal, is_state], ['federal', 'state'], default='local')
+    return pd.Series(pd.Categorical(levels, categories=['federal', 'state', 'local']), index=office_sought_normal.index)
+
+
+def normalize_district(district: str, candidate_city: str = None, level: str = None, office_sought: str = None,
+                       office_sought_normal: str = None) -> str:
     """Extract numerical part of district with no leading zeros."""
-    # Get normalized office for special handling
-    office_sought_normal = normalize_office_sought(office_sought) if office_sought else None
+    # Get normalized office for special handling, unless the caller already has it
+    if office_sought_normal is None:
+        office_sought_normal = normalize_office_sought(office_sought) if office_sought else None
     
     # Check if office_sought contains "at large" or similar variations
-    at_large = False
-    if office_sought and not pd.isna(office_sought):
-        office_lower = str(office_sought).lower()
-        if any(term in office_lower for term in ['at large', 'at-large', 'atlarge', ' al ', ' al,', ' al.', 'at large']):
-            at_large = True
+    at_large = bool(office_sought and not pd.isna(office_sought) and AT_LARGE_PATTERN.search(str(office_sought).lower()))
     
     # Check if district contains at-large variations
-    if district and not pd.isna(district):
-        district_lower = str(district).lower().strip()
-        if any(term in district_lower for term in ['at large', 'at-large', 'atlarge', ' al ', ' al,', ' al.', 'at large']):
-            at_large = True
+    if not at_large and district and not pd.isna(district):
+        at_large = bool(AT_LARGE_PATTERN.search(str(district).lower().strip()))
     
     suffix = (' - ' + office_sought.split('-', 1)[1].strip()) if office_sought and '-' in office_sought else ''
     
@@ -392,11 +506,11 @@ def normalize_district(district: str, candidate_city: str = None, level: str = N
     district_str = str(district).strip()
     
     # Extract numbers from the district string
-    numbers = re.findall(r'\d+', district_str)
+    number = DISTRICT_NUMBER_PATTERN.search(district_str)
     
-    if numbers:
+    if number:
         # Take the first number found and remove leading zeros
-        district_normal = str(int(numbers[0]))
+        district_normal = number.group().lstrip('0') or '0'
         # For LOCAL entries: put city name before district
         if level == 'local' and candidate_city and not pd.isna(candidate_city):
             district_normal = f"{candidate_city.strip()} ({district_normal})"
@@ -406,7 +520,7 @@ def normalize_district(district: str, candidate_city: str = None, level: str = N
     # For entries with no numbers/letters: use 0
     if level == 'local' and candidate_city and not pd.isna(candidate_city):
         # Check if district has any letters or numbers
-        if not re.search(r'[a-zA-Z0-9]', district_str):
+        if not ALPHANUMERIC_PATTERN.search(district_str):
             return f"{candidate_city.strip()} (0)".title()
         else:
             return f"{candidate_city.strip()} ({district_str})".title()
@@ -414,6 +528,77 @@ def normalize_district(district: str, candidate_city: str = None, level: str = N
     return district_str.title() if district_str else None
 
 
+def _present(values: pd.Series) -> np.ndarray:
+    """True where a value is neither missing nor falsy (matches `if value and not pd.isna(value)`)."""
+    values = values.astype(object)
+    return values.where(values.notna(), '').map(bool).to_numpy(dtype=bool)
+
+
+def _as_text(values: pd.Series, keep: np.ndarray) -> pd.Series:
+    """str() of each kept value as Python strings, '' elsewhere."""
+    return values.astype(object).where(keep, '').astype(str).astype(object)
+
+
+def normalize_district_series(district: pd.Series, candidate_city: pd.Series, level: pd.Series,
+                              office_sought: pd.Series, office_sought_normal: pd.Series = None) -> pd.Series:
+    """Vectorized normalize_district over aligned columns."""
+    has_office = _present(office_sought)
+    office_text = _as_text(office_sought, has_office)
+    if office_sought_normal is None:
+        office_sought_normal = normalize_office_sought_series(office_sought.astype(object).where(has_office, None))
+    
+    # Convert and strip each district once; the at-large check and number extraction share it
+    district_str = _as_text(district, district.notna().to_numpy()).str.strip()
+    blank_district = district_str.eq('').to_numpy(dtype=bool)
+    
+    # At-large offices or districts, like mayors, are always district 0
+    district_zero = (
+        office_sought_normal.eq('mayor').to_numpy(dtype=bool)
+        | (has_office & office_text.str.lower().str.contains(AT_LARGE_PATTERN).to_numpy(dtype=bool))
+        | (_present(district) & district_str.str.lower().str.contains(AT_LARGE_PATTERN).to_numpy(dtype=bool))
+    )
+    
+    suffix = (' - ' + office_text.str.partition('-')[2].str.strip()).where(office_text.str.contains('-', regex=False), '')
+    
+    has_city = _present(candidate_city)
+    city = _as_text(candidate_city, has_city).str.strip()
+    local_city = has_city & level.astype(object).eq('local').to_numpy(dtype=bool)
+    city_zero = (city + ' (0)').str.title()
+    
+    # First number found, without leading zeros
+    number = district_str.str.extract(DISTRICT_NUMBER_PATTERN, expand=False)
+    has_number = number.notna().to_numpy(dtype=bool)
+    number = number.fillna('').astype(object).str.lstrip('0').replace('', '0')
+    
+    has_alphanumeric = district_str.str.contains(ALPHANUMERIC_PATTERN).to_numpy(dtype=bool)
+    
+    conditions = [
+        district_zero & local_city,
+        district_zero,
+        blank_district & local_city,
+        blank_district & has_city,
+        blank_district,
+        has_number & local_city,
+        has_number,
+        local_city & ~has_alphanumeric,
+        local_city,
+    ]
+    choices = [
+        city_zero,
+        '0',
+        city_zero,
+        city.str.title(),
+        None,
+        (city + ' (' + number + ')' + suffix).str.title(),
+        number,
+        city_zero,
+        (city + ' (' + district_str + ')').str.title(),
+    ]
+    choices = [np.asarray(choice, dtype=object) if isinstance(choice, pd.Series) else choice for choice in choices]
+    normalized = np.select(conditions, choices, default=np.asarray(district_str.str.title(), dtype=object))
+    return pd.Series(normalized, index=district.index, dtype=object)
+
+
 def determine_primary_or_general(election_cycle: str) -> str:
     """Determine if election is primary or general based on election cycle."""
     if pd.isna(election_cycle):
@@ -423,4 +608,16 @@ def determine_primary_or_general(election_cycle: str) -> str:
     if election_str.startswith('11/'):
         return 'general'
     else:
-        return 'primary'
\ No newline at end of file
+        return 'primary'
+
+
+def determine_primary_or_general_series(election_cycle: pd.Series) -> pd.Series:
+    """Vectorized determine_primary_or_general, returned as a 'general'/'primary' categorical."""
+    # Only a handful of distinct cycles exist, so classify those and build the categorical from integer codes
+    codes, cycles = pd.factorize(election_cycle.astype(object))
+    general = pd.Series(cycles, dtype=object).astype(str).str.strip().str.startswith('11/').to_numpy(dtype=bool)
+    
+    # Category codes: 0 general, 1 primary, -1 (the trailing slot, picked by missing values) for None
+    category_codes = np.append(np.where(general, 0, 1), -1).astype(np.int8)
+    result = pd.Categorical.from_codes(category_codes[codes], categories=['general', 'primary'])
+    return pd.Series(result, index=election_cycle.index)
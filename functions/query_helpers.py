@@ -0,0 +1,17 @@
+"""
+Shared helpers for BigQuery analysis queries
+Escapes literals for RE2 regex parameters and sets the result page size used when streaming results.
+"""
+
+import re
+
+# Regex metacharacters that must be escaped for BigQuery's RE2 engine
+RE2_SPECIAL_CHARS = re.compile(r'([\\.^$|?*+()\[\]{}])')
+
+# Rows fetched per result page when streaming query results
+QUERY_PAGE_SIZE = 10000
+
+
+def escape_regex_literal(text: str) -> str:
+    """Escape text so RE2 matches it literally."""
+    return RE2_SPECIAL_CHARS.sub(r'\\\1', text)
@@ -9,23 +9,35 @@ Supports two modes:
 import os
 import sys
 import pandas as pd
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pv
+import pyarrow.parquet as pq
 import argparse
+import csv
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 import logging
 from datetime import datetime
 import re
 import io
-import pandas_gbq
+import json
+import sqlite3
+import hashlib
+import functools
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 
 # Add parent directory to path for imports
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 # Import shared normalization functions
 from functions.name_normalization import (
-    normalize_name, normalize_office_sought, determine_government_level, 
-    normalize_district, determine_primary_or_general
+    normalize_district_series, normalize_name_series, normalize_office_sought_series,
+    determine_primary_or_general_series, determine_government_level_series
 )
+from functions.filing_deadlines import get_filing_periods_for_year
 
 
 
@@ -33,24 +45,287 @@ from functions.name_normalization import (
 try:
     from google.cloud import storage
     from google.cloud import bigquery
-    import pandas_gbq
     GCS_AVAILABLE = True
 except ImportError:
     GCS_AVAILABLE = False
 
+# Concurrent blob downloads (newer google-cloud-storage releases only)
+try:
+    from google.cloud.storage import transfer_manager
+    TRANSFER_MANAGER_AVAILABLE = True
+except ImportError:
+    TRANSFER_MANAGER_AVAILABLE = False
+
+# JIT-compiled on-time kernel (optional; falls back to numpy masks)
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    prange = range
+    NUMBA_AVAILABLE = False
+
+# Arrow-native SQLite ingest for the local test database (optional; falls back to DataFrame.to_sql)
+try:
+    import adbc_driver_sqlite.dbapi as adbc_sqlite
+    ADBC_SQLITE_AVAILABLE = True
+except ImportError:
+    ADBC_SQLITE_AVAILABLE = False
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Fixed Arrow schema (and output column order) for transactions; old format rows leave the report-only fields null
+TRANSACTION_SCHEMA = pa.schema([
+    pa.field('report_id', pa.int64()),
+    pa.field('committee_code', pa.string()),
+    pa.field('committee_name', pa.string()),
+    pa.field('committee_name_normalized', pa.string()),
+    pa.field('candidate_name', pa.string()),
+    pa.field('candidate_name_normalized', pa.string()),
+    pa.field('report_year', pa.int64()),
+    pa.field('report_date', pa.string()),
+    pa.field('party', pa.string()),
+    pa.field('office_sought', pa.string()),
+    pa.field('office_sought_normal', pa.string()),
+    pa.field('district', pa.string()),
+    pa.field('district_normal', pa.string()),
+    pa.field('level', pa.string()),
+    pa.field('candidate_city', pa.string()),
+    pa.field('election_cycle', pa.string()),
+    pa.field('primary_or_general', pa.string()),
+    pa.field('election_cycle_start_date', pa.string()),
+    pa.field('election_cycle_end_date', pa.string()),
+    pa.field('schedule_type', pa.string()),
+    pa.field('transaction_date', pa.string()),
+    pa.field('amount', pa.float64()),
+    pa.field('total_to_date', pa.float64()),
+    pa.field('entity_name', pa.string()),
+    pa.field('entity_name_normalized', pa.string()),
+    pa.field('entity_first_name', pa.string()),
+    pa.field('entity_last_name', pa.string()),
+    pa.field('entity_address', pa.string()),
+    pa.field('entity_city', pa.string()),
+    pa.field('entity_state', pa.string()),
+    pa.field('entity_zip', pa.string()),
+    pa.field('entity_employer', pa.string()),
+    pa.field('entity_occupation', pa.string()),
+    pa.field('entity_is_individual', pa.bool_()),
+    pa.field('transaction_type', pa.string()),
+    pa.field('purpose', pa.string()),
+    pa.field('committee_type', pa.string()),
+    pa.field('zip_code', pa.string()),
+    pa.field('submitted_date', pa.string()),
+    pa.field('due_date', pa.string()),
+    pa.field('amendment_count', pa.int64()),
+    pa.field('data_source', pa.string()),
+    pa.field('folder_name', pa.string()),
+    pa.field('onTime', pa.int64())
+])
+
+TRANSACTION_COLUMNS = TRANSACTION_SCHEMA.names
+
+# Text columns per CSV schema; numeric columns keep their dtype and NaN
+REPORT_STRING_COLS = [
+    'CommitteeCode', 'CommitteeName', 'CandidateName', 'FilingDate', 'StartDate', 'EndDate',
+    'Party', 'OfficeSought', 'District', 'City', 'ElectionCycle', 'ElectionCycleStartDate',
+    'ElectionCycleEndDate', 'DueDate', 'CommitteeType', 'ZipCode', 'SubmittedDate'
+]
+
+NEW_SCHEDULE_STRING_COLS = [
+    'TransactionDate', 'FirstName', 'MiddleName', 'LastOrCompanyName', 'AddressLine1',
+    'City', 'StateCode', 'ZipCode', 'NameOfEmployer', 'OccupationOrTypeOfBusiness',
+    'ItemOrService', 'ProductOrService', 'PurposeOfObligation'
+]
+
+# Old format column aliases resolved to one canonical name per file
+OLD_ALIASES = {
+    'Committee Code': 'committee_code', 'COMMITTEE_CODE': 'committee_code',
+    'Committee Name': 'committee_name', 'COMMITTEE_NAME': 'committee_name',
+    'First Name': 'first_name', 'FIRSTNAME': 'first_name',
+    'Middle Name': 'middle_name', 'MIDDLENAME': 'middle_name',
+    'Last Name': 'last_name', 'LASTNAME': 'last_name',
+    'Report Year': 'report_year', 'REPORT_YEAR': 'report_year',
+    'Date Received': 'date_received', 'DATE_RECEIVED': 'date_received',
+    'Party': 'party', 'Party_Desc': 'party',
+    'Office Code': 'office_code', 'OFFICE_CODE': 'office_code',
+    'Office Sub Code': 'office_sub_code', 'OFFICE_SUB_CODE': 'office_sub_code',
+    'Trans Date': 'trans_date', 'TRANS_DATE': 'trans_date',
+    'Trans Amount': 'trans_amount', 'TRANS_AMNT': 'trans_amount', 'Trans_Amount': 'trans_amount',
+    'Trans Agg To Date': 'trans_agg_to_date', 'TRANS_AGG_TO_DATE': 'trans_agg_to_date',
+    'Entity Name': 'entity_name', 'ENTITY_NAME': 'entity_name',
+    'Entity Address': 'entity_address', 'ENTITY_ADDRESS': 'entity_address',
+    'Entity City': 'entity_city', 'ENTITY_CITY': 'entity_city',
+    'Entity State': 'entity_state', 'ENTITY_STATE': 'entity_state',
+    'Entity Zip': 'entity_zip', 'ENTITY_ZIP': 'entity_zip',
+    'Entity Employer': 'entity_employer', 'ENTITY_EMPLOYER': 'entity_employer',
+    'Entity Occupation': 'entity_occupation', 'ENTITY_OCCUPATION': 'entity_occupation',
+    'Trans Type': 'trans_type', 'TRANS_TYPE': 'trans_type',
+    'Trans Service Or Goods': 'trans_service_or_goods', 'TRANS_ITEM_OR_SERVICE': 'trans_service_or_goods'
+}
+
+OLD_SCHEDULE_STRING_COLS = [
+    'committee_code', 'committee_name', 'first_name', 'middle_name', 'last_name',
+    'date_received', 'party', 'office_code', 'office_sub_code', 'trans_date',
+    'entity_name', 'entity_address', 'entity_city', 'entity_state', 'entity_zip',
+    'entity_employer', 'entity_occupation', 'trans_type', 'trans_service_or_goods'
+]
+
+# CSV columns always parsed as text; other columns get pandas-style numeric/boolean inference
+CSV_TEXT_COLUMNS = frozenset(
+    REPORT_STRING_COLS + NEW_SCHEDULE_STRING_COLS + OLD_SCHEDULE_STRING_COLS
+    + [alias for alias, name in OLD_ALIASES.items() if name in OLD_SCHEDULE_STRING_COLS]
+)
+
+# pandas' default missing-value markers and boolean spellings, applied to pyarrow-parsed text
+CSV_NA_VALUES = [
+    '', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan', '1.#IND', '1.#QNAN',
+    '<NA>', 'N/A', 'NA', 'NULL', 'NaN', 'None', 'n/a', 'nan', 'null'
+]
+CSV_BOOL_VALUES = {'True': True, 'TRUE': True, 'true': True, 'False': False, 'FALSE': False, 'false': False}
+
+# A field starting with whitespace (may also match inside quoted text, which only costs a pandas fallback)
+CSV_INITIAL_SPACE_PATTERN = re.compile(r'(?:^|,)[ \t]', re.MULTILINE)
+
+# Transaction columns taken from the matching Report.csv entry (transaction column -> report field)
+REPORT_TRANSACTION_FIELDS = {
+    'committee_code': 'committee_code',
+    'committee_name': 'committee_name',
+    'candidate_name': 'candidate_name',
+    'report_year': 'report_year',
+    'report_date': 'filing_date',
+    'party': 'party',
+    'office_sought': 'office_sought',
+    'district': 'district',
+    'candidate_city': 'candidate_city',
+    'election_cycle': 'election_cycle',
+    'election_cycle_start_date': 'election_cycle_start_date',
+    'election_cycle_end_date': 'election_cycle_end_date',
+    'committee_type': 'committee_type',
+    'zip_code': 'zip_code',
+    'submitted_date': 'submitted_date',
+    'due_date': 'due_date',
+    'amendment_count': 'amendment_count'
+}
+
+# Report.csv column behind each report field, in report dict order; numeric fields are coerced
+REPORT_CSV_FIELDS = {
+    'report_id': 'ReportId',
+    'committee_code': 'CommitteeCode',
+    'committee_name': 'CommitteeName',
+    'candidate_name': 'CandidateName',
+    'report_year': 'ReportYear',
+    'filing_date': 'FilingDate',
+    'start_date': 'StartDate',
+    'end_date': 'EndDate',
+    'party': 'Party',
+    'office_sought': 'OfficeSought',
+    'district': 'District',
+    'candidate_city': 'City',
+    'election_cycle': 'ElectionCycle',
+    'election_cycle_start_date': 'ElectionCycleStartDate',
+    'election_cycle_end_date': 'ElectionCycleEndDate',
+    'due_date': 'DueDate',
+    'amendment_count': 'AmendmentCount',
+    'committee_type': 'CommitteeType',
+    'zip_code': 'ZipCode',
+    'submitted_date': 'SubmittedDate'
+}
+REPORT_NUMERIC_FIELDS = {'report_id', 'report_year', 'amendment_count'}
+
+# Low-cardinality text columns held as categoricals in the combined frame
+CATEGORICAL_COLUMNS = [
+    'office_sought_normal', 'level', 'primary_or_general', 'district_normal',
+    'schedule_type', 'transaction_type', 'data_source', 'folder_name'
+]
+
+# Manifest of staged folders, keyed by folder name, used to skip unchanged folders on re-runs
+CACHE_MANIFEST_BLOB = 'staging/manifest.json'
+
+# Version of the staged output; bump it whenever folder processing changes so cached folders are rebuilt
+CACHE_VERSION = 1
+
+# Date formats accepted for transaction and report dates, tried in order
+ON_TIME_DATE_FORMATS = ["%Y-%m-%d", "%m/%d/%Y", "%Y-%m-%d %H:%M:%S", "%Y-%m-%d %H:%M:%S.%f", "%m/%d/%y"]
+
+
+@functools.lru_cache(maxsize=64)
+def _filing_periods_arrays(year: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Return a year's filing periods as (starts, ends, deadlines, on_cycle) arrays, in list order."""
+    periods = get_filing_periods_for_year(year)
+    
+    def to_dates(key):
+        return pd.to_datetime([period[key] for period in periods], format='%Y-%m-%d', errors='coerce').to_numpy(dtype='datetime64[us]')
+    
+    starts, ends, deadlines = to_dates('filingPeriodStart'), to_dates('filingPeriodEnd'), to_dates('filingPeriodDeadline')
+    on_cycle = np.array([bool(period['onCycle']) for period in periods], dtype=bool)
+    
+    # Periods with unparseable dates are never matched
+    valid = ~(np.isnat(starts) | np.isnat(ends) | np.isnat(deadlines))
+    return starts[valid], ends[valid], deadlines[valid], on_cycle[valid]
+
+
+@functools.lru_cache(maxsize=128)
+def _filing_period_intervals(year: int, on_cycle: bool) -> Tuple[Optional[pd.IntervalIndex], np.ndarray, np.ndarray, np.ndarray]:
+    """Return a year's on- or off-cycle periods as (IntervalIndex, starts, ends, deadlines); the index is None if periods overlap."""
+    starts, ends, deadlines, period_on_cycle = _filing_periods_arrays(year)
+    starts, ends, deadlines = starts[period_on_cycle == on_cycle], ends[period_on_cycle == on_cycle], deadlines[period_on_cycle == on_cycle]
+    if len(starts) == 0:
+        return None, starts, ends, deadlines
+    
+    intervals = pd.IntervalIndex.from_arrays(starts, ends, closed='both')
+    return (None if intervals.is_overlapping else intervals), starts, ends, deadlines
+
+
+def _on_time_kernel(tx_days, rep_days, year_index, is_on_cycle, period_offsets, starts, ends, deadlines, on_cycle):
+    """Return 1/0/-1 (on time/late/unknown) per transaction; year k's periods are rows period_offsets[k]:period_offsets[k + 1]."""
+    n = tx_days.shape[0]
+    result = np.full(n, -1, dtype=np.int8)
+    for i in prange(n):
+        k = year_index[i]
+        if k < 0:
+            continue
+        result[i] = 0
+        for p in range(period_offsets[k], period_offsets[k + 1]):
+            if starts[p] <= tx_days[i] and tx_days[i] <= ends[p] and on_cycle[p] == is_on_cycle[i]:
+                if rep_days[i] <= deadlines[p]:
+                    result[i] = 1
+                break
+    return result
+
+
+if NUMBA_AVAILABLE:
+    _on_time_kernel = njit(cache=True, parallel=True)(_on_time_kernel)
+
+
+# Processor built once per worker process by _init_folder_worker and reused for every folder it handles
+_worker_processor = None
+
+
+def _init_folder_worker(config: Dict) -> None:
+    """Build the worker process's processor (and its storage client) once, when the process starts."""
+    global _worker_processor
+    _worker_processor = VirginiaDataProcessor(**config)
+
+
+def _process_folder_worker(folder_name: str, source) -> Tuple[List[Dict], pd.DataFrame, Optional[str], int]:
+    """Process one folder in a worker process; top level so ProcessPoolExecutor can pickle it."""
+    return _worker_processor._process_folder(folder_name, source)
+
+
 class VirginiaDataProcessor:
     """Main data processor class for Virginia Campaign Finance data."""
     
-    def __init__(self, test_mode: bool = True, project_id: str = None, bucket_name: str = "va-cf-local", process_old_folders: bool = True, folders_after_year: int = None):
+    def __init__(self, test_mode: bool = True, project_id: str = None, bucket_name: str = "va-cf-local", process_old_folders: bool = True, folders_after_year: int = None, use_cache: bool = True, max_workers: int = None, create_bq_client: bool = True):
         self.test_mode = test_mode
         self.project_id = project_id
         self.bucket_name = bucket_name
         self.process_old_folders = process_old_folders
         self.folders_after_year = folders_after_year
+        self.use_cache = use_cache
+        
+        # Processes used to work through folders in parallel (1 processes them in-process)
+        self.max_workers = max_workers or os.cpu_count() or 1
         
         # Track logged report IDs to avoid duplicate warnings
         self.logged_missing_reports = set()
@@ -64,15 +339,22 @@ class VirginiaDataProcessor:
         # Initialize clients for production mode
         if not test_mode:
             if not GCS_AVAILABLE:
-                raise ImportError("Google Cloud dependencies not available. Install with: pip install google-cloud-storage google-cloud-bigquery pandas-gbq")
+                raise ImportError("Google Cloud dependencies not available. Install with: pip install google-cloud-storage google-cloud-bigquery")
             if not project_id:
                 raise ValueError("project_id is required for production mode")
             
             self.storage_client = storage.Client(project=project_id)
-            self.bq_client = bigquery.Client(project=project_id)
+            # Folder workers only read and stage files, so they skip the BigQuery client
+            self.bq_client = bigquery.Client(project=project_id) if create_bq_client else None
         else:
             self.storage_client = None
             self.bq_client = None
+        
+        # GCS URIs of per-folder Parquet files staged for the BigQuery load
+        self.staged_uris = []
+        
+        # Threads used to download a folder's CSVs in parallel
+        self.download_workers = 16
     
     def is_old_folder(self, folder_name: str) -> bool:
         """Check if folder follows old naming convention (YYYY format, <= 2011)."""
@@ -90,18 +372,6 @@ class VirginiaDataProcessor:
             # Unknown format, return 0 to exclude
             return 0
     
-    def _safe_bool_convert(self, value) -> Optional[bool]:
-        """Safely convert a value to boolean."""
-        if pd.isna(value) or value == '' or value is None:
-            return None
-        try:
-            numeric_val = pd.to_numeric(value, errors='coerce')
-            if pd.isna(numeric_val):
-                return None
-            return bool(numeric_val)
-        except:
-            return None
-    
     def _clean_embedded_quotes_2018_12(self, csv_data: str) -> str:
         """Clean embedded quotes in 2018_12 CSV data that break parsing."""
         #import re
@@ -193,7 +463,7 @@ class VirginiaDataProcessor:
     
     def process_data(self) -> pd.DataFrame:
         """Main processing function that returns a cleaned DataFrame."""
-        logger.info(f"Starting data processing in {'TEST' if self.test_mode else 'PRODUCTION'} mode")
+        logger.info("Starting data processing in %s mode", 'TEST' if self.test_mode else 'PRODUCTION')
         
         if self.test_mode:
             return self._process_test_mode()
@@ -215,100 +485,55 @@ class VirginiaDataProcessor:
         # Apply year filter if specified
         if self.folders_after_year is not None:
             existing_folders = [f for f in existing_folders if self.should_process_folder(f)]
-            logger.info(f"Applied year filter (>= {self.folders_after_year}): {len(existing_folders)} folders remaining")
+            logger.info("Applied year filter (>= %s): %s folders remaining", self.folders_after_year, len(existing_folders))
         
-        logger.info(f"Found {len(existing_folders)} folders to process: {existing_folders}")
+        logger.info("Found %s folders to process: %s", len(existing_folders), existing_folders)
         
-        all_data = []
+        folder_frames = []
         reports_data = []
         
-        for folder in existing_folders:
-            folder_path = data_dir / folder
-            logger.info(f"Processing folder: {folder}")
-            
-            # Process this folder (all 2024 folders use new format)
-            folder_reports, folder_transactions = self._process_new_folder(folder_path, folder)
+        # Folders are independent, so process them in parallel (all 2024 folders use new format)
+        tasks = [(folder, data_dir / folder) for folder in existing_folders]
+        for folder_reports, folder_transactions, _, _ in self._map_folders(tasks):
             reports_data.extend(folder_reports)
-            all_data.extend(folder_transactions)
+            folder_frames.append(folder_transactions)
         
-        # Convert to DataFrame
-        df_transactions = pd.DataFrame(all_data)
+        # Combine per-folder DataFrames once
+        df_transactions = pd.concat(folder_frames, ignore_index=True) if folder_frames else pd.DataFrame()
         df_reports = pd.DataFrame(reports_data)
         
         # Fix column types for BigQuery compatibility
-        if not df_transactions.empty:
-            # Fix entity_is_individual column type (should be bool)
-            if 'entity_is_individual' in df_transactions.columns:
-                df_transactions['entity_is_individual'] = df_transactions['entity_is_individual'].astype('boolean')
-            
-            # Fix onTime column type (should be int 0/1)  
-            if 'onTime' in df_transactions.columns:
-                # Convert boolean-like values to 0/1 integers
-                df_transactions['onTime'] = df_transactions['onTime'].map(
-                    lambda x: 1 if x is True or x == 1 or str(x).lower() in ['true', '1', 'yes'] 
-                    else 0 if x is False or x == 0 or str(x).lower() in ['false', '0', 'no'] 
-                    else None
-                ).astype('Int64')  # Nullable integer type
-            
-            if 'entity_zip' in df_transactions.columns:
-                df_transactions['entity_zip'] = df_transactions['entity_zip'].astype(str)
-            
-            if 'purpose' in df_transactions.columns:
-                df_transactions['purpose'] = df_transactions['purpose'].astype(str)  
+        df_transactions = self._compact_dtypes(self._fix_column_types(df_transactions))
         
-        logger.info(f"Processed {len(df_transactions)} transactions from {len(existing_folders)} folders")
+        logger.info("Processed %s transactions from %s folders", len(df_transactions), len(existing_folders))
         return df_transactions
     
     def _process_production_mode(self) -> pd.DataFrame:
         """Process data from GCS bucket and return cleaned DataFrame."""
-        logger.info(f"Processing data from GCS bucket: {self.bucket_name}")
+        logger.info("Processing data from GCS bucket: %s", self.bucket_name)
         
         bucket = self.storage_client.bucket(self.bucket_name)
         
-        # List all folders in the raw_data directory
-        print("Debugging GCS bucket listing...")
-        print(f"Bucket name: {self.bucket_name}")
-        print(f"Project ID: {self.project_id}")
-        
-        # Test basic bucket access
+        # List raw_data once, requesting only the fields we use, and group blobs by folder
         try:
-            bucket.reload()  # Test if bucket exists and is accessible
-            print(f"Bucket exists and is accessible")
+            all_blobs = list(bucket.list_blobs(prefix='raw_data/', fields='items(name,size,etag),nextPageToken'))
         except Exception as e:
-            print(f"Error accessing bucket: {e}")
+            logger.error("Error listing bucket %s: %s", self.bucket_name, e)
             return pd.DataFrame()
         
-        # List ALL objects (without delimiter) to see what's actually in the bucket
-        try:
-            all_blobs = list(bucket.list_blobs(max_results=50))
-            print(f"Total blobs found: {len(all_blobs)}")
-            print("First 10 blob names:")
-            for blob in all_blobs[:10]:
-                print(f"  {blob.name}")
-        except Exception as e:
-            print(f"Error listing all blobs: {e}")
-            
-        # Try to list with raw_data prefix specifically
-        try:
-            raw_data_blobs = list(bucket.list_blobs(prefix='raw_data/', max_results=20))
-            print(f"Raw data blobs found: {len(raw_data_blobs)}")
-            print("Raw data blob names:")
-            for blob in raw_data_blobs[:5]:
-                print(f"  {blob.name}")
-        except Exception as e:
-            print(f"Error listing raw_data blobs: {e}")
-        
-        # Extract unique folder names from blob paths
-        prefixes = set()
-        for blob in bucket.list_blobs(prefix='raw_data/'):
+        blobs_by_folder = defaultdict(list)
+        for blob in all_blobs:
             # Extract folder name from path like 'raw_data/1999/ScheduleA.csv' -> '1999'
             path_parts = blob.name.split('/')
-            if len(path_parts) >= 3 and path_parts[0] == 'raw_data':
-                folder_name = path_parts[1]
-                prefixes.add(folder_name)
+            if len(path_parts) >= 3:
+                blobs_by_folder[path_parts[1]].append(blob)
         
-        prefixes = list(prefixes)
-        print(f"Extracted folder names: {prefixes}")
+        prefixes = list(blobs_by_folder)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Raw data blobs found: %s", len(all_blobs))
+            for blob in all_blobs[:10]:
+                logger.debug("  %s", blob.name)
+            logger.debug("Extracted folder names: %s", prefixes)
         
         # Separate old (1999-2011) and new (2012_03-2025_08) folders
         old_folders = []
@@ -326,101 +551,115 @@ class VirginiaDataProcessor:
                 new_folders.append(folder_name)
         
         if self.folders_after_year is not None:
-            logger.info(f"Applied year filter (>= {self.folders_after_year})")
+            logger.info("Applied year filter (>= %s)", self.folders_after_year)
         
-        logger.info(f"Found {len(old_folders)} old folders and {len(new_folders)} new folders")
+        logger.info("Found %s old folders and %s new folders", len(old_folders), len(new_folders))
         
-        all_data = []
         reports_data = []
+        manifest = self._load_cache_manifest(bucket)
         
-        # Process old folders (only if enabled)
+        # Old folders first (only if enabled), then new folders
         if self.process_old_folders:
-            for folder in sorted(old_folders):
-                if self.is_old_folder(folder):
-                    logger.info(f"Processing old folder: {folder}")
-                    folder_data = self._process_old_folder_gcs(bucket, folder)
-                    all_data.extend(folder_data)
+            folders = sorted(old_folders) + sorted(new_folders)
         else:
-            logger.info(f"Skipping {len(old_folders)} old folders (process_old_folders=False)")
-        
-        # Process new folders
-        for folder in sorted(new_folders):
-            if not self.is_old_folder(folder):
-                logger.info(f"Processing new folder: {folder}")
-                folder_reports, folder_transactions = self._process_new_folder_gcs(bucket, folder)
-                reports_data.extend(folder_reports)
-                all_data.extend(folder_transactions)
-        
-        # Convert to DataFrame
-        df_transactions = pd.DataFrame(all_data)
-        df_reports = pd.DataFrame(reports_data)
+            logger.info("Skipping %s old folders (process_old_folders=False)", len(old_folders))
+            folders = sorted(new_folders)
+        
+        # Reuse staged output for unchanged folders; the rest are processed in parallel
+        frames_by_folder = {}
+        etag_hashes = {}
+        tasks = []
+        for folder in folders:
+            etag_hashes[folder] = self._folder_etag_hash(blobs_by_folder[folder])
+            cached = self._load_cached_folder(bucket, folder, manifest, etag_hashes[folder])
+            if cached is not None:
+                frames_by_folder[folder] = cached
+            else:
+                tasks.append((folder, [blob.name for blob in blobs_by_folder[folder]]))
         
-        # Fix column types for BigQuery compatibility
-        if not df_transactions.empty:
-            # Fix entity_is_individual column type (should be bool)
-            if 'entity_is_individual' in df_transactions.columns:
-                df_transactions['entity_is_individual'] = df_transactions['entity_is_individual'].astype('boolean')
-            
-            # Fix onTime column type (should be int 0/1)  
-            if 'onTime' in df_transactions.columns:
-                # Convert boolean-like values to 0/1 integers
-                df_transactions['onTime'] = df_transactions['onTime'].map(
-                    lambda x: 1 if x is True or x == 1 or str(x).lower() in ['true', '1', 'yes'] 
-                    else 0 if x is False or x == 0 or str(x).lower() in ['false', '0', 'no'] 
-                    else None
-                ).astype('Int64')  # Nullable integer type
-            
-            if 'entity_zip' in df_transactions.columns:
-                df_transactions['entity_zip'] = df_transactions['entity_zip'].astype(str) 
-            
-            if 'purpose' in df_transactions.columns:
-                df_transactions['purpose'] = df_transactions['purpose'].astype(str) 
+        for (folder, _), (folder_reports, folder_transactions, staged_uri, skipped_files) in zip(tasks, self._map_folders(tasks)):
+            reports_data.extend(folder_reports)
+            if staged_uri:
+                self.staged_uris.append(staged_uri)
+            if skipped_files:
+                # Leave incomplete output out of the cache so the next run retries the folder
+                logger.warning("Folder %s had %s skipped files - not caching its staged output", folder, skipped_files)
+                manifest.pop(folder, None)
+            else:
+                self._record_cached_folder(manifest, folder, etag_hashes[folder], folder_transactions)
+            frames_by_folder[folder] = folder_transactions
+        
+        folder_frames = [frames_by_folder[folder] for folder in folders]
+        
+        self._save_cache_manifest(bucket, manifest)
         
-        logger.info(f"Processed {len(df_transactions)} transactions from GCS")
+        # Combine per-folder DataFrames once (already type-fixed and staged for BigQuery)
+        df_transactions = self._compact_dtypes(pd.concat(folder_frames, ignore_index=True) if folder_frames else pd.DataFrame())
+        df_reports = pd.DataFrame(reports_data)
+        
+        logger.info("Processed %s transactions from GCS", len(df_transactions))
         return df_transactions
     
-    def _process_new_folder(self, folder_path: Path, folder_name: str) -> Tuple[List[Dict], List[Dict]]:
+    def _map_folders(self, tasks: List[Tuple[str, object]]) -> List[Tuple[List[Dict], pd.DataFrame, Optional[str], int]]:
+        """Run _process_folder over (folder, source) tasks in order, across worker processes when max_workers > 1."""
+        if self.max_workers <= 1 or len(tasks) <= 1:
+            return [self._process_folder(folder, source) for folder, source in tasks]
+        
+        # Each worker process builds one processor (and storage client) from this config at startup
+        config = {
+            'test_mode': self.test_mode, 'project_id': self.project_id, 'bucket_name': self.bucket_name,
+            'process_old_folders': self.process_old_folders, 'folders_after_year': self.folders_after_year,
+            'use_cache': self.use_cache, 'max_workers': 1, 'create_bq_client': False
+        }
+        folders, sources = zip(*tasks)
+        with ProcessPoolExecutor(max_workers=min(self.max_workers, len(tasks)),
+                                 initializer=_init_folder_worker, initargs=(config,)) as executor:
+            return list(executor.map(_process_folder_worker, folders, sources))
+    
+    def _process_folder(self, folder_name: str, source) -> Tuple[List[Dict], pd.DataFrame, Optional[str], int]:
+        """
+        Process one folder: a local folder path in test mode, or the folder's blob names in GCS.
+        
+        Returns the folder's reports, its transactions, (in production) the URI they were staged to,
+        and the number of files skipped because they failed to download or parse.
+        """
+        if self.test_mode:
+            logger.info("Processing folder: %s", folder_name)
+            folder_reports, folder_transactions = self._process_new_folder(source, folder_name)
+            return folder_reports, folder_transactions, None, 0
+        
+        bucket = self.storage_client.bucket(self.bucket_name)
+        blobs = [bucket.blob(name) for name in source]
+        if self.is_old_folder(folder_name):
+            logger.info("Processing old folder: %s", folder_name)
+            folder_transactions, skipped_files = self._process_old_folder_gcs(bucket, folder_name, blobs)
+            folder_reports = []
+        else:
+            logger.info("Processing new folder: %s", folder_name)
+            folder_reports, folder_transactions, skipped_files = self._process_new_folder_gcs(bucket, folder_name, blobs)
+        
+        folder_transactions, staged_uri = self._stage_folder_parquet(bucket, folder_name, folder_transactions)
+        return folder_reports, folder_transactions, staged_uri, skipped_files
+    
+    def _process_new_folder(self, folder_path: Path, folder_name: str) -> Tuple[List[Dict], pd.DataFrame]:
         """Process a new format folder from local filesystem."""
         csv_files = list(folder_path.glob('*.csv'))
         reports = {}
-        transactions = []
+        cols = defaultdict(list)
         
         # First process Report.csv
         report_file = folder_path / 'Report.csv'
         if report_file.exists():
-            logger.info(f"  Processing Report.csv")
-            df_report = pd.read_csv(report_file, encoding='latin-1', on_bad_lines="skip", low_memory=False)
+            logger.info("  Processing Report.csv")
+            df_report = self._read_csv(report_file.read_text(encoding='latin-1'))
             
 
-            # Drop NaN early so nothing gets concatenated
-            df_report = df_report.fillna("").replace("nan", "")
+            # Blank out missing text so nothing gets concatenated
+            df_report = self._fill_string_columns(df_report, REPORT_STRING_COLS)
 
-            for _, row in df_report.iterrows():
-                report_data = {
-                    'report_id': pd.to_numeric(row.get('ReportId'), errors='coerce'),
-                    'committee_code': row.get('CommitteeCode'),
-                    'committee_name': row.get('CommitteeName'),
-                    'candidate_name': row.get('CandidateName'),
-                    'report_year': pd.to_numeric(row.get('ReportYear'), errors='coerce'),
-                    'filing_date': row.get('FilingDate'),
-                    'start_date': row.get('StartDate'),
-                    'end_date': row.get('EndDate'),
-                    'party': row.get('Party'),
-                    'office_sought': row.get('OfficeSought'),
-                    'district': row.get('District'),
-                    'candidate_city': row.get('City'),
-                    'election_cycle': row.get('ElectionCycle'),
-                    'election_cycle_start_date': row.get('ElectionCycleStartDate'),
-                    'election_cycle_end_date': row.get('ElectionCycleEndDate'),
-                    'due_date': row.get('DueDate'),
-                    'amendment_count': pd.to_numeric(row.get('AmendmentCount'), errors='coerce'),
-                    'committee_type': row.get('CommitteeType'),
-                    'zip_code': row.get('ZipCode'),
-                    'submitted_date': row.get('SubmittedDate'),
-                    'data_source': 'new',
-                    'folder_name': folder_name
-                }
-                reports[row.get('ReportId')] = report_data
+            reports.update(self._report_records(df_report, folder_name))
+        
+        reports_df = self._build_reports_frame(reports)
         
         # Process transactional schedules
         for csv_file in csv_files:
@@ -430,51 +669,50 @@ class VirginiaDataProcessor:
             schedule_type = self.extract_schedule_type(csv_file.name)
             
             if schedule_type in self.skip_schedules:
-                logger.info(f"    Skipping {csv_file.name} (summary/loan schedule)")
+                logger.info("    Skipping %s (summary/loan schedule)", csv_file.name)
                 continue
             
             if schedule_type not in self.transactional_schedules:
-                logger.info(f"    Skipping {csv_file.name} (unknown schedule type)")
+                logger.info("    Skipping %s (unknown schedule type)", csv_file.name)
                 continue
             
-            logger.info(f"    Processing {csv_file.name}")
-            df = pd.read_csv(csv_file, encoding='latin-1', on_bad_lines="skip", low_memory=False)
+            logger.info("    Processing %s", csv_file.name)
+            df = self._read_csv(csv_file.read_text(encoding='latin-1'))
             
-            # Drop NaN early so nothing gets concatenated
-            df = df.fillna("").replace("nan", "")
-
-            for _, row in df.iterrows():
-                transaction = self._map_new_row_to_transaction(row, folder_name, schedule_type, reports)
-                if transaction:
-                    transactions.append(transaction)
+            # Blank out missing text so nothing gets concatenated
+            df = self._fill_string_columns(df, NEW_SCHEDULE_STRING_COLS)
+            
+            df = self._merge_report_info(df, reports_df)
+            self._map_new_frame_to_transactions(df, folder_name, schedule_type, cols)
         
-        return list(reports.values()), transactions
+        return list(reports.values()), self._add_normalized_columns(pd.DataFrame(cols))
     
-    def _process_old_folder_gcs(self, bucket, folder_name: str) -> List[Dict]:
-        """Process an old format folder from GCS."""
-        transactions = []
+    def _process_old_folder_gcs(self, bucket, folder_name: str, blobs: List) -> Tuple[pd.DataFrame, int]:
+        """Process an old format folder from GCS; returns its transactions and the number of files skipped on errors."""
+        cols = defaultdict(list)
+        skipped_files = 0
         
-        # List CSV files in the folder
-        blobs = bucket.list_blobs(prefix=f"raw_data/{folder_name}/") #prefix=f"{folder_name}/")
+        # CSV files in the folder
         csv_blobs = [blob for blob in blobs if blob.name.endswith('.csv')]
+        downloaded = self._download_blobs(csv_blobs)
         
         for blob in csv_blobs:
             filename = blob.name.split('/')[-1]
             schedule_type = self.extract_schedule_type(filename)
             
             if schedule_type in self.skip_schedules:
-                logger.info(f"    Skipping {filename} (summary/loan schedule)")
+                logger.info("    Skipping %s (summary/loan schedule)", filename)
                 continue
             
             if schedule_type not in self.transactional_schedules:
-                logger.info(f"    Skipping {filename} (unknown schedule type)")
+                logger.info("    Skipping %s (unknown schedule type)", filename)
                 continue
             
-            logger.info(f"    Processing {filename}")
+            logger.info("    Processing %s", filename)
             
             try:
-                # Download and process CSV with optimization
-                csv_data = blob.download_as_text(encoding='latin-1')
+                # Process downloaded CSV with optimization
+                csv_data = self._downloaded_text(downloaded, blob)
                 
                 # Apply universal quote fixing to ALL CSV data first
                 csv_data = csv_data.replace("\r\n", "\n").replace("\r", "\n")
@@ -483,58 +721,47 @@ class VirginiaDataProcessor:
                 csv_data = self._fix_embedded_quotes_universal(csv_data)
             
                 
-                df = pd.read_csv(
-                    io.StringIO(csv_data), 
-                    engine='c',  # Use faster C engine
-                    on_bad_lines="skip", 
-                    low_memory=False,
-                    skip_blank_lines=True,
-                    skipinitialspace=True,
-                    quotechar='"',
-                    doublequote=True,  # Handle embedded quotes properly
-                    escapechar=None
-                )
+                df = self._read_csv(csv_data, skipinitialspace=True)
+                
+                # Resolve column aliases once so the mapper sees one canonical name
+                df = df.rename(columns={alias: name for alias, name in OLD_ALIASES.items() if alias in df.columns})
+                df = df.loc[:, ~df.columns.duplicated()]
                 
-                # Drop NaN early so nothing gets concatenated
-                df = df.fillna("").replace("nan", "")
+                # Blank out missing text so nothing gets concatenated
+                df = self._fill_string_columns(df, OLD_SCHEDULE_STRING_COLS)
                 
-                # Optimize dtypes for better performance
-                for col in df.select_dtypes(['object']).columns:
-                    unique_ratio = df[col].nunique() / len(df) if len(df) > 0 else 0
-                    if unique_ratio < 0.5 and df[col].nunique() > 1:
-                        df[col] = df[col].astype('category')
-                for _, row in df.iterrows():
-                    transaction = self._map_old_row_to_transaction(row, folder_name, schedule_type)
-                    if transaction:
-                        transactions.append(transaction)
+                self._map_old_frame_to_transactions(df, folder_name, schedule_type, cols)
             except UnicodeDecodeError as e:
-                logger.warning(f"    Encoding error in {filename}: {e} - skipping file")
+                logger.warning("    Encoding error in %s: %s - skipping file", filename, e)
+                skipped_files += 1
                 continue
             except Exception as e:
                 if "EOF inside string" in str(e) or "Error tokenizing data" in str(e):
-                    logger.warning(f"    Quote parsing error in {filename}: {e} - skipping file")
-                    logger.warning(f"    This indicates embedded quotes that couldn't be automatically fixed")
+                    logger.warning("    Quote parsing error in %s: %s - skipping file", filename, e)
+                    logger.warning("    This indicates embedded quotes that couldn't be automatically fixed")
                 else:
-                    logger.warning(f"    Error processing {filename}: {e} - skipping file")
+                    logger.warning("    Error processing %s: %s - skipping file", filename, e)
+                skipped_files += 1
                 continue
         
-        return transactions
+        return self._add_normalized_columns(pd.DataFrame(cols)), skipped_files
     
-    def _process_new_folder_gcs(self, bucket, folder_name: str) -> Tuple[List[Dict], List[Dict]]:
-        """Process a new format folder from GCS."""
+    def _process_new_folder_gcs(self, bucket, folder_name: str, blobs: List) -> Tuple[List[Dict], pd.DataFrame, int]:
+        """Process a new format folder from GCS; returns its reports, transactions and the number of files skipped on errors."""
         reports = {}
-        transactions = []
+        cols = defaultdict(list)
+        skipped_files = 0
         
-        # List CSV files in the folder
-        blobs = list(bucket.list_blobs(prefix=f"raw_data/{folder_name}/"))#prefix=f"{folder_name}/"))
+        # CSV files in the folder
         csv_blobs = [blob for blob in blobs if blob.name.endswith('.csv')]
+        downloaded = self._download_blobs(csv_blobs)
         
         # First process Report.csv
         report_blob = next((blob for blob in csv_blobs if blob.name.endswith('Report.csv')), None)
         if report_blob:
-            logger.info(f"  Processing Report.csv")
+            logger.info("  Processing Report.csv")
             try:
-                csv_data = report_blob.download_as_text(encoding='latin-1')
+                csv_data = self._downloaded_text(downloaded, report_blob)
                 
                 # Apply universal quote fixing to ALL CSV data first
                 csv_data = csv_data.replace("\r\n", "\n").replace("\r", "\n")
@@ -553,56 +780,25 @@ class VirginiaDataProcessor:
                 elif folder_name == '2023_11':
                     csv_data = self._handle_encoding_2023_11(csv_data)'''
                 
-                df_report = pd.read_csv(
-                    io.StringIO(csv_data), 
-                    engine='c',
-                    on_bad_lines="skip", 
-                    low_memory=False,
-                    skip_blank_lines=True,
-                    skipinitialspace=True,
-                    quotechar='"',
-                    doublequote=True,  # Handle embedded quotes properly
-                    escapechar=None
-                )
+                df_report = self._read_csv(csv_data, skipinitialspace=True)
                 
-                # Drop NaN early so nothing gets concatenated
-                df_report = df_report.fillna("").replace("nan", "")
+                # Blank out missing text so nothing gets concatenated
+                df_report = self._fill_string_columns(df_report, REPORT_STRING_COLS)
                 
                 # Optimize dtypes for report data
                 for col in df_report.select_dtypes(['object']).columns:
                     unique_ratio = df_report[col].nunique() / len(df_report) if len(df_report) > 0 else 0
                     if unique_ratio < 0.5 and df_report[col].nunique() > 1:
                         df_report[col] = df_report[col].astype('category')
-                for _, row in df_report.iterrows():
-                    report_data = {
-                        'report_id': pd.to_numeric(row.get('ReportId'), errors='coerce'),
-                        'committee_code': row.get('CommitteeCode'),
-                        'committee_name': row.get('CommitteeName'),
-                        'candidate_name': row.get('CandidateName'),
-                        'report_year': pd.to_numeric(row.get('ReportYear'), errors='coerce'),
-                        'filing_date': row.get('FilingDate'),
-                        'start_date': row.get('StartDate'),
-                        'end_date': row.get('EndDate'),
-                        'party': row.get('Party'),
-                        'office_sought': row.get('OfficeSought'),
-                        'district': row.get('District'),
-                        'candidate_city': row.get('City'),
-                        'election_cycle': row.get('ElectionCycle'),
-                        'election_cycle_start_date': row.get('ElectionCycleStartDate'),
-                        'election_cycle_end_date': row.get('ElectionCycleEndDate'),
-                        'due_date': row.get('DueDate'),
-                        'amendment_count': pd.to_numeric(row.get('AmendmentCount'), errors='coerce'),
-                        'committee_type': row.get('CommitteeType'),
-                        'zip_code': row.get('ZipCode'),
-                        'submitted_date': row.get('SubmittedDate'),
-                        'data_source': 'new',
-                        'folder_name': folder_name
-                    }
-                    reports[row.get('ReportId')] = report_data
+                reports.update(self._report_records(df_report, folder_name))
             except UnicodeDecodeError as e:
-                logger.warning(f"  Encoding error in Report.csv for {folder_name}: {e} - skipping Report.csv")
+                logger.warning("  Encoding error in Report.csv for %s: %s - skipping Report.csv", folder_name, e)
+                skipped_files += 1
             except Exception as e:
-                logger.warning(f"  Error processing Report.csv for {folder_name}: {e} - skipping Report.csv")
+                logger.warning("  Error processing Report.csv for %s: %s - skipping Report.csv", folder_name, e)
+                skipped_files += 1
+        
+        reports_df = self._build_reports_frame(reports)
         
         # Process transactional schedules
         for blob in csv_blobs:
@@ -613,17 +809,17 @@ class VirginiaDataProcessor:
             schedule_type = self.extract_schedule_type(filename)
             
             if schedule_type in self.skip_schedules:
-                logger.info(f"    Skipping {filename} (summary/loan schedule)")
+                logger.info("    Skipping %s (summary/loan schedule)", filename)
                 continue
             
             if schedule_type not in self.transactional_schedules:
-                logger.info(f"    Skipping {filename} (unknown schedule type)")
+                logger.info("    Skipping %s (unknown schedule type)", filename)
                 continue
             
-            logger.info(f"    Processing {filename}")
+            logger.info("    Processing %s", filename)
             
             try:
-                csv_data = blob.download_as_text(encoding='latin-1')
+                csv_data = self._downloaded_text(downloaded, blob)
                 
                 # Apply universal quote fixing to ALL CSV data first
                 csv_data = csv_data.replace("\r\n", "\n").replace("\r", "\n")
@@ -642,485 +838,692 @@ class VirginiaDataProcessor:
                 elif folder_name == '2023_11':
                     csv_data = self._handle_encoding_2023_11(csv_data)'''
                 
-                df = pd.read_csv(
-                    io.StringIO(csv_data), 
-                    engine='c',
-                    on_bad_lines="skip",
-                    low_memory=False,
-                    skip_blank_lines=True,
-                    skipinitialspace=True,
-                    quotechar='"',
-                    doublequote=True,  # Handle embedded quotes properly
-                    escapechar=None
-                )
+                df = self._read_csv(csv_data, skipinitialspace=True)
                 
-                # Drop NaN early so nothing gets concatenated
-                df = df.fillna("").replace("nan", "")
+                # Blank out missing text so nothing gets concatenated
+                df = self._fill_string_columns(df, NEW_SCHEDULE_STRING_COLS)
                 
-                # Optimize dtypes
-                for col in df.select_dtypes(['object']).columns:
-                    unique_ratio = df[col].nunique() / len(df) if len(df) > 0 else 0
-                    if unique_ratio < 0.5 and df[col].nunique() > 1:
-                        df[col] = df[col].astype('category')
-                for _, row in df.iterrows():
-                    transaction = self._map_new_row_to_transaction(row, folder_name, schedule_type, reports)
-                    if transaction:
-                        transactions.append(transaction)
+                df = self._merge_report_info(df, reports_df)
+                self._map_new_frame_to_transactions(df, folder_name, schedule_type, cols)
             except UnicodeDecodeError as e:
-                logger.warning(f"    Encoding error in {filename}: {e} - skipping file")
+                logger.warning("    Encoding error in %s: %s - skipping file", filename, e)
+                skipped_files += 1
                 continue
             except Exception as e:
                 if "EOF inside string" in str(e) or "Error tokenizing data" in str(e):
-                    logger.warning(f"    Quote parsing error in {filename}: {e} - skipping file")
-                    logger.warning(f"    This indicates embedded quotes that couldn't be automatically fixed")
+                    logger.warning("    Quote parsing error in %s: %s - skipping file", filename, e)
+                    logger.warning("    This indicates embedded quotes that couldn't be automatically fixed")
                 else:
-                    logger.warning(f"    Error processing {filename}: {e} - skipping file")
+                    logger.warning("    Error processing %s: %s - skipping file", filename, e)
+                skipped_files += 1
                 continue
         
-        return list(reports.values()), transactions
+        return list(reports.values()), self._add_normalized_columns(pd.DataFrame(cols)), skipped_files
     
-    def _map_old_row_to_transaction(self, row: pd.Series, folder_name: str, schedule_type: str) -> Optional[Dict]:
-        """Map old format row to transaction dictionary."""
-        # Extract amount - try different column names, allow $0 transactions
-        amount = 0.0  # Default to 0 if no amount found
-        amount_fields = ['Trans Amount', 'TRANS_AMNT', 'Trans_Amount']
-        for field in amount_fields:
-            if field in row and pd.notna(row[field]):
-                raw_amount = str(row[field]).strip()
-                if raw_amount != '':
-                    try:
-                        # Clean common formatting issues
-                        cleaned_amount = raw_amount.replace('$', '').replace(',', '').replace('(', '-').replace(')', '')
-                        
-                        # Handle negative amounts in parentheses format
-                        if raw_amount.strip().startswith('(') and raw_amount.strip().endswith(')'):
-                            cleaned_amount = '-' + raw_amount.strip()[1:-1].replace('$', '').replace(',', '')
-                        
-                        amount = float(cleaned_amount)
-                        break
-                    except (ValueError, TypeError):
-                        # Log parsing error for debugging
-                        logger.warning(f"Failed to parse amount '{raw_amount}' in field '{field}' for transaction")
-                        continue
+    def _read_csv(self, text: str, skipinitialspace: bool = False) -> pd.DataFrame:
+        """Parse CSV text with pyarrow's multithreaded reader, falling back to the pandas C parser."""
+        try:
+            return self._read_csv_arrow(text, skipinitialspace)
+        except (pa.ArrowInvalid, ValueError) as e:
+            logger.debug("    pyarrow CSV reader fell back to pandas: %s", e)
+        
+        return pd.read_csv(
+            io.StringIO(text),
+            engine='c',
+            on_bad_lines="skip",
+            low_memory=False,
+            skip_blank_lines=True,
+            skipinitialspace=skipinitialspace,
+            quotechar='"',
+            doublequote=True,  # Handle embedded quotes properly
+            escapechar=None
+        )
+    
+    def _read_csv_arrow(self, text: str, skipinitialspace: bool) -> pd.DataFrame:
+        """
+        Parse CSV text with pyarrow against an explicit all-text schema, matching pd.read_csv's result.
         
-        # Don't filter out transactions - even $0 transactions are valid
+        Raises ValueError (or ArrowInvalid) for input only the pandas parser handles the same way:
+        blank, unnamed or duplicate headers, rows with the wrong field count, or (with
+        skipinitialspace) fields starting with whitespace, which pyarrow cannot skip.
+        """
+        if skipinitialspace and CSV_INITIAL_SPACE_PATTERN.search(text):
+            raise ValueError("fields start with whitespace")
+        
+        header = next(csv.reader(io.StringIO(text)), [])
+        if not header or '' in header or len(set(header)) != len(header):
+            raise ValueError("header needs pandas handling")
+        
+        table = pv.read_csv(
+            io.BytesIO(text.encode('utf-8')),
+            read_options=pv.ReadOptions(use_threads=True, block_size=16 << 20, column_names=header, skip_rows=1),
+            parse_options=pv.ParseOptions(newlines_in_values=True),
+            convert_options=pv.ConvertOptions(
+                column_types={name: pa.string() for name in header},
+                null_values=[], strings_can_be_null=False, quoted_strings_can_be_null=False
+            )
+        )
         
-        # Extract and normalize names
-        candidate_name = self._extract_candidate_name_old(row)
-        entity_name = self._extract_entity_name_old(row)
+        # Missing-value markers become nulls, then non-text columns get pandas-style inference
+        na_values = pa.array(CSV_NA_VALUES)
+        columns = []
+        for name, values in zip(header, table.columns):
+            values = pc.if_else(pc.is_in(values, value_set=na_values), pa.scalar(None, pa.string()), values)
+            if name not in CSV_TEXT_COLUMNS and table.num_rows:
+                values = self._infer_csv_column(values)
+            columns.append(values)
         
-        # Get office sought and district for new columns
-        office_sought = row.get('Office Code') or row.get('OFFICE_CODE')
-        district = row.get('Office Sub Code') or row.get('OFFICE_SUB_CODE')
-        office_sought_normal = normalize_office_sought(office_sought)
-        level = determine_government_level(office_sought_normal, district)
-        district_normal = normalize_district(district, level=level, office_sought=office_sought)
+        return pa.table(columns, names=header).to_pandas()
+    
+    def _infer_csv_column(self, values: pa.ChunkedArray) -> pa.ChunkedArray:
+        """Type a text column as pd.read_csv would: int64 (float64 with nulls), float64, bool, else text."""
+        present = values.length() - values.null_count
         
-        return {
-            'report_id': pd.to_numeric(row.get('Committee Code') or row.get('COMMITTEE_CODE'), errors='coerce'),
-            'committee_code': row.get('Committee Code') or row.get('COMMITTEE_CODE'),
-            'committee_name': row.get('Committee Name') or row.get('COMMITTEE_NAME'),
-            'committee_name_normalized': normalize_name(row.get('Committee Name') or row.get('COMMITTEE_NAME'), is_individual=False),
-            'candidate_name': candidate_name,
-            'candidate_name_normalized': normalize_name(candidate_name, is_individual=True),
-            'report_year': pd.to_numeric(row.get('Report Year') or row.get('REPORT_YEAR') or folder_name, errors='coerce'),
-            'report_date': row.get('Date Received') or row.get('DATE_RECEIVED'),
-            'party': row.get('Party') or row.get('Party_Desc'),
-            'office_sought': office_sought,
-            'office_sought_normal': office_sought_normal,
-            'district': district,
-            'district_normal': district_normal,
-            'level': level,
-            'schedule_type': schedule_type,
-            'transaction_date': row.get('Trans Date') or row.get('TRANS_DATE'),
-            'amount': amount,
-            'total_to_date': pd.to_numeric(row.get('Trans Agg To Date') or row.get('TRANS_AGG_TO_DATE'), errors='coerce'),
-            'entity_name': entity_name,
-            'entity_name_normalized': normalize_name(entity_name, is_individual=None),
-            'entity_first_name': row.get('First Name') or row.get('FIRSTNAME'),
-            'entity_last_name': row.get('Last Name') or row.get('LASTNAME'),
-            'entity_address': row.get('Entity Address') or row.get('ENTITY_ADDRESS'),
-            'entity_city': row.get('Entity City') or row.get('ENTITY_CITY'),
-            'entity_state': row.get('Entity State') or row.get('ENTITY_STATE'),
-            'entity_zip': row.get('Entity Zip') or row.get('ENTITY_ZIP'),
-            'entity_employer': row.get('Entity Employer') or row.get('ENTITY_EMPLOYER'),
-            'entity_occupation': row.get('Entity Occupation') or row.get('ENTITY_OCCUPATION'),
-            'entity_is_individual': None,  # Not available in old format
-            'transaction_type': row.get('Trans Type') or row.get('TRANS_TYPE'),
-            'purpose': row.get('Trans Service Or Goods') or row.get('TRANS_ITEM_OR_SERVICE'),
-            'committee_type': None,  # Not available in old format
-            'zip_code': None,  # Not available in old format
-            'submitted_date': None,  # Not available in old format
-            'due_date': None,  # Not available in old format
-            'amendment_count': None,  # Not available in old format
-            'data_source': 'old',
-            'folder_name': folder_name,
-            'onTime': self._determine_on_time_status(
-                row.get('Trans Date') or row.get('TRANS_DATE'),
-                row.get('Date Received') or row.get('DATE_RECEIVED'),
-                None,  # election_cycle not available in old format
-                row.get('Report Year') or row.get('REPORT_YEAR') or folder_name
+        # The pandas parser accepts whitespace around numbers
+        trimmed = pc.utf8_trim_whitespace(values)
+        for numeric_type in ([pa.int64()] if present == values.length() else []) + [pa.float64()]:
+            try:
+                return pc.cast(trimmed, numeric_type)
+            except (pa.ArrowInvalid, pa.ArrowNotImplementedError):
+                continue
+        
+        if present and pc.all(pc.is_in(values.drop_null(), value_set=pa.array(list(CSV_BOOL_VALUES)))).as_py():
+            flags = pc.is_in(values, value_set=pa.array([text for text, flag in CSV_BOOL_VALUES.items() if flag]))
+            return pc.if_else(pc.is_valid(values), flags, pa.scalar(None, pa.bool_()))
+        return values
+    
+    def _download_blobs(self, csv_blobs: List) -> Dict[str, object]:
+        """Download the folder's processable CSVs, concurrently when transfer_manager is available.
+        
+        Returns a dict of blob name -> bytes, or the exception raised while downloading it.
+        """
+        wanted = [
+            blob for blob in csv_blobs
+            if blob.name.split('/')[-1].lower() == 'report.csv'
+            or self.extract_schedule_type(blob.name.split('/')[-1]) in self.transactional_schedules
+        ]
+        buffers = [(blob, io.BytesIO()) for blob in wanted]
+        
+        if TRANSFER_MANAGER_AVAILABLE:
+            results = transfer_manager.download_many(
+                buffers,
+                max_workers=self.download_workers,
+                worker_type=transfer_manager.THREAD,
+                raise_exception=False
             )
+        else:
+            results = []
+            for blob, buffer in buffers:
+                try:
+                    blob.download_to_file(buffer)
+                    results.append(None)
+                except Exception as e:
+                    results.append(e)
+        
+        return {
+            blob.name: result if isinstance(result, Exception) else buffer.getvalue()
+            for (blob, buffer), result in zip(buffers, results)
         }
     
-    def _map_new_row_to_transaction(self, row: pd.Series, folder_name: str, schedule_type: str, reports: Dict) -> Optional[Dict]:
-        """Map new format row to transaction dictionary."""
+    def _downloaded_text(self, downloaded: Dict[str, object], blob) -> str:
+        """Decode a downloaded blob, re-raising its download error if it failed."""
+        data = downloaded[blob.name]
+        if isinstance(data, Exception):
+            raise data
+        return data.decode('latin-1')
+    
+    def _map_old_frame_to_transactions(self, df: pd.DataFrame, folder_name: str, schedule_type: str, cols: Dict[str, List]) -> None:
+        """Map an alias-resolved old format frame onto the per-column transaction buffers."""
+        # Extract amount, allow $0 transactions
+        amounts = self._parse_amount_column(self._optional_column(df, 'trans_amount'), "field 'trans_amount'")
+        
+        # Numeric report year keeps NaN, so fall back to the folder explicitly
+        report_years = self._optional_column(df, 'report_year')
+        report_years = report_years.where(report_years.notna() & (report_years != ''), folder_name)
+        
+        committee_code = self._optional_column(df, 'committee_code')
+        trans_date = self._optional_column(df, 'trans_date')
+        date_received = self._optional_column(df, 'date_received')
+        
+        cols['report_id'].extend(pd.to_numeric(committee_code, errors='coerce'))
+        cols['committee_code'].extend(committee_code)
+        cols['committee_name'].extend(self._optional_column(df, 'committee_name'))
+        cols['candidate_name'].extend(self._build_candidate_name_vec(df))
+        cols['report_year'].extend(pd.to_numeric(report_years, errors='coerce'))
+        cols['report_date'].extend(date_received)
+        cols['party'].extend(self._optional_column(df, 'party'))
+        # Office sought and district are normalized later over the whole frame
+        cols['office_sought'].extend(self._optional_column(df, 'office_code'))
+        cols['district'].extend(self._optional_column(df, 'office_sub_code'))
+        cols['schedule_type'].extend([schedule_type] * len(df))
+        cols['transaction_date'].extend(trans_date)
+        cols['amount'].extend(amounts)
+        cols['total_to_date'].extend(pd.to_numeric(self._optional_column(df, 'trans_agg_to_date'), errors='coerce'))
+        cols['entity_name'].extend(self._build_entity_name_vec(df, old_format=True))
+        cols['entity_first_name'].extend(self._optional_column(df, 'first_name'))
+        cols['entity_last_name'].extend(self._optional_column(df, 'last_name'))
+        for field in ['entity_address', 'entity_city', 'entity_state', 'entity_zip', 'entity_employer', 'entity_occupation']:
+            cols[field].extend(self._optional_column(df, field))
+        cols['transaction_type'].extend(self._optional_column(df, 'trans_type'))
+        cols['purpose'].extend(self._optional_column(df, 'trans_service_or_goods'))
+        # Not available in old format
+        for field in ['entity_is_individual', 'committee_type', 'zip_code', 'submitted_date', 'due_date', 'amendment_count']:
+            cols[field].extend([None] * len(df))
+        cols['data_source'].extend(['old'] * len(df))
+        cols['folder_name'].extend([folder_name] * len(df))
+        # election_cycle not available in old format
+        cols['onTime'].extend(self._on_time_status_vec(trans_date, date_received, None, report_years))
+    
+    def _optional_column(self, df: pd.DataFrame, name: str) -> pd.Series:
+        """Return a column as objects, or all None if the column is absent."""
+        if name not in df.columns:
+            return pd.Series(None, index=df.index, dtype=object)
+        return df[name].astype(object)
+    
+    def _parse_amount_column(self, values: pd.Series, source: str) -> pd.Series:
+        """Parse a raw amount column to floats, with 0 for missing or unparseable amounts."""
+        if pd.api.types.is_numeric_dtype(values):
+            return values.astype(float).fillna(0.0)
+        
+        raw_amounts = values.astype(object).fillna('').astype(str).str.strip()
+        
+        # Clean common formatting issues
+        cleaned = raw_amounts.str.replace(r'[$,)]', '', regex=True).str.replace('(', '-', regex=False)
+        
+        # Handle negative amounts in parentheses format
+        in_parens = raw_amounts.str.startswith('(') & raw_amounts.str.endswith(')')
+        cleaned = cleaned.where(~in_parens, '-' + raw_amounts.str[1:-1].str.replace(r'[$,]', '', regex=True))
+        
+        amounts = pd.to_numeric(cleaned, errors='coerce')
+        
+        # Summarize parsing errors once per file, listing each value only at debug level;
+        # keep the transaction with 0 amount rather than filtering it out
+        unparsed = raw_amounts[amounts.isna() & (raw_amounts != '')]
+        if not unparsed.empty:
+            logger.warning("Failed to parse %s amounts in %s - using 0", len(unparsed), source)
+            if logger.isEnabledFor(logging.DEBUG):
+                for raw_amount in unparsed:
+                    logger.debug("Failed to parse amount '%s' in %s for transaction", raw_amount, source)
+        return amounts.fillna(0.0)
+    
+    def _first_truthy_column(self, df: pd.DataFrame, *names: str) -> pd.Series:
+        """Return the first non-empty value across alternative columns, else the last column's value."""
+        result = self._optional_column(df, names[-1])
+        for name in reversed(names[:-1]):
+            values = self._optional_column(df, name)
+            result = values.where(values.notna() & (values != ''), result)
+        return result
+    
+    def _bool_column(self, values: pd.Series) -> pd.Series:
+        """Convert a column to True/False, with None for missing or non-numeric values."""
+        numeric = pd.to_numeric(values.astype(object).where(values.notna() & (values != ''), None), errors='coerce')
+        return numeric.ne(0).astype(object).where(numeric.notna(), None)
+    
+    def _map_new_frame_to_transactions(self, df: pd.DataFrame, folder_name: str, schedule_type: str, cols: Dict[str, List]) -> None:
+        """Map a new format frame (already merged with its report fields) onto the per-column transaction buffers."""
         # Extract amount, allowing $0 transactions
-        amount = 0.0  # Default to 0 if no amount found
-        amount_value = row.get('Amount', 0)
-        if pd.notna(amount_value):
-            raw_amount = str(amount_value).strip()
-            if raw_amount != '':
-                try:
-                    # Clean common formatting issues
-                    cleaned_amount = raw_amount.replace('$', '').replace(',', '').replace('(', '-').replace(')', '')
-                    
-                    # Handle negative amounts in parentheses format
-                    if raw_amount.strip().startswith('(') and raw_amount.strip().endswith(')'):
-                        cleaned_amount = '-' + raw_amount.strip()[1:-1].replace('$', '').replace(',', '')
-                    
-                    amount = float(cleaned_amount)
-                except (ValueError, TypeError):
-                    # Log parsing error for debugging
-                    logger.warning(f"Failed to parse amount '{raw_amount}' in Amount field for ReportId {row.get('ReportId', 'unknown')}")
-                    # Keep the transaction but with 0 amount rather than filtering it out
-                    amount = 0.0
+        amounts = self._parse_amount_column(self._optional_column(df, 'Amount'), 'Amount field')
+        
+        self._extend_report_columns(df, cols)
+        cols['report_id'].extend(df['ReportId'])
+        cols['schedule_type'].extend([schedule_type] * len(df))
+        cols['transaction_date'].extend(self._optional_column(df, 'TransactionDate'))
+        cols['amount'].extend(amounts)
+        cols['total_to_date'].extend(pd.to_numeric(self._optional_column(df, 'TotalToDate'), errors='coerce'))
+        cols['entity_name'].extend(self._build_entity_name_vec(df))
+        cols['entity_first_name'].extend(self._optional_column(df, 'FirstName'))
+        cols['entity_last_name'].extend(self._optional_column(df, 'LastOrCompanyName'))
+        cols['entity_address'].extend(self._optional_column(df, 'AddressLine1'))
+        cols['entity_city'].extend(self._optional_column(df, 'City'))
+        cols['entity_state'].extend(self._optional_column(df, 'StateCode'))
+        cols['entity_zip'].extend(self._optional_column(df, 'ZipCode'))
+        cols['entity_employer'].extend(self._optional_column(df, 'NameOfEmployer'))
+        cols['entity_occupation'].extend(self._optional_column(df, 'OccupationOrTypeOfBusiness'))
+        cols['entity_is_individual'].extend(self._bool_column(self._optional_column(df, 'IsIndividual')))
+        cols['transaction_type'].extend([schedule_type] * len(df))
+        cols['purpose'].extend(self._first_truthy_column(df, 'ItemOrService', 'ProductOrService', 'PurposeOfObligation'))
+        cols['data_source'].extend(['new'] * len(df))
+        cols['folder_name'].extend([folder_name] * len(df))
+        cols['onTime'].extend(self._on_time_status_vec(
+            self._optional_column(df, 'TransactionDate'), df['filing_date'], df['election_cycle'], df['report_year']
+        ))
+    
+    def _fix_column_types(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Fix column types for BigQuery compatibility."""
+        if df.empty:
+            return df
         
-        # Don't filter out transactions - even $0 transactions are valid
+        # Fix entity_is_individual column type (should be bool)
+        if 'entity_is_individual' in df.columns:
+            df['entity_is_individual'] = df['entity_is_individual'].astype('boolean')
         
-        report_info = reports.get(row.get('ReportId'), {})
+        # Fix onTime column type (should be int 0/1)  
+        if 'onTime' in df.columns:
+            # Convert boolean-like values to 0/1 integers
+            df['onTime'] = df['onTime'].map(
+                lambda x: 1 if x is True or x == 1 or str(x).lower() in ['true', '1', 'yes'] 
+                else 0 if x is False or x == 0 or str(x).lower() in ['false', '0', 'no'] 
+                else None
+            ).astype('Int64')  # Nullable integer type
         
-        # Debug logging for missing reports (only log each report ID once)
-        report_id = row.get('ReportId')
-        if not report_info and report_id and report_id not in self.logged_missing_reports:
-            logger.warning(f"Schedule A/E record found but no matching Report.csv entry for ReportId: {report_id}")
-            self.logged_missing_reports.add(report_id)
-        
-        entity_name = self._build_entity_name_new(row)
-        
-        # Get office sought and district for new columns
-        office_sought = report_info.get('office_sought')
-        district = report_info.get('district')
-        candidate_city = report_info.get('candidate_city')
-        election_cycle = report_info.get('election_cycle')
-        office_sought_normal = normalize_office_sought(office_sought)
-        level = determine_government_level(office_sought_normal, district)
-        district_normal = normalize_district(district, candidate_city, level, office_sought)
-        primary_or_general = determine_primary_or_general(election_cycle)
+        if 'entity_zip' in df.columns:
+            df['entity_zip'] = df['entity_zip'].astype(str)
         
-        return {
-            'report_id': pd.to_numeric(row.get('ReportId'), errors='coerce'),
-            'committee_code': report_info.get('committee_code'),
-            'committee_name': report_info.get('committee_name'),
-            'committee_name_normalized': normalize_name(report_info.get('committee_name'), is_individual=False),
-            'candidate_name': report_info.get('candidate_name'),
-            'candidate_name_normalized': normalize_name(report_info.get('candidate_name'), is_individual=True),
-            'report_year': report_info.get('report_year'),
-            'report_date': report_info.get('filing_date'),
-            'party': report_info.get('party'),
-            'office_sought': office_sought,
-            'office_sought_normal': office_sought_normal,
-            'district': district,
-            'district_normal': district_normal,
-            'level': level,
-            'candidate_city': candidate_city,
-            'election_cycle': election_cycle,
-            'primary_or_general': primary_or_general,
-            'election_cycle_start_date': report_info.get('election_cycle_start_date'),
-            'election_cycle_end_date': report_info.get('election_cycle_end_date'),
-            'schedule_type': schedule_type,
-            'transaction_date': row.get('TransactionDate'),
-            'amount': amount,
-            'total_to_date': pd.to_numeric(row.get('TotalToDate'), errors='coerce'),
-            'entity_name': entity_name,
-            'entity_name_normalized': normalize_name(entity_name, is_individual=self._safe_bool_convert(row.get('IsIndividual'))),
-            'entity_first_name': row.get('FirstName'),
-            'entity_last_name': row.get('LastOrCompanyName'),
-            'entity_address': row.get('AddressLine1'),
-            'entity_city': row.get('City'),
-            'entity_state': row.get('StateCode'),
-            'entity_zip': row.get('ZipCode'),
-            'entity_employer': row.get('NameOfEmployer'),
-            'entity_occupation': row.get('OccupationOrTypeOfBusiness'),
-            'entity_is_individual': self._safe_bool_convert(row.get('IsIndividual')),
-            'transaction_type': schedule_type,
-            'purpose': row.get('ItemOrService') or row.get('ProductOrService') or row.get('PurposeOfObligation'),
-            'committee_type': report_info.get('committee_type'),
-            'zip_code': report_info.get('zip_code'),
-            'submitted_date': report_info.get('submitted_date'),
-            'due_date': report_info.get('due_date'),
-            'amendment_count': report_info.get('amendment_count'),
-            'data_source': 'new',
-            'folder_name': folder_name,
-            'onTime': self._determine_on_time_status(
-                row.get('TransactionDate'),
-                report_info.get('filing_date'),
-                election_cycle,
-                report_info.get('report_year')
-            )
+        if 'purpose' in df.columns:
+            df['purpose'] = df['purpose'].astype(str)
+        
+        return df
+    
+    def _compact_dtypes(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Hold low-cardinality text as categoricals and downcast report_year to reduce memory."""
+        if df.empty:
+            return df
+        
+        for col in CATEGORICAL_COLUMNS:
+            if col in df.columns:
+                df[col] = df[col].astype('category')
+        
+        # Stays float when a year is missing; amounts keep float64 so cents are exact
+        if 'report_year' in df.columns:
+            df['report_year'] = pd.to_numeric(df['report_year'], downcast='integer')
+        
+        return df
+    
+    @staticmethod
+    def _to_arrow_table(df: pd.DataFrame) -> pa.Table:
+        """Convert typed transactions to an Arrow table conforming to TRANSACTION_SCHEMA."""
+        string_fields = [field.name for field in TRANSACTION_SCHEMA if pa.types.is_string(field.type)]
+        return pa.Table.from_pandas(
+            df.astype({name: 'string' for name in string_fields}),
+            schema=TRANSACTION_SCHEMA,
+            preserve_index=False
+        )
+    
+    def _write_parquet_blob(self, bucket, blob_name: str, df: pd.DataFrame) -> Tuple[pd.DataFrame, str]:
+        """Fix types for transactions and write them to a GCS blob as Parquet; returns the typed frame and its URI."""
+        # Every staged file carries the full column set and the fixed schema so the load job sees one schema
+        df = self._fix_column_types(df.reindex(columns=TRANSACTION_COLUMNS))
+        
+        buffer = io.BytesIO()
+        pq.write_table(self._to_arrow_table(df), buffer, compression='snappy')
+        bucket.blob(blob_name).upload_from_file(buffer, rewind=True, content_type='application/octet-stream')
+        return df, f"gs://{self.bucket_name}/{blob_name}"
+    
+    def _stage_folder_parquet(self, bucket, folder_name: str, df: pd.DataFrame) -> Tuple[pd.DataFrame, Optional[str]]:
+        """Fix types for a folder's transactions and stage them in GCS as Parquet; returns the frame and its URI."""
+        if df.empty:
+            return df, None
+        
+        df, uri = self._write_parquet_blob(bucket, f"staging/{folder_name}.parquet", df)
+        logger.info("  Staged %s transactions to %s", len(df), uri)
+        
+        return df, uri
+    
+    def _folder_etag_hash(self, blobs: List) -> str:
+        """Fingerprint a folder's raw CSVs by their names and ETags, plus the cache version and staged schema."""
+        etags = sorted(f"{blob.name}:{blob.etag}" for blob in blobs if blob.name.endswith('.csv'))
+        fingerprint = [f"cache_version:{CACHE_VERSION}", str(TRANSACTION_SCHEMA)] + etags
+        return hashlib.sha1('\n'.join(fingerprint).encode()).hexdigest()
+    
+    def _load_cache_manifest(self, bucket) -> Dict:
+        """Load the staged-folder manifest from GCS, or an empty one if caching is off or it is missing."""
+        if not self.use_cache:
+            return {}
+        try:
+            blob = bucket.blob(CACHE_MANIFEST_BLOB)
+            if not blob.exists():
+                return {}
+            return json.loads(blob.download_as_text())
+        except Exception as e:
+            logger.warning("Could not read cache manifest %s: %s - reprocessing all folders", CACHE_MANIFEST_BLOB, e)
+            return {}
+    
+    def _save_cache_manifest(self, bucket, manifest: Dict) -> None:
+        """Write the manifest back in a single object upload."""
+        try:
+            bucket.blob(CACHE_MANIFEST_BLOB).upload_from_string(json.dumps(manifest, indent=2, sort_keys=True), content_type='application/json')
+        except Exception as e:
+            logger.warning("Could not write cache manifest %s: %s", CACHE_MANIFEST_BLOB, e)
+    
+    def _load_cached_folder(self, bucket, folder_name: str, manifest: Dict, etag_hash: str) -> Optional[pd.DataFrame]:
+        """Reuse a folder's staged Parquet when its raw CSVs are unchanged since it was staged."""
+        entry = manifest.get(folder_name)
+        if (not self.use_cache or not entry or entry.get('cache_version') != CACHE_VERSION
+                or entry.get('etag_hash') != etag_hash):
+            return None
+        
+        blob_name = entry['path'].split(f"gs://{self.bucket_name}/", 1)[-1]
+        try:
+            df = pd.read_parquet(io.BytesIO(bucket.blob(blob_name).download_as_bytes()))
+        except Exception as e:
+            logger.warning("Cached Parquet for %s unreadable: %s - reprocessing", folder_name, e)
+            return None
+        
+        self.staged_uris.append(entry['path'])
+        logger.info("Folder %s unchanged - reusing %s staged transactions from %s", folder_name, len(df), entry['path'])
+        return df
+    
+    def _record_cached_folder(self, manifest: Dict, folder_name: str, etag_hash: str, df: pd.DataFrame) -> None:
+        """Record a freshly staged folder in the manifest."""
+        if df.empty:
+            manifest.pop(folder_name, None)
+            return
+        manifest[folder_name] = {
+            'cache_version': CACHE_VERSION,
+            'etag_hash': etag_hash,
+            'rows': len(df),
+            'path': f"gs://{self.bucket_name}/staging/{folder_name}.parquet"
         }
     
-    def _extract_candidate_name_old(self, row: pd.Series) -> str:
-        """Extract candidate name from old format row."""
-        first_name = str(row.get('First Name') or row.get('FIRSTNAME') or '').strip()
-        last_name = str(row.get('Last Name') or row.get('LASTNAME') or '').strip()
-        middle_name = str(row.get('Middle Name') or row.get('MIDDLENAME') or '').strip()
-        
-        if first_name and last_name:
-            name_parts = [first_name, middle_name, last_name]
-            return ' '.join(part for part in name_parts if part).strip()
-        
-        # Fall back to committee name
-        return str(row.get('Committee Name') or row.get('COMMITTEE_NAME') or '').strip()
+    def _report_records(self, df_report: pd.DataFrame, folder_name: str) -> Dict:
+        """Convert Report.csv rows to report dicts keyed by raw ReportId, later rows winning."""
+        fields = {}
+        for field, column in REPORT_CSV_FIELDS.items():
+            if column not in df_report.columns:
+                fields[field] = None
+            elif field in REPORT_NUMERIC_FIELDS:
+                fields[field] = pd.to_numeric(df_report[column].astype(object), errors='coerce')
+            else:
+                fields[field] = df_report[column]
+        fields['data_source'] = 'new'
+        fields['folder_name'] = folder_name
+        
+        # One columnar conversion instead of a Series per row
+        records = pd.DataFrame(fields, index=df_report.index).to_dict('records')
+        report_ids = df_report['ReportId'].tolist() if 'ReportId' in df_report.columns else [None] * len(df_report)
+        return dict(zip(report_ids, records))
     
-    def _extract_entity_name_old(self, row: pd.Series) -> str:
-        """Extract entity name from old format row."""
-        entity_name = str(row.get('Entity Name') or row.get('ENTITY_NAME') or '').strip()
-        if entity_name:
-            return entity_name
-        
-        # Build from name parts
-        first_name = str(row.get('First Name') or row.get('FIRSTNAME') or '').strip()
-        last_name = str(row.get('Last Name') or row.get('LASTNAME') or '').strip()
-        middle_name = str(row.get('Middle Name') or row.get('MIDDLENAME') or '').strip()
-        
-        if first_name or last_name:
-            name_parts = [first_name, middle_name, last_name]
-            return ' '.join(part for part in name_parts if part).strip()
-        
-        return ''
+    def _build_reports_frame(self, reports: Dict) -> pd.DataFrame:
+        """Build a Report.csv lookup frame keyed by numeric ReportId."""
+        reports_df = pd.DataFrame(list(reports.values()), columns=['report_id', *REPORT_TRANSACTION_FIELDS.values()])
+        reports_df = reports_df.rename(columns={'report_id': 'ReportId'}).dropna(subset=['ReportId'])
+        return reports_df.drop_duplicates(subset='ReportId', keep='last')
     
-    def _build_entity_name_new(self, row: pd.Series) -> str:
-        """Build entity name from new format row."""
-        last_or_company = str(row.get('LastOrCompanyName') or '').strip()
-        if last_or_company:
-            first_name = str(row.get('FirstName') or '').strip()
-            middle_name = str(row.get('MiddleName') or '').strip()
-            
-            if first_name:
-                name_parts = [first_name, middle_name, last_or_company]
-                return ' '.join(part for part in name_parts if part).strip()
-            return last_or_company
-        return ''
+    def _merge_report_info(self, df: pd.DataFrame, reports_df: pd.DataFrame) -> pd.DataFrame:
+        """Left-join report fields onto a schedule frame and log ReportIds with no Report.csv entry."""
+        df = df.assign(ReportId=pd.to_numeric(df['ReportId'], errors='coerce')) if 'ReportId' in df.columns else df.assign(ReportId=np.nan)
+        merged = df.merge(reports_df, on='ReportId', how='left', indicator=True)
+        
+        # Debug logging for missing reports (only log each report ID once)
+        missing_ids = merged.loc[merged['_merge'] == 'left_only', 'ReportId'].dropna().unique()
+        for report_id in missing_ids:
+            if report_id not in self.logged_missing_reports:
+                logger.warning("Schedule A/E record found but no matching Report.csv entry for ReportId: %s", report_id)
+                self.logged_missing_reports.add(report_id)
+        
+        return merged.drop(columns='_merge')
     
+    def _extend_report_columns(self, df: pd.DataFrame, cols: Dict[str, List]) -> None:
+        """Append the merged report fields of a schedule frame to the transaction buffers."""
+        for column, field in REPORT_TRANSACTION_FIELDS.items():
+            cols[column].extend(df[field])
     
+    def _fill_string_columns(self, df: pd.DataFrame, string_cols: List[str]) -> pd.DataFrame:
+        """Cast the schema's text columns to string dtype with missing values as ''."""
+        present = [col for col in string_cols if col in df.columns]
+        if present:
+            df[present] = df[present].astype('string').fillna('')
+        return df
     
+    def _add_normalized_columns(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Compute normalized name, office, level and district columns over the whole frame."""
+        if df.empty:
+            return df
+        
+        # Level and district only depend on office, district and city, so prepare each distinct combination once
+        # and evaluate both over those instead of converting the same strings row by row
+        inputs = pd.DataFrame({
+            'district': df['district'], 'candidate_city': df.get('candidate_city'), 'office_sought': df['office_sought']
+        }, index=df.index).astype(object)
+        group_ids = inputs.groupby(list(inputs.columns), dropna=False, sort=False).ngroup().to_numpy()
+        unique_inputs = inputs[~pd.Series(group_ids).duplicated().to_numpy()].reset_index(drop=True)
+        
+        office_sought_normal = normalize_office_sought_series(unique_inputs['office_sought'])
+        level = determine_government_level_series(office_sought_normal, unique_inputs['district'])
+        districts = normalize_district_series(
+            unique_inputs['district'], unique_inputs['candidate_city'], level,
+            unique_inputs['office_sought'], office_sought_normal
+        )
+        
+        # Add every derived column in one step
+        derived = {
+            'committee_name_normalized': normalize_name_series(df['committee_name'], is_individual=False),
+            'candidate_name_normalized': normalize_name_series(df['candidate_name'], is_individual=True),
+            'entity_name_normalized': normalize_name_series(df['entity_name'], is_individual=df['entity_is_individual']),
+            'office_sought_normal': office_sought_normal.to_numpy(dtype=object)[group_ids],
+            'level': level.array.take(group_ids),
+            'district_normal': districts.to_numpy(dtype=object)[group_ids],
+        }
+        if 'election_cycle' in df.columns:
+            derived['primary_or_general'] = determine_primary_or_general_series(df['election_cycle'])
+        df = df.assign(**derived)
+        
+        return df[[col for col in TRANSACTION_COLUMNS if col in df.columns]]
     
+    def _text_column(self, df: pd.DataFrame, *names: str) -> pd.Series:
+        """Return stripped text from the first non-empty of several alternative columns."""
+        result = pd.Series('', index=df.index, dtype=object)
+        for name in reversed(names):
+            if name in df.columns:
+                values = df[name].astype(object).fillna('').astype(str)
+                result = values.where(values != '', result)
+        return result.str.strip()
     
+    def _join_name_parts(self, *parts: pd.Series) -> pd.Series:
+        """Join stripped name parts with single spaces, skipping empty parts."""
+        joined = parts[0]
+        for part in parts[1:]:
+            joined = (joined + ' ' + part).str.strip()
+        return joined
     
+    def _build_candidate_name_vec(self, df: pd.DataFrame) -> pd.Series:
+        """Build candidate names for an old format frame, falling back to committee name."""
+        first_name = self._text_column(df, 'first_name')
+        last_name = self._text_column(df, 'last_name')
+        middle_name = self._text_column(df, 'middle_name')
+        committee_name = self._text_column(df, 'committee_name')
+        
+        full_name = self._join_name_parts(first_name, middle_name, last_name)
+        return full_name.where((first_name != '') & (last_name != ''), committee_name)
     
+    def _build_entity_name_vec(self, df: pd.DataFrame, old_format: bool = False) -> pd.Series:
+        """Build entity names for a whole old or new format frame."""
+        if old_format:
+            entity_name = self._text_column(df, 'entity_name')
+            first_name = self._text_column(df, 'first_name')
+            last_name = self._text_column(df, 'last_name')
+            middle_name = self._text_column(df, 'middle_name')
+            
+            # Build from name parts when no entity name is given
+            full_name = self._join_name_parts(first_name, middle_name, last_name)
+            full_name = full_name.where((first_name != '') | (last_name != ''), '')
+            return entity_name.where(entity_name != '', full_name)
+        
+        last_or_company = self._text_column(df, 'LastOrCompanyName')
+        first_name = self._text_column(df, 'FirstName')
+        middle_name = self._text_column(df, 'MiddleName')
+        
+        # Companies only have LastOrCompanyName
+        full_name = self._join_name_parts(first_name, middle_name, last_or_company)
+        entity_name = full_name.where(first_name != '', last_or_company)
+        return entity_name.where(last_or_company != '', '')
     
     def _determine_on_time_status(self, transaction_date, reported_date, election_cycle, report_year):
         """
-        Check if a transaction was reported on time based on filing deadlines.
+        Check if a single transaction was reported on time based on filing deadlines.
+        
+        Kept for callers outside the frame mappers; those use _on_time_status_vec instead.
         
-        Parameters:
-            transaction_date (str): Date of the transaction
-            reported_date (str): Date the transaction was reported  
-            election_cycle (str): Election cycle information (e.g., "11/2024")
-            report_year (str/int): Year of the report
-            
         Returns:
             bool: True if reported on time, False if late, None if cannot determine
         """
-        from functions.filing_deadlines import get_filing_periods_for_year
-        from datetime import datetime
-        
-        # Handle missing data
-        if not transaction_date or not reported_date or not report_year:
-            return None
-            
-        # Convert dates to datetime objects
-        def to_date(val):
-            if val is None or val == '':
+        return self._on_time_status_vec(
+            pd.Series([transaction_date], dtype=object), pd.Series([reported_date], dtype=object),
+            pd.Series([election_cycle], dtype=object), pd.Series([report_year], dtype=object)
+        ).iloc[0]
+    
+    def _parse_on_time_dates(self, values: pd.Series) -> pd.Series:
+        """Parse date strings (or datetimes) to day-resolution datetime64, NaT where unparseable."""
+        # Dates repeat heavily, so parse each distinct value once and broadcast back
+        codes, uniques = pd.factorize(values.astype(object))
+        uniques = pd.Series(uniques, dtype=object)
+        parsed = pd.Series(pd.NaT, index=uniques.index, dtype='datetime64[us]')
+        
+        # Datetime objects are used as-is
+        is_datetime = uniques.map(lambda v: isinstance(v, datetime)).to_numpy(dtype=bool)
+        if is_datetime.any():
+            parsed[is_datetime] = pd.to_datetime(uniques[is_datetime]).dt.normalize()
+        
+        is_text = uniques.map(lambda v: isinstance(v, str)).to_numpy(dtype=bool)
+        if is_text.any():
+            # Truncate fractional seconds beyond microseconds
+            text = uniques[is_text].astype(str).str.strip().str.replace(r'\A([^.]*\.\d{6})\d+\Z', r'\1', regex=True)
+            text_dates = pd.Series(pd.NaT, index=text.index, dtype='datetime64[us]')
+            for fmt in ON_TIME_DATE_FORMATS:
+                missing = text_dates.isna()
+                if not missing.any():
+                    break
+                text_dates[missing] = pd.to_datetime(text[missing], format=fmt, errors='coerce')
+            parsed[is_text] = text_dates.dt.normalize()
+        
+        # Missing values (code -1) pick up the trailing NaT
+        result = np.append(parsed.to_numpy(), np.datetime64('NaT', 'us'))[codes]
+        return pd.Series(result, index=values.index)
+    
+    def _int_values(self, values: pd.Series, split_slash: bool = False) -> pd.Series:
+        """Convert each distinct value with int() (the year after the last '/' if split_slash), None where falsy or invalid."""
+        def to_int(value):
+            if isinstance(value, float) and np.isnan(value) or not value:
                 return None
-            if isinstance(val, datetime):
-                return val.date()
-            if isinstance(val, str):
-                # Try different date formats
-                val_stripped = val.strip()
-                # Handle microseconds format by truncating
-                if '.' in val_stripped and len(val_stripped.split('.')[-1]) > 6:
-                    # Truncate microseconds to 6 digits
-                    parts = val_stripped.split('.')
-                    val_stripped = parts[0] + '.' + parts[1][:6]
-                
-                for fmt in ("%Y-%m-%d", "%m/%d/%Y", "%Y-%m-%d %H:%M:%S", "%Y-%m-%d %H:%M:%S.%f", "%m/%d/%y"):
-                    try:
-                        return datetime.strptime(val_stripped, fmt).date()
-                    except ValueError:
-                        continue
+            if split_slash and isinstance(value, str) and '/' in value:
+                value = value.split('/')[-1]
+            try:
+                return int(value)
+            except (ValueError, TypeError):
                 return None
-            return None
-
-        tx_date = to_date(transaction_date)
-        rep_date = to_date(reported_date)
         
-        # Ensure we have valid dates
-        if not tx_date or not rep_date:
-            return None
-            
-        # Get report year as integer
-        try:
-            report_year_int = int(report_year)
-        except (ValueError, TypeError):
-            return None
+        codes, uniques = pd.factorize(values.astype(object), use_na_sentinel=False)
+        ints = pd.array([to_int(value) for value in uniques], dtype='Int64')
+        return pd.Series(ints.take(codes), index=values.index)
+    
+    def _on_time_status_vec(self, transaction_dates: pd.Series, reported_dates: pd.Series, election_cycles: Optional[pd.Series], report_years: pd.Series) -> pd.Series:
+        """
+        Check whether transactions were reported on time based on filing deadlines.
+        
+        A transaction uses the first filing period (in filing_deadlines order) of its report year
+        that contains the transaction date and matches its cycle; on-cycle when the report year equals
+        the election year. Returns True/False, False when no period matches, or None when the dates or
+        report year cannot be determined.
+        """
+        index = transaction_dates.index
+        tx = self._parse_on_time_dates(transaction_dates).to_numpy()
+        rep = self._parse_on_time_dates(reported_dates).to_numpy()
+        years = self._int_values(report_years)
+        if election_cycles is None:
+            election_years = pd.Series(pd.NA, index=index, dtype='Int64')
+        else:
+            election_years = self._int_values(election_cycles, split_slash=True)
+        
+        # onCycle if report_year equals election_year, offCycle if not (or no election year)
+        is_on_cycle = (years == election_years).fillna(False).to_numpy(dtype=bool) & (election_years != 0).fillna(False).to_numpy(dtype=bool)
+        
+        determinable = ~(np.isnat(tx) | np.isnat(rep)) & years.notna().to_numpy()
+        year_index = np.full(len(index), -1, dtype=np.int64)
+        year_index[determinable], unique_years = pd.factorize(years[determinable])
+        periods = [_filing_periods_arrays(int(year)) for year in unique_years]
+        
+        if NUMBA_AVAILABLE:
+            # Compare whole days as int64 in the kernel
+            def days(values):
+                return values.astype('datetime64[D]').view('i8')
             
-        # Determine election year from election_cycle
-        election_year = None
-        if election_cycle:
-            if isinstance(election_cycle, str) and '/' in election_cycle:
-                # Extract year from date format like "11/2024"
-                try:
-                    election_year = int(election_cycle.split('/')[-1])
-                except (ValueError, IndexError):
-                    pass
-            else:
-                # Try to convert directly to int
-                try:
-                    election_year = int(election_cycle)
-                except (ValueError, TypeError):
-                    pass
+            period_offsets = np.cumsum([0] + [len(starts) for starts, _, _, _ in periods]).astype(np.int64)
+            starts, ends, deadlines = (
+                days(np.concatenate([period[field] for period in periods] or [np.array([], dtype='datetime64[us]')]))
+                for field in range(3)
+            )
+            on_cycle = np.concatenate([period[3] for period in periods] or [np.array([], dtype=bool)])
+            status = _on_time_kernel(days(tx), days(rep), year_index, is_on_cycle, period_offsets, starts, ends, deadlines, on_cycle)
+            on_time = status == 1
+        else:
+            on_time = np.zeros(len(index), dtype=bool)
+            for k, year in enumerate(unique_years):
+                for cycle in (False, True):
+                    rows = (year_index == k) & (is_on_cycle == cycle)
+                    if not rows.any():
+                        continue
                     
-        # Get filing periods for the report year
-        filing_periods = get_filing_periods_for_year(report_year_int)
-        
-        # Check which filing period the transaction falls into
-        for period in filing_periods:
-            start = to_date(period["filingPeriodStart"])
-            end = to_date(period["filingPeriodEnd"]) 
-            deadline = to_date(period["filingPeriodDeadline"])
-            on_cycle = period["onCycle"]
-            
-            if not start or not end or not deadline:
-                continue
-                
-            # Check if transaction falls in this period
-            if start <= tx_date <= end:
-                # onCycle if report_year equals election_year, offCycle if not
-                is_on_cycle = (report_year_int == election_year) if election_year else False
-                
-                # Use this period if it matches the cycle type we need
-                if (is_on_cycle and on_cycle) or (not is_on_cycle and not on_cycle):
-                    return rep_date <= deadline
-                
-        # If no matching period found, assume not on time
-        return False
+                    intervals, starts, ends, deadlines = _filing_period_intervals(int(year), cycle)
+                    if intervals is not None:
+                        # Non-overlapping periods: one binary search per transaction
+                        position = intervals.get_indexer(tx[rows])
+                        found = position >= 0
+                        on_time[rows] = found & (rep[rows] <= deadlines[np.where(found, position, 0)])
+                        continue
+                    
+                    # Overlapping periods: the first period in list order wins
+                    pending = rows.copy()
+                    for start, end, deadline in zip(starts, ends, deadlines):
+                        in_period = pending & (tx >= start) & (tx <= end)
+                        on_time[in_period] = rep[in_period] <= deadline
+                        pending &= ~in_period
+        
+        result = pd.Series(on_time, index=index, dtype=object)
+        result[~determinable] = None
+        return result
     
-    def upload_to_bigquery2(self, df: pd.DataFrame, table_id: str, dataset_id: str = 'virginia_elections') -> None:
-        """Upload DataFrame to BigQuery with optimized performance."""
+    def load_staged_to_bigquery(self, table_id: str, dataset_id: str = 'virginia_elections') -> None:
+        """Load the staged per-folder Parquet files into BigQuery with a single load job."""
         if self.test_mode:
             logger.warning("Cannot upload to BigQuery in test mode")
             return
         
-        full_table_id = f"{self.project_id}.{dataset_id}.{table_id}"
-        total_rows = len(df)
-        logger.info(f"Uploading {total_rows} rows to BigQuery table: {full_table_id}")
-        
-        if total_rows == 0:
-            logger.warning("No data to upload")
+        if not self.staged_uris:
+            logger.warning("No staged Parquet files to load")
             return
         
-        # Optimize DataFrame dtypes for faster upload and less memory
-        for col in df.select_dtypes(['object']).columns:
-            unique_ratio = df[col].nunique() / len(df)
-            if unique_ratio < 0.5:  # Convert to category if less than 50% unique
-                df[col] = df[col].astype('category')
+        full_table_id = f"{self.project_id}.{dataset_id}.{table_id}"
+        logger.info("Loading %s staged Parquet files into BigQuery table: %s", len(self.staged_uris), full_table_id)
         
-        try:
-            # Use native BigQuery client for better performance
-            client = bigquery.Client(project=self.project_id)
-            
-            # Configure job for optimal performance
-            job_config = bigquery.LoadJobConfig(
-                write_disposition=bigquery.WriteDisposition.WRITE_TRUNCATE,
-                create_disposition=bigquery.CreateDisposition.CREATE_IF_NEEDED,
-                autodetect=True,
-                max_bad_records=100
-            )
-            
-            if total_rows <= 50000:
-                # Small dataset - upload directly
-                job = client.load_table_from_dataframe(df, full_table_id, job_config=job_config)
-                job.result()
-                logger.info(f"Successfully uploaded {total_rows} rows")
-            else:
-                # Large dataset - upload in chunks for better performance
-                chunk_size = 50000
-                logger.info(f"Large dataset detected. Uploading in chunks of {chunk_size} rows...")
-                
-                # First chunk replaces the table
-                first_chunk = df.iloc[:chunk_size]
-                job = client.load_table_from_dataframe(first_chunk, full_table_id, job_config=job_config)
-                job.result()
-                logger.info(f"Uploaded chunk 1/{(total_rows-1)//chunk_size + 1}")
-                
-                # Subsequent chunks append to the table
-                job_config.write_disposition = bigquery.WriteDisposition.WRITE_APPEND
-                
-                for i in range(chunk_size, total_rows, chunk_size):
-                    chunk = df.iloc[i:i+chunk_size]
-                    chunk_num = i // chunk_size + 1
-                    job = client.load_table_from_dataframe(chunk, full_table_id, job_config=job_config)
-                    job.result()
-                    logger.info(f"Uploaded chunk {chunk_num + 1}/{(total_rows-1)//chunk_size + 1}")
-                
-                logger.info(f"Successfully uploaded all {total_rows} rows")
+        job_config = bigquery.LoadJobConfig(
+            source_format=bigquery.SourceFormat.PARQUET,
+            write_disposition=bigquery.WriteDisposition.WRITE_TRUNCATE,
+            create_disposition=bigquery.CreateDisposition.CREATE_IF_NEEDED
+        )
         
+        try:
+            # Only this run's files, so stale staging output is never loaded
+            job = self.bq_client.load_table_from_uri(self.staged_uris, full_table_id, job_config=job_config)
+            job.result()
+            logger.info("Successfully loaded %s rows into %s", job.output_rows, full_table_id)
         except Exception as e:
-            logger.error(f"Native BigQuery upload failed: {e}")
-            # Fallback to pandas-gbq for smaller datasets
-            if total_rows < 100000:
-                logger.info("Falling back to pandas-gbq...")
-                pandas_gbq.to_gbq(
-                    df,
-                    destination_table=full_table_id,
-                    project_id=self.project_id,
-                    if_exists='replace',
-                    progress_bar=True,
-                    chunksize=10000
-                )
-                logger.info("Fallback upload successful")
-            else:
-                raise
-
-    def upload_to_bigquery(
-        self, df: pd.DataFrame, table_id: str, dataset_id: str = "virginia_elections"
-    ) -> None:
-        """Upload DataFrame to BigQuery using pandas-gbq."""
-
-        if self.test_mode:
-            logger.warning("Cannot upload to BigQuery in test mode")
-            return
-
-        full_table_id = f"{dataset_id}.{table_id}"
-        total_rows = len(df)
-        logger.info(f"Uploading {total_rows} rows to BigQuery table: {self.project_id}.{full_table_id}")
-
-        if total_rows == 0:
-            logger.warning("No data to upload")
-            return
-
-        # Optimize object dtypes before upload
-        for col in df.select_dtypes(["object"]).columns:
-            unique_ratio = df[col].nunique(dropna=True) / len(df)
-            if unique_ratio < 0.5:
-                df[col] = df[col].astype("category")
+            logger.error("Parquet load failed: %s", e)
+            raise
 
+def _save_to_sqlite(df: pd.DataFrame, db_path: Path) -> None:
+    """Replace the transactions table in a local SQLite database."""
+    if ADBC_SQLITE_AVAILABLE:
         try:
-            # Upload using pandas-gbq
-            pandas_gbq.to_gbq(
-                df,
-                destination_table=full_table_id,
-                project_id=self.project_id,
-                if_exists="replace",   # overwrite each run
-                progress_bar=True,
-                chunksize=10000,       # tune as needed
-            )
-            logger.info(f"Successfully uploaded {total_rows} rows to {full_table_id}")
+            # Bind whole Arrow columns instead of converting and binding cell by cell
+            table = VirginiaDataProcessor._to_arrow_table(df.reindex(columns=TRANSACTION_COLUMNS))
+            with adbc_sqlite.connect(str(db_path)) as conn:
+                with conn.cursor() as cursor:
+                    cursor.adbc_ingest("transactions", table, mode="replace")
+                conn.commit()
+            return
         except Exception as e:
-            logger.error(f"pandas-gbq upload failed: {e}")
-            raise
+            logger.warning("ADBC SQLite ingest failed: %s - falling back to pandas", e)
+    
+    conn = sqlite3.connect(str(db_path))
+    # Local scratch DB: skip fsyncs and keep temp tables in memory
+    conn.executescript("PRAGMA journal_mode=WAL; PRAGMA synchronous=OFF; PRAGMA temp_store=MEMORY; PRAGMA cache_size=-200000;")
+    try:
+        # One transaction; pandas batches rows through executemany
+        with conn:
+            df.to_sql("transactions", conn, if_exists="replace", index=False, chunksize=10_000)
+    finally:
+        conn.close()
+
 
 def main():
     parser = argparse.ArgumentParser(description='Virginia Campaign Finance Data Processor')
@@ -1138,6 +1541,10 @@ def main():
                        help='Skip processing old format folders (1999-2011)')
     parser.add_argument('--folders-after', type=int, metavar='YEAR',
                        help='Only process folders from this year onwards (e.g., 2018)')
+    parser.add_argument('--no-cache', action='store_true',
+                       help='Reprocess every folder even if its staged Parquet is up to date')
+    parser.add_argument('--workers', type=int, metavar='N',
+                       help='Folders processed in parallel (default: CPU count; 1 disables multiprocessing)')
     
     args = parser.parse_args()
     
@@ -1151,10 +1558,12 @@ def main():
             project_id=args.project_id,
             bucket_name=args.bucket_name,
             process_old_folders=not args.skip_old_folders,
-            folders_after_year=args.folders_after
+            folders_after_year=args.folders_after,
+            use_cache=not args.no_cache,
+            max_workers=args.workers
         )
     except (ImportError, ValueError) as e:
-        logger.error(f"Failed to initialize processor: {e}")
+        logger.error("Failed to initialize processor: %s", e)
         return 1
     
     try:
@@ -1165,33 +1574,32 @@ def main():
             logger.warning("No data was processed")
             return 1
         
-        # Display summary
-        logger.info(f"Processing complete:")
-        logger.info(f"  Total transactions: {len(df)}")
-        logger.info(f"  Date range: {df['report_year'].min():.0f} - {df['report_year'].max():.0f}")
-        logger.info(f"  Total amount: ${df['amount'].sum():,.2f}")
-        logger.info(f"  Unique candidates: {df['candidate_name'].nunique()}")
-        logger.info(f"  Unique entities: {df['entity_name'].nunique()}")
+        # Display summary, computing the stats in one aggregation and one nunique pass
+        stats = df.agg({'report_year': ['min', 'max'], 'amount': 'sum'})
+        unique_counts = df[['candidate_name', 'entity_name']].nunique()
+        logger.info("Processing complete:")
+        logger.info("  Total transactions: %d", len(df))
+        logger.info("  Date range: %.0f - %.0f", stats.at['min', 'report_year'], stats.at['max', 'report_year'])
+        logger.info("  Total amount: $%s", format(stats.at['sum', 'amount'], ',.2f'))
+        logger.info("  Unique candidates: %d", unique_counts['candidate_name'])
+        logger.info("  Unique entities: %d", unique_counts['entity_name'])
         
         # Upload to BigQuery if in production mode
         if not test_mode:
-            processor.upload_to_bigquery(df, args.bq_table, args.bq_dataset)
+            processor.load_staged_to_bigquery(args.bq_table, args.bq_dataset)
         else:
             logger.info("Test mode: Data processing complete. Use production mode to upload to BigQuery.")
             
             # Save to database in data folder
-            import sqlite3
             db_path = Path(__file__).parent / 'data' / 'campaign_finance.db'
             db_path.parent.mkdir(exist_ok=True)
-            conn = sqlite3.connect(str(db_path))
-            df.to_sql("transactions", conn, if_exists="replace", index=False)
-            conn.close()
-            logger.info(f"Saved {len(df)} records to local SQLite DB: {db_path}")
+            _save_to_sqlite(df, db_path)
+            logger.info("Saved %s records to local SQLite DB: %s", len(df), db_path)
         
         return 0
         
     except Exception as e:
-        logger.error(f"Processing failed: {e}")
+        logger.error("Processing failed: %s", e)
         return 1
 
 
@@ -17,10 +17,26 @@ from datetime import datetime, timedelta
 from fuzzywuzzy import fuzz
 import numpy as np
 
+# JIT-compiled keep-latest kernel (optional; falls back to numpy masks)
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Transaction date formats, tried in order
+TRANSACTION_DATE_FORMATS = (
+    "%m/%d/%Y",
+    "%Y-%m-%d",
+    "%m/%d/%y",
+    "%Y-%m-%d %H:%M:%S",
+    "%m/%d/%Y %H:%M:%S"
+)
+
 
 def parse_transaction_date(date_str) -> datetime:
     """Parse transaction date string into datetime object."""
@@ -30,15 +46,7 @@ def parse_transaction_date(date_str) -> datetime:
     date_str = str(date_str).strip()
     
     # Try different date formats
-    formats = [
-        "%m/%d/%Y",
-        "%Y-%m-%d", 
-        "%m/%d/%y",
-        "%Y-%m-%d %H:%M:%S",
-        "%m/%d/%Y %H:%M:%S"
-    ]
-    
-    for fmt in formats:
+    for fmt in TRANSACTION_DATE_FORMATS:
         try:
             return datetime.strptime(date_str, fmt)
         except ValueError:
@@ -68,6 +76,48 @@ def fuzzy_name_match(name1, name2, threshold=85) -> bool:
     similarity = fuzz.ratio(name1_clean, name2_clean)
     return similarity >= threshold
 
+def similarity_matrix(names: np.ndarray, dates: np.ndarray, fuzzy_threshold: int = 85) -> np.ndarray:
+    """Pairwise fuzzy name match and date proximity (within 30 days) for one group of transactions."""
+    # Fuzzy-match each pair of distinct names once; groups usually share a single name
+    codes, unique_names = pd.factorize(names, use_na_sentinel=False)
+    name_matches = np.array([[fuzzy_name_match(name1, name2, fuzzy_threshold) for name2 in unique_names]
+                             for name1 in unique_names], dtype=bool)
+    
+    # Whole days apart, floored like timedelta.days; missing dates never match
+    valid = ~np.isnat(dates)
+    with np.errstate(invalid='ignore'):
+        days_apart = (dates[:, None] - dates[None, :]) // np.timedelta64(1, 'D')
+    date_matches = (np.abs(days_apart) <= 30) & valid[:, None] & valid[None, :]
+    
+    return name_matches[codes[:, None], codes[None, :]] & date_matches
+
+def _keep_latest_kernel(similar, amendment_counts):
+    """Greedy keep-latest pass over one group's similarity matrix; returns a keep mask."""
+    n = similar.shape[0]
+    processed = np.zeros(n, dtype=np.bool_)
+    keep = np.zeros(n, dtype=np.bool_)
+    for i in range(n):
+        if processed[i]:
+            continue
+        
+        # Already processed transactions stay in the comparison set, as do matches of this one
+        similar_mask = processed | similar[i]
+        similar_mask[i] = True
+        
+        if similar_mask.sum() > 1:
+            # Multiple similar transactions - keep highest amendment_count
+            max_amendment = amendment_counts[similar_mask].max()
+            keep |= similar_mask & (amendment_counts == max_amendment)
+            processed |= similar_mask
+        else:
+            # Single transaction, keep it
+            keep[i] = True
+            processed[i] = True
+    return keep
+
+if NUMBA_AVAILABLE:
+    _keep_latest_kernel = njit(cache=True)(_keep_latest_kernel)
+
 def get_latest_amendments(df: pd.DataFrame, fuzzy_threshold: int = 85) -> pd.DataFrame:
     """
     Return only transactions from the latest amendment reports using efficient vectorized operations.
@@ -84,15 +134,18 @@ def get_latest_amendments(df: pd.DataFrame, fuzzy_threshold: int = 85) -> pd.Dat
     if df.empty:
         return df
     
+    # Drop exact duplicate rows up front with columnar hashing so the group scan only sees distinct rows
+    df_clean = df.drop_duplicates().reset_index(drop=True)
+    exact_duplicates = len(df) - len(df_clean)
+    
     # Handle missing values
-    df_clean = df.copy().reset_index(drop=True)
     df_clean['committee_code'] = df_clean['committee_code'].fillna('UNKNOWN')
     df_clean['entity_name_normalized'] = df_clean['entity_name_normalized'].fillna('UNKNOWN')
     df_clean['amount'] = pd.to_numeric(df_clean['amount'], errors='coerce').fillna(0.0)
     df_clean['amendment_count'] = pd.to_numeric(df_clean['amendment_count'], errors='coerce').fillna(0)
     
-    logger.info(f"Processing {len(df_clean)} total transactions")
-    logger.info(f"Using fuzzy name matching threshold: {fuzzy_threshold}")
+    logger.info("Processing %s total transactions (%s exact duplicates removed)", len(df), exact_duplicates)
+    logger.info("Using fuzzy name matching threshold: %s", fuzzy_threshold)
     
     # Parse transaction dates and create a normalized date for grouping (within 30 days)
     df_clean['parsed_date'] = df_clean['transaction_date'].apply(parse_transaction_date)
@@ -112,11 +165,11 @@ def get_latest_amendments(df: pd.DataFrame, fuzzy_threshold: int = 85) -> pd.Dat
     
     # Group by stricter criteria to match SQL version and prevent over-removal
     # This is similar to the efficient grouping in Schedule H continuity check
-    grouped = df_clean.groupby([
-        'committee_code', 
-        'name_clean', 
-        'amount_rounded', 
-        'date_group',
+    key_columns = [
+        df_clean['committee_code'],
+        df_clean['name_clean'],
+        df_clean['amount_rounded'],
+        df_clean['date_group'],
         # Add stricter matching criteria
         df_clean['zip_code'].fillna(''),
         df_clean['committee_type'].fillna(''),
@@ -127,60 +180,29 @@ def get_latest_amendments(df: pd.DataFrame, fuzzy_threshold: int = 85) -> pd.Dat
         df_clean['primary_or_general'].fillna(''),
         df_clean['office_sought_normal'].fillna(''),
         df_clean['district_normal'].fillna('')
-    ], dropna=False)
+    ]
     
-    latest_transactions = []
+    # Factorize each key to integer codes and fold them into one group id (missing values form their own group)
+    group_ids = np.zeros(len(df_clean), dtype=np.int64)
+    for column in key_columns:
+        codes, uniques = pd.factorize(column, use_na_sentinel=False)
+        group_ids = pd.factorize(group_ids * len(uniques) + codes)[0]
     
-    for group_key, group_df in grouped:
-        if len(group_df) == 1:
-            # Only one transaction in group, keep it
-            latest_transactions.append(group_df.index[0])
-        else:
-            # Multiple transactions - need to check for fuzzy matches and date proximity
-            group_df = group_df.copy()
-            
-            # Within each group, check for fuzzy matches with date proximity
-            processed_indices = set()
-            
-            for i, row1 in group_df.iterrows():
-                if i in processed_indices:
-                    continue
-                
-                # Find similar transactions within this pre-filtered group
-                similar_mask = pd.Series([True] * len(group_df), index=group_df.index)
-                
-                for j, row2 in group_df.iterrows():
-                    if j == i or j in processed_indices:
-                        continue
-                    
-                    # Check fuzzy name match and date proximity
-                    name_match = fuzzy_name_match(
-                        row1['entity_name_normalized'], 
-                        row2['entity_name_normalized'], 
-                        fuzzy_threshold
-                    )
-                    date_match = dates_within_month(row1['parsed_date'], row2['parsed_date'])
-                    
-                    if not (name_match and date_match):
-                        similar_mask[j] = False
-                
-                # Get similar transactions
-                similar_indices = group_df[similar_mask].index.tolist()
-                
-                if len(similar_indices) > 1:
-                    # Multiple similar transactions - keep highest amendment_count
-                    similar_df = group_df.loc[similar_indices]
-                    max_amendment = similar_df['amendment_count'].max()
-                    latest_indices = similar_df[
-                        similar_df['amendment_count'] == max_amendment
-                    ].index.tolist()
-                    
-                    latest_transactions.extend(latest_indices)
-                    processed_indices.update(similar_indices)
-                else:
-                    # Single transaction, keep it
-                    latest_transactions.append(i)
-                    processed_indices.add(i)
+    # Only one transaction in group: nothing can supersede it, so keep all of these without scanning
+    in_multi_group = pd.Series(group_ids, index=df_clean.index).duplicated(keep=False)
+    latest_transactions = df_clean.index[~in_multi_group].tolist()
+    
+    # Multiple transactions - need to check for fuzzy matches and date proximity within each group
+    multi_df = df_clean[in_multi_group]
+    parsed_dates = pd.to_datetime(multi_df['parsed_date']).to_numpy(dtype='datetime64[us]')
+    names = multi_df['entity_name_normalized'].to_numpy(dtype=object)
+    amendment_counts = multi_df['amendment_count'].to_numpy(dtype=np.float64)
+    
+    for positions in multi_df.groupby(group_ids[in_multi_group.to_numpy()], sort=False).indices.values():
+        # Pairwise name and date matches for the whole group at once
+        similar = similarity_matrix(names[positions], parsed_dates[positions], fuzzy_threshold)
+        keep = _keep_latest_kernel(similar, amendment_counts[positions])
+        latest_transactions.extend(multi_df.index[positions[keep]])
     
     # Get final dataset
     latest_df = df_clean.loc[latest_transactions].copy()
@@ -192,24 +214,26 @@ def get_latest_amendments(df: pd.DataFrame, fuzzy_threshold: int = 85) -> pd.Dat
     latest_df = latest_df.drop_duplicates()
     
     # Calculate statistics
-    original_transactions = len(df_clean)
+    original_transactions = len(df)
     kept_transactions = len(latest_df)
     superseded_count = original_transactions - kept_transactions
     
-    logger.info(f"Amendment processing summary:")
-    logger.info(f"  Original transactions: {original_transactions:,}")
-    logger.info(f"  Latest amendment transactions kept: {kept_transactions:,}")
-    logger.info(f"  Superseded transactions removed: {superseded_count:,}")
-    
-    if superseded_count > 0:
-        removal_rate = (superseded_count / original_transactions) * 100
-        logger.info(f"  Removal rate: {removal_rate:.1f}%")
-    
-    # Show amendment count distribution
-    amendment_dist = latest_df['amendment_count'].value_counts().sort_index()
-    logger.info(f"Amendment count distribution in final dataset:")
-    for amendment_count, count in amendment_dist.items():
-        logger.info(f"  Amendment {int(amendment_count)}: {count:,} transactions")
+    # Only build the summary (including the amendment count distribution) when it will be logged
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Amendment processing summary:")
+        logger.info("  Original transactions: %s", format(original_transactions, ','))
+        logger.info("  Latest amendment transactions kept: %s", format(kept_transactions, ','))
+        logger.info("  Superseded transactions removed: %s", format(superseded_count, ','))
+        
+        if superseded_count > 0:
+            removal_rate = (superseded_count / original_transactions) * 100
+            logger.info("  Removal rate: %.1f%%", removal_rate)
+        
+        # Show amendment count distribution
+        amendment_dist = latest_df['amendment_count'].value_counts().sort_index()
+        logger.info("Amendment count distribution in final dataset:")
+        for amendment_count, count in amendment_dist.items():
+            logger.info("  Amendment %d: %s transactions", amendment_count, format(count, ','))
     
     return latest_df.sort_values(['committee_code', 'entity_name_normalized', 'amount', 'amendment_count'])
 
@@ -233,7 +257,7 @@ def run_main_processor_and_clean(data_folder: str, project_id: str, dataset_id:
     """
     try:
         # Step 1: Run main processor to create/update raw table
-        logger.info(f"Step 1: Running main processor {processor_script}...")
+        logger.info("Step 1: Running main processor %s...", processor_script)
         
         # Import and run the main processor
         spec = importlib.util.spec_from_file_location("main_processor", processor_script)
@@ -260,15 +284,15 @@ def run_main_processor_and_clean(data_folder: str, project_id: str, dataset_id:
                 logger.error("Main processor failed")
                 return False
         else:
-            logger.error(f"Main processor {processor_script} doesn't have a main() function")
+            logger.error("Main processor %s doesn't have a main() function", processor_script)
             return False
         
         # Step 2: Process amendments and create clean table
-        logger.info(f"Step 2: Processing amendments and creating clean table...")
+        logger.info("Step 2: Processing amendments and creating clean table...")
         return create_amendment_cleaned_table(project_id, dataset_id, raw_table_id, clean_table_id)
         
     except Exception as e:
-        logger.error(f"Error in run_main_processor_and_clean: {e}")
+        logger.error("Error in run_main_processor_and_clean: %s", e)
         return False
 
 
@@ -295,7 +319,7 @@ def create_amendment_cleaned_table(project_id: str, dataset_id: str,
         use_sql_processing = False
         
         if use_sql_processing:
-            logger.info(f"Processing amendments using efficient SQL approach similar to Schedule H...")
+            logger.info("Processing amendments using efficient SQL approach similar to Schedule H...")
             
             # Use SQL window functions for efficient amendment processing
             # This approach is much faster than downloading all data to pandas
@@ -396,7 +420,7 @@ def create_amendment_cleaned_table(project_id: str, dataset_id: str,
             clean_count = stats_df['clean_count'].iloc[0]
             removed_count = original_count - clean_count
             
-            logger.info(f"Successfully created clean table {project_id}.{dataset_id}.{clean_table_id}")
+            logger.info("Successfully created clean table %s.%s.%s", project_id, dataset_id, clean_table_id)
             
             # Print summary statistics
             print(f"\n✅ Amendment Processing Complete!")
@@ -414,15 +438,16 @@ def create_amendment_cleaned_table(project_id: str, dataset_id: str,
         
         # Use pandas processing approach
         
-        # Read raw data from BigQuery
+        # Read raw data from BigQuery; exact duplicate rows are dropped server-side so they are never downloaded
         query = f"""
-        SELECT *
+        SELECT DISTINCT *
         FROM `{project_id}.{dataset_id}.{raw_table_id}`
         ORDER BY committee_code, due_date, amendment_count
         """
         
-        df = client.query(query).to_dataframe()
-        logger.info(f"Downloaded {len(df)} records from raw table for pandas processing")
+        # Stream the result through the BigQuery Storage Read API (Arrow) rather than paged REST JSON
+        df = client.query(query).to_dataframe(create_bqstorage_client=True)
+        logger.info("Downloaded %s distinct records from raw table for pandas processing", len(df))
         
         if df.empty:
             logger.warning("No data found in raw table")
@@ -432,7 +457,7 @@ def create_amendment_cleaned_table(project_id: str, dataset_id: str,
         clean_df = get_latest_amendments(df, fuzzy_threshold)
         
         # Upload clean data to BigQuery
-        logger.info(f"Uploading {len(clean_df)} records to {project_id}.{dataset_id}.{clean_table_id}...")
+        logger.info("Uploading %s records to %s.%s.%s...", len(clean_df), project_id, dataset_id, clean_table_id)
         
         # Configure job to overwrite the table
         job_config = bigquery.LoadJobConfig(
@@ -444,18 +469,18 @@ def create_amendment_cleaned_table(project_id: str, dataset_id: str,
         job = client.load_table_from_dataframe(clean_df, table_ref, job_config=job_config)
         job.result()  # Wait for job to complete
         
-        logger.info(f"Successfully created clean table with pandas processing")
+        logger.info("Successfully created clean table with pandas processing")
         
         # Print summary statistics
         print(f"\n✅ Amendment Processing Complete!")
-        print(f"Raw table: {raw_table_id} ({len(df):,} records)")
+        print(f"Raw table: {raw_table_id} ({len(df):,} distinct records)")
         print(f"Clean table: {clean_table_id} ({len(clean_df):,} records)")
         print(f"Records removed: {len(df) - len(clean_df):,} superseded amendments")
         
         return True
         
     except Exception as e:
-        logger.error(f"Error creating amendment-cleaned table: {e}")
+        logger.error("Error creating amendment-cleaned table: %s", e)
         return False
 
 
@@ -477,7 +502,7 @@ def process_local_files_only(data_folder: str, output_csv: str) -> bool:
         sys.modules["main_processor"] = main_processor
         spec.loader.exec_module(main_processor)
         
-        logger.info(f"Processing local files in {data_folder}...")
+        logger.info("Processing local files in %s...", data_folder)
         
         # This would need to be adapted based on how your main processor structures its code
         # For now, let's assume we can get a DataFrame from the processor
@@ -489,7 +514,7 @@ def process_local_files_only(data_folder: str, output_csv: str) -> bool:
         return False
         
     except Exception as e:
-        logger.error(f"Error in local file processing: {e}")
+        logger.error("Error in local file processing: %s", e)
         return False
 
 
@@ -556,7 +581,7 @@ def main():
         return 0 if success else 1
         
     except Exception as e:
-        logger.error(f"Amendment processor failed: {e}")
+        logger.error("Amendment processor failed: %s", e)
         return 1
 
 
@@ -37,6 +37,13 @@ except ImportError:
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Old format column names for each balance field, in order of preference
+OLD_BALANCE_FIELDS = {
+    'total_disbursements': ['Total Disbursements', 'TOTAL_DISBURSEMENTS', 'TotalDisbursements'],
+    'starting_balance': ['Starting Balance', 'STARTING_BALANCE', 'BeginnningBalance', 'Begin Cash Bal'],
+    'ending_balance': ['Ending Balance', 'ENDING_BALANCE', 'EndingBalance']
+}
+
 class ScheduleHProcessor:
     """Schedule H data processor class for Virginia Campaign Finance data."""
     
@@ -195,9 +202,11 @@ class ScheduleHProcessor:
                         df[col] = df[col].astype('category')
                 records_processed = 0
                 records_created = 0
+                # The file's columns are fixed, so resolve which balance columns it has once
+                balance_fields = self._resolve_old_balance_fields(df.columns)
                 for _, row in df.iterrows():
                     records_processed += 1
-                    schedule_h_record = self._map_old_row_to_schedule_h(row, folder_name)
+                    schedule_h_record = self._map_old_row_to_schedule_h(row, folder_name, balance_fields)
                     if schedule_h_record:
                         records_created += 1
                         schedule_h_records.append(schedule_h_record)
@@ -332,40 +341,31 @@ class ScheduleHProcessor:
         
         return list(reports.values()), schedule_h_records
     
-    def _map_old_row_to_schedule_h(self, row: pd.Series, folder_name: str) -> Optional[Dict]:
-        """Map old format row to Schedule H dictionary."""
-        # Extract total disbursements - try different column names
-        total_disbursements = None
-        disbursement_fields = ['Total Disbursements', 'TOTAL_DISBURSEMENTS', 'TotalDisbursements']
-        for field in disbursement_fields:
-            if field in row and pd.notna(row[field]):
+    def _resolve_old_balance_fields(self, columns) -> Dict[str, List[str]]:
+        """Narrow each balance field's alternative column names to those present in a file."""
+        return {name: [field for field in fields if field in columns] for name, fields in OLD_BALANCE_FIELDS.items()}
+    
+    def _first_float(self, row: pd.Series, fields: List[str]) -> Optional[float]:
+        """Return the first non-missing value among fields that converts to float, else None."""
+        for field in fields:
+            if pd.notna(row[field]):
                 try:
-                    total_disbursements = float(row[field])
-                    break
+                    return float(row[field])
                 except (ValueError, TypeError):
                     continue
+        return None
+    
+    def _map_old_row_to_schedule_h(self, row: pd.Series, folder_name: str,
+                                   balance_fields: Optional[Dict[str, List[str]]] = None) -> Optional[Dict]:
+        """Map old format row to Schedule H dictionary."""
+        if balance_fields is None:
+            balance_fields = self._resolve_old_balance_fields(row.index)
         
+        # Extract balances - try the file's alternative column names in order
         # Include all records - don't filter based on disbursements
-        
-        starting_balance = None
-        sb_fields = ['Starting Balance', 'STARTING_BALANCE', 'BeginnningBalance', 'Begin Cash Bal']
-        for field in sb_fields:
-            if field in row and pd.notna(row[field]):
-                try:
-                    starting_balance  = float(row[field])
-                    break
-                except (ValueError, TypeError):
-                    continue
-        
-        ending_balance = None
-        eb_fields = ['Ending Balance', 'ENDING_BALANCE', 'EndingBalance']
-        for field in eb_fields:
-            if field in row and pd.notna(row[field]):
-                try:
-                    ending_balance  = float(row[field])
-                    break
-                except (ValueError, TypeError):
-                    continue
+        total_disbursements = self._first_float(row, balance_fields['total_disbursements'])
+        starting_balance = self._first_float(row, balance_fields['starting_balance'])
+        ending_balance = self._first_float(row, balance_fields['ending_balance'])
         
         # Extract and normalize names
         candidate_name = self._extract_candidate_name_old(row)
@@ -510,8 +510,8 @@ class ScheduleHProcessor:
                 df[col] = df[col].astype('category')
         
         try:
-            # Use native BigQuery client for better performance
-            client = bigquery.Client(project=self.project_id)
+            # Reuse the BigQuery client created in __init__
+            client = self.bq_client
             
             # Configure job for optimal performance
             job_config = bigquery.LoadJobConfig(
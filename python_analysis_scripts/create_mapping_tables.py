@@ -208,9 +208,9 @@ def main():
         FROM `{args.project_id}.{args.dataset}.{args.source_table}`
         WHERE 1=1
             AND (
-                committee_code IS NOT NULL
-                OR committee_name_normalized IS NOT NULL
-                OR entity_name_normalized IS NOT NULL
+                NULLIF(committee_code, '') IS NOT NULL
+                OR NULLIF(committee_name_normalized, '') IS NOT NULL
+                OR NULLIF(entity_name_normalized, '') IS NOT NULL
             )
         """
 
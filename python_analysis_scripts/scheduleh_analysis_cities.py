@@ -4,6 +4,7 @@ Schedule H Analysis for Virginia Campaign Finance data
 Analyzes total disbursements at the end of election cycles
 """
 
+import sys
 import pandas as pd
 from pathlib import Path
 from typing import List, Dict, Any
@@ -11,6 +12,11 @@ import argparse
 import logging
 from google.cloud import bigquery
 
+# Add parent directory to path for imports
+sys.path.append(str(Path(__file__).parent.parent))
+
+from functions.query_helpers import QUERY_PAGE_SIZE, escape_regex_literal
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
@@ -69,10 +75,10 @@ def get_bigquery_disbursements(project_id: str,
         query += " AND level = @level"
         params['level'] = 'local'
         
-        # Use the LIKE operator for partial matches on districts
+        # Partial matches on districts, as one regex alternation scanned once per row
         if districts:
-            query += " AND EXISTS(SELECT 1 FROM UNNEST(@districts) as search_term WHERE LOWER(district_normal) LIKE CONCAT('%', LOWER(search_term), '%'))"
-            params['districts'] = districts
+            query += " AND REGEXP_CONTAINS(LOWER(district_normal), @district_pattern)"
+            params['district_pattern'] = '|'.join(escape_regex_literal(d.lower()) for d in districts)
             
         # Filter by offices (case insensitive)
         if offices:
@@ -82,9 +88,7 @@ def get_bigquery_disbursements(project_id: str,
         # Filter by election cycles 2018 and later
         query += """
         AND (election_cycle IS NULL 
-        OR election_cycle LIKE '%/2018%' 
-        OR election_cycle LIKE '%/2019%' 
-        OR election_cycle LIKE '%/202_%')
+        OR SAFE_CAST(REGEXP_EXTRACT(election_cycle, r'/([0-9]{4})') AS INT64) >= 2018)
         AND candidate_name IS NOT NULL AND candidate_name != ''
         )
         SELECT 
@@ -103,22 +107,23 @@ def get_bigquery_disbursements(project_id: str,
         
         job_config = bigquery.QueryJobConfig(query_parameters=[
             bigquery.ScalarQueryParameter("level", "STRING", params.get("level")),
-            bigquery.ArrayQueryParameter("districts", "STRING", params.get("districts", [])),
+            bigquery.ScalarQueryParameter("district_pattern", "STRING", params.get("district_pattern")),
             bigquery.ArrayQueryParameter("offices", "STRING", params.get("offices", [])),
         ])
         
         # Execute the query
         logger.info(f"Executing BigQuery analysis query...")
         query_job = client.query(query, job_config=job_config)
-        df = query_job.to_dataframe()
         
-        if df.empty:
+        # Stream result pages and convert each to records as it arrives
+        results = []
+        for batch in query_job.result(page_size=QUERY_PAGE_SIZE).to_dataframe_iterable():
+            results.extend(batch.to_dict('records'))
+        
+        if not results:
             logger.warning("No results found with the specified filters")
             return []
             
-        # Convert to list of dictionaries
-        results = df.to_dict('records')
-            
         return results
         
     except Exception as e:
@@ -4,202 +4,258 @@ County Schedule H Analysis for Virginia Campaign Finance data
 Analyzes total disbursements for county board elections in Loudoun and Prince William counties
 """
 
+import functools
+import sys
+from collections import defaultdict
 import pandas as pd
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterator
 import argparse
 import logging
 from google.cloud import bigquery
 
+# Add parent directory to path for imports
+sys.path.append(str(Path(__file__).parent.parent))
+
+from functions.query_helpers import QUERY_PAGE_SIZE, escape_regex_literal
+
+# Aho-Corasick multi-pattern matcher for the city scan (optional; falls back to a linear scan)
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Output row layouts for print_county_disbursement_results
+RESULT_ROW_FORMAT = "{:<30} {:<15} {:<20} {:<20} {:<15} ${:>13,.2f} {}"
+COUNTY_ROW_FORMAT = "{:<15} ${:>18,.2f} {:>9}"
+
+# Virginia cities/districts (lowercase) mapped to their counties
+CITY_COUNTY_MAP = {
+    # Loudoun County
+    'leesburg': 'loudoun',
+    'sterling': 'loudoun',
+    'ashburn': 'loudoun',
+    'herndon': 'loudoun',
+    'purcellville': 'loudoun',
+    'hamilton': 'loudoun',
+    'lovettsville': 'loudoun',
+    'middleburg': 'loudoun',
+    'round hill': 'loudoun',
+    'hillsboro': 'loudoun',
+    'lansdowne': 'loudoun',
+    'brambleton': 'loudoun',
+    'dulles': 'loudoun',
+    'broadlands': 'loudoun',
+    'cascades': 'loudoun',
+    'countryside': 'loudoun',
+    'stone ridge': 'loudoun',
+    'south riding': 'loudoun',
+    'algonkian': 'loudoun',
+    'broad run': 'loudoun',
+    'catoctin': 'loudoun',
+    'dulles south': 'loudoun',
+    'sugarland run': 'loudoun',
+    
+    # Prince William County
+    'manassas': 'prince william',
+    'manassas park': 'prince william',
+    'woodbridge': 'prince william',
+    'dale city': 'prince william',
+    'lake ridge': 'prince william',
+    'dumfries': 'prince william',
+    'haymarket': 'prince william',
+    'occoquan': 'prince william',
+    'quantico': 'prince william',
+    'triangle': 'prince william',
+    'bristow': 'prince william',
+    'gainesville': 'prince william',
+    'nokesville': 'prince william',
+    'independent hill': 'prince william',
+    'linton hall': 'prince william',
+    'montclair': 'prince william',
+    'potomac mills': 'prince william',
+    'princes lakes': 'prince william',
+    'rippon': 'prince william',
+    'sudley': 'prince william',
+    'wellington': 'prince william',
+    'cherry hill': 'prince william',
+    'coles': 'prince william',
+    'neabsco': 'prince william',
+    'brentsville': 'prince william',
+    'coles magisterial': 'prince william',
+    'gainesville magisterial': 'prince william',
+    'neabsco magisterial': 'prince william',
+    'occoquan magisterial': 'prince william',
+    'potomac magisterial': 'prince william',
+    'woodbridge magisterial': 'prince william',
+    'brentsville magisterial': 'prince william',
+    #Arlington
+    'arlington': 'arlington',
+    # Fairfax County
+    'alexandria': 'fairfax',
+    'falls church': 'fairfax',
+    'fairfax': 'fairfax',
+    'fairfax city': 'fairfax',
+    'annandale': 'fairfax',
+    #'arlington': 'fairfax',
+    'burke': 'fairfax',
+    'centreville': 'fairfax',
+    'chantilly': 'fairfax',
+    'clifton': 'fairfax',
+    'fairfax station': 'fairfax',
+    'great falls': 'fairfax',
+    'lorton': 'fairfax',
+    'mclean': 'fairfax',
+    'merrifield': 'fairfax',
+    'oakton': 'fairfax',
+    'reston': 'fairfax',
+    'springfield': 'fairfax',
+    'tysons': 'fairfax',
+    'tysons corner': 'fairfax',
+    'vienna': 'fairfax',
+    'west springfield': 'fairfax',
+    'woodburn': 'fairfax',
+    
+    # Richmond area
+    'richmond': 'henrico',
+    'henrico': 'henrico',
+    'glen allen': 'henrico',
+    'highland springs': 'henrico',
+    'mechanicsville': 'hanover',
+    'hanover': 'hanover',
+    'ashland': 'hanover',
+    'chesterfield': 'chesterfield',
+    'midlothian': 'chesterfield',
+    'bon air': 'chesterfield',
+    
+    # Norfolk/Virginia Beach area
+    'norfolk': 'norfolk',
+    'virginia beach': 'virginia beach',
+    'chesapeake': 'chesapeake',
+    'portsmouth': 'portsmouth',
+    'suffolk': 'suffolk',
+    'newport news': 'newport news',
+    'hampton': 'hampton',
+    'williamsburg': 'williamsburg',
+    'york': 'york',
+    'yorktown': 'york',
+    'poquoson': 'poquoson',
+    
+    # Roanoke area
+    'roanoke': 'roanoke',
+    'salem': 'roanoke',
+    'cave spring': 'roanoke',
+    'vinton': 'roanoke',
+    'lynchburg': 'lynchburg',
+    'bedford': 'bedford',
+    
+    # Charlottesville area
+    'charlottesville': 'albemarle',
+    'albemarle': 'albemarle',
+    'waynesboro': 'waynesboro',
+    'staunton': 'staunton',
+    'harrisonburg': 'harrisonburg',
+    
+    # Other major cities/counties
+    'winchester': 'winchester',
+    'front royal': 'warren',
+    'warrenton': 'fauquier',
+    'stafford': 'stafford',
+    'fredericksburg': 'fredericksburg',
+    'spotsylvania': 'spotsylvania',
+    'king george': 'king george',
+    'westmoreland': 'westmoreland',
+    'colonial beach': 'westmoreland',
+    'montross': 'westmoreland',
+    'warsaw': 'richmond county',
+    'tappahannock': 'essex',
+    'gloucester': 'gloucester',
+    'mathews': 'mathews',
+    'accomac': 'accomack',
+    'cape charles': 'northampton',
+    'eastville': 'northampton',
+    'franklin': 'southampton',
+    'emporia': 'greensville',
+    'danville': 'danville',
+    'martinsville': 'martinsville',
+    'bristol': 'bristol',
+    'galax': 'galax',
+    'radford': 'radford',
+    'blacksburg': 'montgomery',
+    'christiansburg': 'montgomery',
+    'pulaski': 'pulaski',
+    'floyd': 'floyd',
+    'hillsville': 'carroll',
+    'wytheville': 'wythe',
+    'abingdon': 'washington',
+    'big stone gap': 'wise',
+    'norton': 'norton',
+    'wise': 'wise',
+    'lee': 'lee',
+    'pennington gap': 'lee',
+    'clintwood': 'dickenson',
+    'grundy': 'buchanan',
+    'tazewell': 'tazewell',
+    'richlands': 'tazewell',
+    'lebanon': 'russell',
+    'gate city': 'scott',
+    'weber city': 'scott',
+    
+    # Additional patterns
+    'loudoun county': 'loudoun',
+    'prince william county': 'prince william',
+    'fairfax county': 'fairfax',
+    'pw county': 'prince william',
+    'pwc': 'prince william',
+    'pwcounty': 'prince william'
+}
+
+# Mapping items, longest city first, for the substring scan in match_county
+# so the most specific contained city wins (ties keep mapping order)
+CITY_COUNTY_ITEMS = tuple(sorted(CITY_COUNTY_MAP.items(), key=lambda item: len(item[0]), reverse=True))
+
+# Automaton over all mapping keys, valued by their position in CITY_COUNTY_ITEMS
+if AHOCORASICK_AVAILABLE:
+    CITY_AUTOMATON = ahocorasick.Automaton()
+    for index, (city, _) in enumerate(CITY_COUNTY_ITEMS):
+        CITY_AUTOMATON.add_word(city, index)
+    CITY_AUTOMATON.make_automaton()
+
 
 def get_city_to_county_mapping() -> Dict[str, str]:
     """
     Map Virginia cities/districts to their counties.
     Returns a dictionary mapping city names (lowercase) to county names.
     """
-    return {
-        # Loudoun County
-        'leesburg': 'loudoun',
-        'sterling': 'loudoun',
-        'ashburn': 'loudoun',
-        'herndon': 'loudoun',
-        'purcellville': 'loudoun',
-        'hamilton': 'loudoun',
-        'lovettsville': 'loudoun',
-        'middleburg': 'loudoun',
-        'round hill': 'loudoun',
-        'hillsboro': 'loudoun',
-        'lansdowne': 'loudoun',
-        'brambleton': 'loudoun',
-        'dulles': 'loudoun',
-        'broadlands': 'loudoun',
-        'cascades': 'loudoun',
-        'countryside': 'loudoun',
-        'stone ridge': 'loudoun',
-        'south riding': 'loudoun',
-        'algonkian': 'loudoun',
-        'broad run': 'loudoun',
-        'catoctin': 'loudoun',
-        'dulles south': 'loudoun',
-        'sugarland run': 'loudoun',
-        
-        # Prince William County
-        'manassas': 'prince william',
-        'manassas park': 'prince william',
-        'woodbridge': 'prince william',
-        'dale city': 'prince william',
-        'lake ridge': 'prince william',
-        'dumfries': 'prince william',
-        'haymarket': 'prince william',
-        'occoquan': 'prince william',
-        'quantico': 'prince william',
-        'triangle': 'prince william',
-        'bristow': 'prince william',
-        'gainesville': 'prince william',
-        'nokesville': 'prince william',
-        'independent hill': 'prince william',
-        'linton hall': 'prince william',
-        'montclair': 'prince william',
-        'potomac mills': 'prince william',
-        'princes lakes': 'prince william',
-        'rippon': 'prince william',
-        'sudley': 'prince william',
-        'wellington': 'prince william',
-        'cherry hill': 'prince william',
-        'coles': 'prince william',
-        'neabsco': 'prince william',
-        'brentsville': 'prince william',
-        'coles magisterial': 'prince william',
-        'gainesville magisterial': 'prince william',
-        'neabsco magisterial': 'prince william',
-        'occoquan magisterial': 'prince william',
-        'potomac magisterial': 'prince william',
-        'woodbridge magisterial': 'prince william',
-        'brentsville magisterial': 'prince william',
-        #Arlington
-        'arlington': 'arlington',
-        # Fairfax County
-        'alexandria': 'fairfax',
-        'falls church': 'fairfax',
-        'fairfax': 'fairfax',
-        'fairfax city': 'fairfax',
-        'annandale': 'fairfax',
-        #'arlington': 'fairfax',
-        'burke': 'fairfax',
-        'centreville': 'fairfax',
-        'chantilly': 'fairfax',
-        'clifton': 'fairfax',
-        'fairfax station': 'fairfax',
-        'great falls': 'fairfax',
-        'lorton': 'fairfax',
-        'mclean': 'fairfax',
-        'merrifield': 'fairfax',
-        'oakton': 'fairfax',
-        'reston': 'fairfax',
-        'springfield': 'fairfax',
-        'tysons': 'fairfax',
-        'tysons corner': 'fairfax',
-        'vienna': 'fairfax',
-        'west springfield': 'fairfax',
-        'woodburn': 'fairfax',
-        
-        # Richmond area
-        'richmond': 'henrico',
-        'henrico': 'henrico',
-        'glen allen': 'henrico',
-        'highland springs': 'henrico',
-        'mechanicsville': 'hanover',
-        'hanover': 'hanover',
-        'ashland': 'hanover',
-        'chesterfield': 'chesterfield',
-        'midlothian': 'chesterfield',
-        'bon air': 'chesterfield',
-        
-        # Norfolk/Virginia Beach area
-        'norfolk': 'norfolk',
-        'virginia beach': 'virginia beach',
-        'chesapeake': 'chesapeake',
-        'portsmouth': 'portsmouth',
-        'suffolk': 'suffolk',
-        'newport news': 'newport news',
-        'hampton': 'hampton',
-        'williamsburg': 'williamsburg',
-        'york': 'york',
-        'yorktown': 'york',
-        'poquoson': 'poquoson',
-        
-        # Roanoke area
-        'roanoke': 'roanoke',
-        'salem': 'roanoke',
-        'cave spring': 'roanoke',
-        'vinton': 'roanoke',
-        'lynchburg': 'lynchburg',
-        'bedford': 'bedford',
-        
-        # Charlottesville area
-        'charlottesville': 'albemarle',
-        'albemarle': 'albemarle',
-        'waynesboro': 'waynesboro',
-        'staunton': 'staunton',
-        'harrisonburg': 'harrisonburg',
-        
-        # Other major cities/counties
-        'winchester': 'winchester',
-        'front royal': 'warren',
-        'warrenton': 'fauquier',
-        'stafford': 'stafford',
-        'fredericksburg': 'fredericksburg',
-        'spotsylvania': 'spotsylvania',
-        'king george': 'king george',
-        'westmoreland': 'westmoreland',
-        'colonial beach': 'westmoreland',
-        'montross': 'westmoreland',
-        'warsaw': 'richmond county',
-        'tappahannock': 'essex',
-        'gloucester': 'gloucester',
-        'mathews': 'mathews',
-        'accomac': 'accomack',
-        'cape charles': 'northampton',
-        'eastville': 'northampton',
-        'franklin': 'southampton',
-        'emporia': 'greensville',
-        'danville': 'danville',
-        'martinsville': 'martinsville',
-        'bristol': 'bristol',
-        'galax': 'galax',
-        'radford': 'radford',
-        'blacksburg': 'montgomery',
-        'christiansburg': 'montgomery',
-        'pulaski': 'pulaski',
-        'floyd': 'floyd',
-        'hillsville': 'carroll',
-        'wytheville': 'wythe',
-        'abingdon': 'washington',
-        'big stone gap': 'wise',
-        'norton': 'norton',
-        'wise': 'wise',
-        'lee': 'lee',
-        'pennington gap': 'lee',
-        'clintwood': 'dickenson',
-        'grundy': 'buchanan',
-        'tazewell': 'tazewell',
-        'richlands': 'tazewell',
-        'lebanon': 'russell',
-        'gate city': 'scott',
-        'weber city': 'scott',
-        
-        # Additional patterns
-        'loudoun county': 'loudoun',
-        'prince william county': 'prince william',
-        'fairfax county': 'fairfax',
-        'pw county': 'prince william',
-        'pwc': 'prince william',
-        'pwcounty': 'prince william'
-    }
+    return CITY_COUNTY_MAP
+
+
+@functools.lru_cache(maxsize=16384)
+def match_county(value: str) -> str:
+    """Map a single district or city value to its county, or None if no match found."""
+    value_lower = value.lower().strip()
+    
+    # Direct lookup
+    if value_lower in CITY_COUNTY_MAP:
+        return CITY_COUNTY_MAP[value_lower]
+    
+    if AHOCORASICK_AVAILABLE:
+        # Longest mapped city contained in the value, found with one automaton pass
+        # instead of a scan over every city
+        indices = [index for _, index in CITY_AUTOMATON.iter(value_lower)]
+        return CITY_COUNTY_ITEMS[min(indices)][1] if indices else None
+    
+    # Check if any mapped city is contained in the value, longest first
+    for city, county in CITY_COUNTY_ITEMS:
+        if city in value_lower:
+            return county
+    
+    return None
 
 
 def map_district_to_county(district_normal: str, candidate_city: str = None) -> str:
@@ -213,43 +269,36 @@ def map_district_to_county(district_normal: str, candidate_city: str = None) ->
     Returns:
         str: County name or None if no match found
     """
-    city_county_map = get_city_to_county_mapping()
-    
     # Check district_normal first
     if district_normal:
-        district_lower = str(district_normal).lower().strip()
-        
-        # Direct lookup
-        if district_lower in city_county_map:
-            return city_county_map[district_lower]
-        
-        # Check if any mapped city is contained in the district
-        for city, county in city_county_map.items():
-            if city in district_lower or district_lower in city:
-                return county
+        county = match_county(str(district_normal))
+        if county:
+            return county
     
     # Check candidate_city as fallback
     if candidate_city:
-        city_lower = str(candidate_city).lower().strip()
-        
-        # Direct lookup
-        if city_lower in city_county_map:
-            return city_county_map[city_lower]
-        
-        # Check if any mapped city is contained in the candidate city
-        for city, county in city_county_map.items():
-            if city in city_lower or city_lower in city:
-                return county
+        return match_county(str(candidate_city))
     
     return None
 
 
-def get_bigquery_county_disbursements(project_id: str, 
-                                     dataset_id: str, 
-                                     table_id: str,
-                                     target_counties: List[str] = None) -> List[Dict[str, Any]]:
+def map_counties(district_normal: pd.Series, candidate_city: pd.Series) -> pd.Series:
+    """Vectorized map_district_to_county over district and candidate city columns."""
+    county = district_normal.map(lambda value: match_county(str(value)) if value else None)
+    
+    # Only rows without a district match fall back to the candidate city
+    missing = county.isna()
+    if missing.any():
+        county[missing] = candidate_city[missing].map(lambda value: match_county(str(value)) if value else None)
+    return county
+
+
+def iter_county_disbursement_pages(project_id: str, 
+                                   dataset_id: str, 
+                                   table_id: str,
+                                   target_counties: List[str] = None) -> Iterator[pd.DataFrame]:
     """
-    Analyze county board election disbursements using BigQuery Schedule H data.
+    Stream county board election disbursements from BigQuery Schedule H data, one result page at a time.
     
     Parameters:
         project_id (str): Google Cloud Project ID.
@@ -257,48 +306,27 @@ def get_bigquery_county_disbursements(project_id: str,
         table_id (str): BigQuery table ID.
         target_counties (List[str]): List of target counties to filter by
         
-    Returns:
-        List[Dict]: List of candidate data with total disbursements
+    Yields:
+        pd.DataFrame: Rows of one result page in the target counties, with their mapped county
     """
     
     # Default to Loudoun and Prince William counties
     if target_counties is None:
         target_counties = ["loudoun", "prince william"]
     
+    # Mapping keys for the target counties, used to prefilter rows server-side
+    target_set = frozenset(c.lower() for c in target_counties)
+    target_keys = [city for city, county in CITY_COUNTY_ITEMS if county in target_set]
+    if not target_keys:
+        logger.warning("No mapped cities for the requested counties")
+        return
+    
     # Initialize BigQuery client
     client = bigquery.Client(project=project_id)
     
-    try:
-        # Build the query to get all Schedule H records for county board elections
-        query = f"""
-        WITH ranked_reports AS (
-            SELECT 
-                candidate_name,
-                district_normal,
-                candidate_city,
-                office_sought_normal,
-                election_cycle,
-                total_disbursements,
-                report_date,
-                ROW_NUMBER() OVER (
-                    PARTITION BY candidate_name, district_normal, office_sought_normal, election_cycle 
-                    ORDER BY report_date DESC
-                ) as rn
-            FROM `{project_id}.{dataset_id}.{table_id}`
-            WHERE 1=1
-            AND level = 'local'
-            AND (
-                LOWER(office_sought_normal) LIKE '%county board%'
-                OR LOWER(office_sought_normal) LIKE '%board of supervisors%'
-                OR LOWER(office_sought_normal) LIKE '%supervisor%'
-                OR LOWER(office_sought_normal) LIKE '%chair%county%'
-            )
-            AND (election_cycle IS NULL 
-                OR election_cycle LIKE '%/2018%' 
-                OR election_cycle LIKE '%/2019%' 
-                OR election_cycle LIKE '%/202_%')
-            AND candidate_name IS NOT NULL AND candidate_name != ''
-        )
+    # Build the query to get all Schedule H records for county board elections
+    query = f"""
+    WITH ranked_reports AS (
         SELECT 
             candidate_name,
             district_normal,
@@ -306,54 +334,105 @@ def get_bigquery_county_disbursements(project_id: str,
             office_sought_normal,
             election_cycle,
             total_disbursements,
-            report_date
-        FROM ranked_reports 
-        WHERE rn = 1
-        AND total_disbursements IS NOT NULL
-        AND total_disbursements > 0
-        ORDER BY total_disbursements DESC
-        """
-        
-        # Execute the query
-        logger.info(f"Executing BigQuery query for county board elections...")
-        query_job = client.query(query)
-        df = query_job.to_dataframe()
-        
-        if df.empty:
-            logger.warning("No county board results found")
-            return []
+            report_date,
+            ROW_NUMBER() OVER (
+                PARTITION BY candidate_name, district_normal, office_sought_normal, election_cycle 
+                ORDER BY report_date DESC
+            ) as rn
+        FROM `{project_id}.{dataset_id}.{table_id}`
+        WHERE 1=1
+        AND level = 'local'
+        AND (
+            LOWER(office_sought_normal) LIKE '%county board%'
+            OR LOWER(office_sought_normal) LIKE '%board of supervisors%'
+            OR LOWER(office_sought_normal) LIKE '%supervisor%'
+            OR LOWER(office_sought_normal) LIKE '%chair%county%'
+        )
+        AND (election_cycle IS NULL 
+            OR SAFE_CAST(REGEXP_EXTRACT(election_cycle, r'/([0-9]{{4}})') AS INT64) >= 2018)
+        AND candidate_name IS NOT NULL AND candidate_name != ''
+    )
+    SELECT 
+        candidate_name,
+        district_normal,
+        candidate_city,
+        office_sought_normal,
+        election_cycle,
+        total_disbursements,
+        report_date
+    FROM ranked_reports 
+    WHERE rn = 1
+    AND total_disbursements IS NOT NULL
+    AND total_disbursements > 0
+    AND (
+        REGEXP_CONTAINS(LOWER(district_normal), @target_pattern)
+        OR REGEXP_CONTAINS(LOWER(candidate_city), @target_pattern)
+    )
+    ORDER BY total_disbursements DESC
+    """
+    
+    # Keep only rows where a target city is contained in the district or candidate city.
+    # The longest-match mapping below still decides the county.
+    job_config = bigquery.QueryJobConfig(query_parameters=[
+        bigquery.ScalarQueryParameter("target_pattern", "STRING",
+                                      '|'.join(escape_regex_literal(city) for city in target_keys)),
+    ])
+    
+    # Execute the query
+    logger.info(f"Executing BigQuery query for county board elections...")
+    query_job = client.query(query, job_config=job_config)
+    
+    # Stream result pages, keeping only rows that map to a target county
+    target_names = {county: county.title() for county in target_set}
+    total_results = 0
+    total_matched = 0
+    for batch in query_job.result(page_size=QUERY_PAGE_SIZE).to_dataframe_iterable():
+        total_results += len(batch)
+        county = map_counties(batch['district_normal'], batch['candidate_city'])
         
-        # Convert to list of dictionaries and apply county mapping
-        all_results = df.to_dict('records')
+        # Title-cased county for rows in a target county, missing for all others
+        mapped_county = county.map(target_names)
+        in_target = mapped_county.notna()
+        total_matched += in_target.sum()
         
-        # Filter results by target counties using our mapping function
-        filtered_results = []
-        for result in all_results:
-            county = map_district_to_county(
-                result.get('district_normal'), 
-                result.get('candidate_city')
-            )
-            
-            if county and county.lower() in [c.lower() for c in target_counties]:
-                # Add county information to the result
-                result['mapped_county'] = county.title()
-                filtered_results.append(result)
+        # Add county information to the rows in target counties
+        yield batch[in_target].assign(mapped_county=mapped_county[in_target])
+    
+    if total_results == 0:
+        logger.warning("No county board results found")
+    else:
+        logger.info(f"Found {total_matched} candidates in target counties from {total_results} prefiltered county board candidates")
+
+
+def get_bigquery_county_disbursements(project_id: str, 
+                                     dataset_id: str, 
+                                     table_id: str,
+                                     target_counties: List[str] = None) -> pd.DataFrame:
+    """
+    Analyze county board election disbursements using BigQuery Schedule H data.
+    
+    Parameters:
+        project_id (str): Google Cloud Project ID.
+        dataset_id (str): BigQuery dataset ID.
+        table_id (str): BigQuery table ID.
+        target_counties (List[str]): List of target counties to filter by
         
-        logger.info(f"Found {len(filtered_results)} candidates in target counties from {len(all_results)} total county board candidates")
+    Returns:
+        pd.DataFrame: Candidate rows with total disbursements and mapped county
+    """
+    try:
+        pages = list(iter_county_disbursement_pages(project_id, dataset_id, table_id, target_counties))
         
-        # Sort by total disbursements descending
-        filtered_results.sort(key=lambda x: x['total_disbursements'], reverse=True)
-            
-        return filtered_results
+        # Rows keep the query's ORDER BY total_disbursements DESC
+        return pd.concat(pages, ignore_index=True) if pages else pd.DataFrame()
         
     except Exception as e:
         logger.error(f"Error executing BigQuery query: {e}")
-        return []
-
+        return pd.DataFrame()
 
-def print_county_disbursement_results(results: List[Dict[str, Any]]):
+def print_county_disbursement_results(results: pd.DataFrame):
     """Print the county disbursement results in a formatted way."""
-    if not results:
+    if results.empty:
         print("No results to display")
         return
         
@@ -363,27 +442,32 @@ def print_county_disbursement_results(results: List[Dict[str, Any]]):
     print(f"{'-' * 125}")
     
     total_disbursements = 0
-    county_totals = {}
+    county_totals = defaultdict(int)
+    county_counts = defaultdict(int)
+    lines = []
+    format_row = RESULT_ROW_FORMAT.format
     
-    for result in results:
-        total_disbursements += result['total_disbursements']
-        county = result.get('mapped_county', 'Unknown')
+    for result in results.itertuples(index=False):
+        total_disbursements += result.total_disbursements
+        county = result.mapped_county
         
-        # Track county totals
-        if county not in county_totals:
-            county_totals[county] = 0
-        county_totals[county] += result['total_disbursements']
+        # Track county totals and candidate counts
+        county_totals[county] += result.total_disbursements
+        county_counts[county] += 1
         
-        election_cycle_str = str(result['election_cycle']) if result['election_cycle'] else 'N/A'
-        report_date_str = str(result['report_date']) if result['report_date'] else 'N/A'
+        election_cycle_str = str(result.election_cycle) if result.election_cycle else 'N/A'
+        report_date_str = str(result.report_date) if result.report_date else 'N/A'
         
-        print(f"{result['candidate_name']:<30} "
-              f"{county:<15} "
-              f"{str(result.get('district_normal', '')):<20} "
-              f"{result['office_sought_normal']:<20} "
-              f"{election_cycle_str:<15} "
-              f"${result['total_disbursements']:>13,.2f} "
-              f"{report_date_str}")
+        lines.append(format_row(result.candidate_name,
+                                county,
+                                str(result.district_normal),
+                                result.office_sought_normal,
+                                election_cycle_str,
+                                result.total_disbursements,
+                                report_date_str))
+    
+    # Write all rows in one call instead of one print per row
+    sys.stdout.write('\n'.join(lines) + '\n')
               
     print(f"{'-' * 125}")
     print(f"{'Total:':<102} ${total_disbursements:>13,.2f}")
@@ -393,9 +477,10 @@ def print_county_disbursement_results(results: List[Dict[str, Any]]):
     print(f"\nCounty Breakdown:")
     print(f"{'County':<15} {'Total Disbursements':<20} {'Candidates'}")
     print(f"{'-' * 50}")
-    for county, total in sorted(county_totals.items()):
-        candidate_count = len([r for r in results if r.get('mapped_county') == county])
-        print(f"{county:<15} ${total:>18,.2f} {candidate_count:>9}")
+    format_county = COUNTY_ROW_FORMAT.format
+    county_lines = [format_county(county, total, county_counts[county])
+                    for county, total in sorted(county_totals.items())]
+    sys.stdout.write('\n'.join(county_lines) + '\n')
 
 
 def main():
@@ -415,24 +500,30 @@ def main():
     args = parser.parse_args()
     
     try:
-        results = get_bigquery_county_disbursements(
-            project_id=args.project_id,
-            dataset_id=args.dataset,
-            table_id=args.table,
-            target_counties=args.counties
-        )
-
-        # Convert the results list back to a DataFrame for export
-        df = pd.DataFrame(results)
-
         # Check if an output path was provided
         if args.output_csv:
-            df.to_csv(args.output_csv, index=False)
+            pages = iter_county_disbursement_pages(
+                project_id=args.project_id,
+                dataset_id=args.dataset,
+                table_id=args.table,
+                target_counties=args.counties
+            )
+            
+            # Write each result page as it arrives instead of collecting them first
+            with open(args.output_csv, 'w', newline='') as f:
+                for page_number, page in enumerate(pages):
+                    page.to_csv(f, header=page_number == 0, index=False)
             logger.info(f"Successfully exported results to {args.output_csv}")
         
         # Only print if there is no output path
         else:
-            print_county_disbursement_results(results)
+            df = get_bigquery_county_disbursements(
+                project_id=args.project_id,
+                dataset_id=args.dataset,
+                table_id=args.table,
+                target_counties=args.counties
+            )
+            print_county_disbursement_results(df)
 
     except Exception as e:
         logger.error(f"Analysis failed: {e}")
@@ -38,6 +38,7 @@ class OptimizedContributionMatcher:
     def __init__(self):
         # Lookup tables
         self.committee_mappings = {}  # committee_name_normalized -> {committee_code, candidate_name_normalized}
+        self.committees_by_candidate = {}  # candidate_name_normalized -> [committee dicts], in committee_mappings order
 
         # Cache for committee name cleaning
         self.cleaned_names_cache = {}
@@ -65,6 +66,17 @@ class OptimizedContributionMatcher:
                     'candidate_name_normalized': candidate_name
                 }
 
+        # Index committees by candidate once instead of scanning every mapping per lookup
+        self.committees_by_candidate = {}
+        for norm_name, info in self.committee_mappings.items():
+            candidate_name = info['candidate_name_normalized']
+            if candidate_name == candidate_name:  # NaN never matches a candidate
+                self.committees_by_candidate.setdefault(candidate_name, []).append({
+                    'committee_code': info['committee_code'],
+                    'committee_name_normalized': norm_name,
+                    'candidate_name_normalized': candidate_name
+                })
+
         logger.info(f"Loaded {len(self.committee_mappings)} committee mappings")
 
     
@@ -153,14 +165,7 @@ class OptimizedContributionMatcher:
 
                 if candidate_name != 'NOT A CC':
                     # For candidate committees: Find all committee codes for this candidate
-                    all_candidate_committees = []
-                    for norm_name, info in self.committee_mappings.items():
-                        if info.get('candidate_name_normalized') == candidate_name:
-                            all_candidate_committees.append({
-                                'committee_code': info['committee_code'],
-                                'committee_name_normalized': norm_name,
-                                'candidate_name_normalized': info['candidate_name_normalized']
-                            })
+                    all_candidate_committees = self.committees_by_candidate.get(candidate_name, [])
 
                     if len(all_candidate_committees) > 1:
                         # Select committee code with year closest to filing year
@@ -508,6 +513,11 @@ def get_unmatched_contributions_optimized(project_id: str,
         # Load lookup tables for exact matching
         matcher.load_lookup_tables(client, project_id, dataset_id)
 
+        # Partition Schedule A receipts by recipient committee once, so each lookup is a dict hit
+        # rather than a comparison against every receipt
+        schedule_a_by_committee = dict(tuple(schedule_a_df.groupby('recipient_committee_code', sort=False)))
+        no_schedule_a = schedule_a_df.iloc[:0]
+
         # Process in batches for better memory management
         unmatched_contributions = []
         total_batches = len(schedule_d_df) // batch_size + (1 if len(schedule_d_df) % batch_size else 0)
@@ -528,10 +538,13 @@ def get_unmatched_contributions_optimized(project_id: str,
             
             logger.info(f"Processing batch {batch_idx + 1}/{total_batches}")
             
-            # Step 1: Find matching committees for batch using lookup tables
+            # Step 1: Find matching committees for batch using lookup tables,
+            # collecting recipient names and filing years in a single pass over the rows
+            batch_records = batch_df.to_dict('records')
             recipient_names = []
+            filing_years = []
 
-            for _, row in batch_df.iterrows():
+            for row in batch_records:
                 normalized_name = row.get('recipient_name_normalized', '')
                 if pd.notna(normalized_name) and normalized_name.strip():
                     recipient_names.append(normalized_name.strip())
@@ -541,30 +554,28 @@ def get_unmatched_contributions_optimized(project_id: str,
                     logger.warning(f"Using fallback for recipient without normalized name: '{original_name}'")
                     recipient_names.append(original_name)
 
-            filing_years = [
-                row['report_year'] if pd.notna(row['report_year'])
-                else pd.to_datetime(row['transaction_date']).year if pd.notna(row['transaction_date'])
-                else 2020
-                for _, row in batch_df.iterrows()
-            ]
+                filing_years.append(
+                    row['report_year'] if pd.notna(row['report_year'])
+                    else pd.to_datetime(row['transaction_date']).year if pd.notna(row['transaction_date'])
+                    else 2020
+                )
+
             matched_committees = matcher.find_matching_committee_batch(recipient_names, filing_years)
 
             # Step 2: Prepare data for Schedule A matching
             batch_data = []
             valid_indices = []
             
-            for idx, (_, d_row) in enumerate(batch_df.iterrows()):
+            for idx, d_row_dict in enumerate(batch_records):
                 matched_committee = matched_committees[idx]
                 if not matched_committee:
                     continue
                 
                 # Get relevant Schedule A subset for this committee
                 committee_code = matched_committee['committee_code']
-                schedule_a_subset = schedule_a_df[
-                    schedule_a_df['recipient_committee_code'] == committee_code
-                ]
+                schedule_a_subset = schedule_a_by_committee.get(committee_code, no_schedule_a)
 
-                batch_data.append((d_row.to_dict(), matched_committee, schedule_a_subset))
+                batch_data.append((d_row_dict, matched_committee, schedule_a_subset))
                 valid_indices.append(idx)
 
             # Step 3: Find matching Schedule A receipts
@@ -585,22 +596,13 @@ def get_unmatched_contributions_optimized(project_id: str,
                     # Only check alternates for actual candidates (not PACs or other non-candidate committees)
                     if candidate_name and candidate_name.strip() and candidate_name != 'NOT A CC':
                         # Find all committee codes for this candidate using committee_mappings
-                        all_candidate_committees = []
-                        for norm_name, info in matcher.committee_mappings.items():
-                            if info.get('candidate_name_normalized') == candidate_name:
-                                all_candidate_committees.append({
-                                    'committee_code': info['committee_code'],
-                                    'committee_name_normalized': norm_name,
-                                    'candidate_name_normalized': info['candidate_name_normalized']
-                                })
+                        all_candidate_committees = matcher.committees_by_candidate.get(candidate_name, [])
 
                         # Try each alternate committee code
                         for alt_committee in all_candidate_committees:
                             alt_code = alt_committee['committee_code']
                             if alt_code != original_committee_code:  # Don't retry the same code
-                                alt_schedule_a = schedule_a_df[
-                                    schedule_a_df['recipient_committee_code'] == alt_code
-                                ]
+                                alt_schedule_a = schedule_a_by_committee.get(alt_code, no_schedule_a)
 
                                 if not alt_schedule_a.empty:
                                     # Try matching with this alternate committee
@@ -703,11 +705,11 @@ def print_unmatched_summary_optimized(results: List[Dict[str, Any]]):
     
     # Top donors by count and amount
     print(f"\n🏢 Top 10 Donors by Total Unmatched Amount:")
-    donor_stats = df.groupby('donor_committee_name_normalized').agg({
-        'amount': ['sum', 'count'],
-        'matched_candidate_name': 'nunique'
-    }).round(2)
-    donor_stats.columns = ['total_amount', 'count', 'unique_recipients']
+    donor_stats = df.groupby('donor_committee_name_normalized', sort=False).agg(
+        total_amount=('amount', 'sum'),
+        count=('amount', 'count'),
+        unique_recipients=('matched_candidate_name', 'nunique')
+    ).round(2)
     donor_stats = donor_stats.sort_values('total_amount', ascending=False).head(10)
     
     for donor_name, row in donor_stats.iterrows():
@@ -715,11 +717,11 @@ def print_unmatched_summary_optimized(results: List[Dict[str, Any]]):
     
     # Top recipients by amount
     print(f"\n🎯 Top 10 Recipients by Total Unmatched Amount:")
-    recipient_stats = df.groupby(['matched_candidate_name', 'matched_committee_name_normalized']).agg({
-        'amount': ['sum', 'count'],
-        'donor_committee_name_normalized': 'nunique'
-    }).round(2)
-    recipient_stats.columns = ['total_amount', 'count', 'unique_donors']
+    recipient_stats = df.groupby(['matched_candidate_name', 'matched_committee_name_normalized'], sort=False).agg(
+        total_amount=('amount', 'sum'),
+        count=('amount', 'count'),
+        unique_donors=('donor_committee_name_normalized', 'nunique')
+    ).round(2)
     recipient_stats = recipient_stats.sort_values('total_amount', ascending=False).head(10)
     
     for (candidate, committee), row in recipient_stats.iterrows():
@@ -9,18 +9,100 @@ import os
 import pandas as pd
 import argparse
 import re
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from google.cloud import bigquery
 import logging
 
 # Add the functions directory to the path
 sys.path.append(os.path.join(os.path.dirname(__file__), 'functions'))
 
-from name_normalization import normalize_name
+from name_normalization import normalize_name_series
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# A digit immediately followed by a letter (48hour), for inserting a space between them
+DIGIT_LETTER_PATTERN = re.compile(r'(\d)([A-Za-z])')
+
+# Rows per BigQuery load job when uploading results
+UPLOAD_CHUNK_ROWS = 500000
+
+# Below this many normalized names the variation lookup is built in-process
+PARALLEL_MIN_NAMES = 50000
+
+def create_match_variations(name):
+    """Create variations for matching: no spaces, number-letter spaces, singular/plural"""
+    variations = set()
+
+    # Original
+    variations.add(name)
+
+    # No spaces
+    variations.add(name.replace(' ', ''))
+
+    # Add spaces between numbers and letters (48hour -> 48 hour)
+    spaced_version = DIGIT_LETTER_PATTERN.sub(r'\1 \2', name)
+    variations.add(spaced_version)
+    variations.add(spaced_version.replace(' ', ''))
+
+    # Singular/plural variations
+    if name.endswith('S') and len(name) > 1:
+        singular = name[:-1]
+        variations.add(singular)
+        variations.add(singular.replace(' ', ''))
+        # Also add spaced version of singular
+        singular_spaced = DIGIT_LETTER_PATTERN.sub(r'\1 \2', singular)
+        variations.add(singular_spaced)
+    else:
+        plural = name + 'S'
+        variations.add(plural)
+        variations.add(plural.replace(' ', ''))
+        # Also add spaced version of plural
+        plural_spaced = DIGIT_LETTER_PATTERN.sub(r'\1 \2', plural)
+        variations.add(plural_spaced)
+
+    return variations
+
+def match_preference(name):
+    """Sort key for picking the best normalized name: spaced first, then singular, then shortest"""
+    return (' ' not in name, name.endswith('S'), len(name), name)
+
+def build_variation_lookup(names):
+    """Map each match variation of the given names to its best normalized name"""
+    variation_candidates = defaultdict(list)
+    for norm_name in names:
+        for variation in create_match_variations(norm_name):
+            variation_candidates[variation].append(norm_name)
+
+    return {
+        variation: min(candidates, key=match_preference)
+        for variation, candidates in variation_candidates.items()
+    }
+
+def build_variation_lookup_parallel(names):
+    """Build the variation lookup over name shards in worker processes and merge the results"""
+    names = list(names)
+    workers = os.cpu_count() or 1
+    if workers == 1 or len(names) < PARALLEL_MIN_NAMES:
+        return build_variation_lookup(names)
+
+    shard_size = -(-len(names) // workers)
+    shards = [names[i:i + shard_size] for i in range(0, len(names), shard_size)]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        shard_lookups = list(executor.map(build_variation_lookup, shards))
+
+    # match_preference is a total order, so merging shard winners gives the same best name
+    variation_to_best = shard_lookups[0]
+    for lookup in shard_lookups[1:]:
+        for variation, best in lookup.items():
+            current = variation_to_best.get(variation)
+            if current is None or match_preference(best) < match_preference(current):
+                variation_to_best[variation] = best
+
+    return variation_to_best
+
 def test_normalization_on_table(project_id: str, dataset: str = 'virginia_elections',
                                source_table: str = 'name_variations',
                                output_table: str = 'name_variations_test',
@@ -29,18 +111,20 @@ def test_normalization_on_table(project_id: str, dataset: str = 'virginia_electi
 
     client = bigquery.Client(project=project_id)
 
-    # Query the existing name_variations table
+    # Query the existing name_variations table (one normalized name per variation,
+    # so a hash aggregation on name_variation replaces a two-column DISTINCT)
     limit_clause = f"LIMIT {limit}" if limit else ""
     query = f"""
-    SELECT DISTINCT
+    SELECT
         name_variation,
-        normalized_name as current_normalized
+        ANY_VALUE(normalized_name) as current_normalized
     FROM `{project_id}.{dataset}.{source_table}`
+    GROUP BY name_variation
     {limit_clause}
     """
 
     logger.info(f"Querying from {project_id}.{dataset}.{source_table}...")
-    df = client.query(query).to_dataframe()
+    df = client.query(query).to_dataframe(create_bqstorage_client=True)
 
     if df.empty:
         logger.error("No data found in name_variations table")
@@ -48,80 +132,20 @@ def test_normalization_on_table(project_id: str, dataset: str = 'virginia_electi
 
     logger.info(f"Testing normalization on {len(df)} name variations...")
 
-    # Apply new normalization with space and singular/plural matching
-    results = []
+    # Test new normalization once per distinct variation (assume non-individual for entity names)
+    df['base_normalized'] = normalize_name_series(df['name_variation'], is_individual=False)
 
     # First pass: collect all normalized names (both current and new)
-    all_normalized_names = set()
-    for _, row in df.iterrows():
-        current_norm = row['current_normalized']
-        new_norm = normalize_name(row['name_variation'], is_individual=False)
-        all_normalized_names.add(current_norm)
-        all_normalized_names.add(new_norm)
-
-    def create_match_variations(name):
-        """Create variations for matching: no spaces, number-letter spaces, singular/plural"""
-        variations = set()
-
-        # Original
-        variations.add(name)
-
-        # No spaces
-        variations.add(name.replace(' ', ''))
-
-        # Add spaces between numbers and letters (48hour -> 48 hour)
-        spaced_version = re.sub(r'(\d)([A-Za-z])', r'\1 \2', name)
-        variations.add(spaced_version)
-        variations.add(spaced_version.replace(' ', ''))
-
-        # Singular/plural variations
-        if name.endswith('S') and len(name) > 1:
-            singular = name[:-1]
-            variations.add(singular)
-            variations.add(singular.replace(' ', ''))
-            # Also add spaced version of singular
-            singular_spaced = re.sub(r'(\d)([A-Za-z])', r'\1 \2', singular)
-            variations.add(singular_spaced)
-        else:
-            plural = name + 'S'
-            variations.add(plural)
-            variations.add(plural.replace(' ', ''))
-            # Also add spaced version of plural
-            plural_spaced = re.sub(r'(\d)([A-Za-z])', r'\1 \2', plural)
-            variations.add(plural_spaced)
-
-        return variations
+    all_normalized_names = set(df['current_normalized']).union(df['base_normalized'])
 
     # Create lookup: variation -> best normalized name (prefer spaced, prefer singular)
-    variation_to_best = {}
-    for norm_name in all_normalized_names:
-        variations = create_match_variations(norm_name)
-        for variation in variations:
-            if variation not in variation_to_best:
-                variation_to_best[variation] = norm_name
-            else:
-                # Choose the better option: prefer spaces, prefer singular
-                current_best = variation_to_best[variation]
-
-                # Prefer spaced over non-spaced
-                if ' ' in norm_name and ' ' not in current_best:
-                    variation_to_best[variation] = norm_name
-                elif ' ' not in norm_name and ' ' in current_best:
-                    continue  # Keep current best
-                # If both have same spacing, prefer singular over plural
-                elif (not norm_name.endswith('S') and current_best.endswith('S')):
-                    variation_to_best[variation] = norm_name
-                elif (norm_name.endswith('S') and not current_best.endswith('S')):
-                    continue  # Keep current best
-
-    # Second pass: process each variation
-    for _, row in df.iterrows():
-        original_variation = row['name_variation']
-        current_normalized = row['current_normalized']
-
-        # Test new normalization (assume non-individual for entity names)
-        base_normalized = normalize_name(original_variation, is_individual=False)
+    variation_to_best = build_variation_lookup_parallel(all_normalized_names)
 
+    # Second pass: process each variation, zipping the column arrays instead of boxing rows
+    current_values = df['current_normalized'].to_numpy()
+    new_values = []
+    changed_values = []
+    for current_normalized, base_normalized in zip(current_values, df['base_normalized'].to_numpy()):
         # Check for better match using variations
         variations = create_match_variations(base_normalized)
         new_normalized = base_normalized
@@ -136,16 +160,15 @@ def test_normalization_on_table(project_id: str, dataset: str = 'virginia_electi
                 elif ' ' not in base_normalized and ' ' in candidate:
                     new_normalized = candidate
 
-        changed = new_normalized != current_normalized
-
-        results.append({
-            'name_variation': original_variation,
-            'current_normalized': current_normalized,
-            'new_normalized': new_normalized,
-            'changed': changed
-        })
+        new_values.append(new_normalized)
+        changed_values.append(new_normalized != current_normalized)
 
-    results_df = pd.DataFrame(results)
+    results_df = pd.DataFrame({
+        'name_variation': df['name_variation'].to_numpy(),
+        'current_normalized': current_values,
+        'new_normalized': new_values,
+        'changed': changed_values
+    })
 
     # Log summary
     changes = results_df['changed'].sum()
@@ -155,22 +178,28 @@ def test_normalization_on_table(project_id: str, dataset: str = 'virginia_electi
     output_table_id = f"{project_id}.{dataset}.{output_table}"
     logger.info(f"Uploading results to {output_table_id}...")
 
-    job_config = bigquery.LoadJobConfig(
-        write_disposition=bigquery.WriteDisposition.WRITE_TRUNCATE,
-        schema=[
-            bigquery.SchemaField("name_variation", "STRING", mode="REQUIRED"),
-            bigquery.SchemaField("current_normalized", "STRING", mode="REQUIRED"),
-            bigquery.SchemaField("new_normalized", "STRING", mode="REQUIRED"),
-            bigquery.SchemaField("changed", "BOOLEAN", mode="REQUIRED"),
-        ]
-    )
-
-    job = client.load_table_from_dataframe(
-        results_df,
-        output_table_id,
-        job_config=job_config
-    )
-    job.result()  # Wait for completion
+    schema = [
+        bigquery.SchemaField("name_variation", "STRING", mode="REQUIRED"),
+        bigquery.SchemaField("current_normalized", "STRING", mode="REQUIRED"),
+        bigquery.SchemaField("new_normalized", "STRING", mode="REQUIRED"),
+        bigquery.SchemaField("changed", "BOOLEAN", mode="REQUIRED"),
+    ]
+
+    # Load in row chunks so only one chunk is serialized at a time;
+    # the first chunk replaces the table and the rest append to it
+    for start in range(0, len(results_df), UPLOAD_CHUNK_ROWS):
+        job_config = bigquery.LoadJobConfig(
+            write_disposition=(bigquery.WriteDisposition.WRITE_TRUNCATE if start == 0
+                               else bigquery.WriteDisposition.WRITE_APPEND),
+            schema=schema
+        )
+
+        job = client.load_table_from_dataframe(
+            results_df.iloc[start:start + UPLOAD_CHUNK_ROWS],
+            output_table_id,
+            job_config=job_config
+        )
+        job.result()  # Wait for completion
 
     logger.info(f"Successfully uploaded {len(results_df)} rows to {output_table_id}")
 
@@ -181,8 +210,9 @@ def test_normalization_on_table(project_id: str, dataset: str = 'virginia_electi
         print("=" * 120)
         print(f"{'Original Variation':40} | {'Current Normalized':30} | {'New Normalized':30}")
         print("=" * 120)
-        for _, row in changed_rows.iterrows():
-            print(f"{row['name_variation'][:39]:40} | {row['current_normalized'][:29]:30} | {row['new_normalized'][:29]:30}")
+        for name_variation, current_normalized, new_normalized in changed_rows[
+                ['name_variation', 'current_normalized', 'new_normalized']].itertuples(index=False, name=None):
+            print(f"{name_variation[:39]:40} | {current_normalized[:29]:30} | {new_normalized[:29]:30}")
 
     print(f"\n✅ Results uploaded to: {output_table_id}")
     print(f"📊 Total rows: {len(results_df)}")